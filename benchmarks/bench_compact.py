@@ -0,0 +1,77 @@
+"""
+Memory per player (and per clan) of models and compact records.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_compact
+"""
+
+from typing import Any, Callable
+import gc
+import json
+import tracemalloc
+
+from cocapi.compact import Catalog
+from cocapi.types import Clan, Player
+
+from . import payloads
+
+PLAYERS = 2_000
+CLANS = 200
+
+
+def measure_memory(build: Callable[[], Any]) -> tuple[Any, int]:
+    """Memory retained by the result of ``build``"""
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def report(title: str, bodies: list[bytes], model: Any, compact: Callable):
+    count = len(bodies)
+    # every object is decoded from its own response body, like in real life
+    cases = {
+        "raw dicts": lambda: [json.loads(body) for body in bodies],
+        "models (validate)": lambda: [model(**json.loads(body)) for body in bodies],
+        "models (construct)": lambda: [
+            model.construct_trusted(json.loads(body)) for body in bodies
+        ],
+        "compact records": lambda: compact(bodies),
+    }
+
+    print(f"{title}, per object, compared to validated models")
+    sizes = {}
+    for name, build in cases.items():
+        result, sizes[name] = measure_memory(build)
+        del result
+
+    baseline = sizes["models (validate)"]
+    for name, size in sizes.items():
+        print(f"  {name:<20} {size / count:10,.0f} bytes  x{baseline / size:.1f}")
+
+
+def compact_all(method_name: str):
+    def compact(bodies: list[bytes]):
+        catalog = Catalog()
+        method = getattr(catalog, method_name)
+        # catalog is kept alive, so shared metadata is measured too
+        return catalog, [method(json.loads(body)) for body in bodies]
+
+    return compact
+
+
+def main():
+    players = [json.dumps(payloads.player(index)).encode() for index in range(PLAYERS)]
+    report(f"{PLAYERS:,} players", players, Player, compact_all("player"))
+
+    clans = [json.dumps(payloads.clan(10)).encode() for _ in range(CLANS)]
+    report(f"{CLANS:,} clans (10 war log entries)", clans, Clan, compact_all("clan"))
+
+
+if __name__ == "__main__":
+    main()
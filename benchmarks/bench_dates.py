@@ -0,0 +1,71 @@
+"""
+Parsing speed of API timestamps: ``strptime`` vs the shared parser.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_dates
+"""
+
+from datetime import datetime, timezone
+import time
+
+from cocapi import utils
+from cocapi.types import ClanWarResult
+from cocapi.utils import dates
+
+from . import payloads
+
+ENTRIES = 200
+
+
+def strptime(value: str) -> datetime:
+    return datetime.strptime(value, utils.DATETIME_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def measure(func, argument, seconds: float = 1.0):
+    count = 0
+    started_at = time.perf_counter()
+    while (elapsed := time.perf_counter() - started_at) < seconds:
+        func(argument)
+        count += 1
+    return elapsed / count
+
+
+def main():
+    warlog = payloads.warlog(ENTRIES)["items"]
+    end_times = [entry["endTime"] for entry in warlog]
+
+    print(f"war log end times ({ENTRIES} entries)")
+    cases = {
+        "strptime": lambda values: [strptime(value) for value in values],
+        "fixed-width slices": lambda values: [
+            dates._parse_fixed(value)  # pylint: disable=protected-access
+            for value in values
+        ],
+        "parse_datetime": lambda values: [
+            utils.parse_datetime(value) for value in values
+        ],
+        "parse_datetimes": utils.parse_datetimes,
+    }
+    baseline = None
+    for name, func in cases.items():
+        elapsed = measure(func, end_times)
+        baseline = baseline or elapsed
+        print(
+            f"  {name:<20} {elapsed / ENTRIES * 1e6:6.2f} us/timestamp"
+            f"  x{baseline / elapsed:.1f}"
+        )
+
+    print(f"war log decoding ({ENTRIES} entries)")
+    for mode, decode in {
+        "validate": lambda items: [ClanWarResult(**item) for item in items],
+        "construct": lambda items: [
+            ClanWarResult.construct_trusted(item) for item in items
+        ],
+    }.items():
+        elapsed = measure(decode, warlog)
+        print(f"  {mode:<20} {elapsed * 1000:6.2f} ms/war log")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Throughput of ``Client.player`` and ``Client.clan`` per decode mode,
+including response preprocessing (responses are served from memory).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_decode
+"""
+
+from typing import Any, Awaitable, Callable
+import asyncio
+import time
+import typing
+
+from cocapi import Client, utils
+from cocapi.client import api
+from cocapi.types import aliases
+
+from . import payloads
+
+MODES = typing.get_args(aliases.DecodeMode)
+PLAYER_TAG = payloads.tag(0)
+CLAN_TAG = "#LQGPL8LL"
+WAR_FIELDS = (
+    "warWins",
+    "warLosses",
+    "warTies",
+    "warWinStreak",
+    "warFrequency",
+    "warLeague",
+    "isWarLogPublic",
+)
+
+
+class OfflineClient(Client):
+    """Client that serves prepared responses instead of sending requests"""
+
+    responses: dict[str, Any]
+
+    def __init__(self, responses: dict[api.Request, Any]):
+        super().__init__("token", coalesce=False)
+        self.responses = {request.url: data for request, data in responses.items()}
+
+    async def request(self, api_method: api.Request, **kwargs: Any):
+        data = self.responses[api_method.url]
+        return api.Response(200, api_method.url, {}, data, 0)
+
+
+def api_responses() -> dict[api.Request, Any]:
+    """Payloads shaped like API responses, before ``Client`` preprocessing"""
+
+    player = payloads.player()
+    player["clan"] = {"tag": player["clan"], "name": "clan", "clanLevel": 20}
+
+    clan = payloads.clan(50)
+    war = clan.pop("war")
+    clan.update({key: war[key] for key in WAR_FIELDS})
+    clan["memberList"] = [
+        {"tag": tag, "name": f"player{index}", "role": "member", "trophies": 5000}
+        for index, tag in enumerate(clan["memberList"])
+    ]
+
+    clantag = utils.shape_tag(CLAN_TAG)
+    return {
+        api.Methods.PLAYER(playertag=utils.shape_tag(PLAYER_TAG)): player,
+        api.Methods.CLAN(clantag=clantag): clan,
+        api.Methods.CLAN_CURRENT_WAR(clantag=clantag): war["warCurrentwar"],
+        api.Methods.CLAN_WARLOG(clantag=clantag): {"items": war["warLog"]},
+    }
+
+
+async def measure(call: Callable[[], Awaitable[Any]], seconds: float = 1.0):
+    count = 0
+    started_at = time.perf_counter()
+    while (elapsed := time.perf_counter() - started_at) < seconds:
+        await call()
+        count += 1
+    return count / elapsed
+
+
+async def run():
+    client = OfflineClient(api_responses())
+    cases = {
+        "Player": (client.player, PLAYER_TAG),
+        "Clan (50 war log entries)": (client.clan, CLAN_TAG),
+    }  # type: dict[str, tuple[Callable[..., Awaitable[Any]], str]]
+
+    for name, (method, tag) in cases.items():
+        print(name)
+        baseline = None
+        for mode in MODES:
+            rate = await measure(lambda: method(tag, decode=mode))
+            baseline = baseline or rate
+            print(f"  {mode:<10} {rate:12,.0f} objects/s  x{rate / baseline:.1f}")
+
+
+def main():
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
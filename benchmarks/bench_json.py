@@ -0,0 +1,50 @@
+"""
+JSON decoding throughput of response bodies per decoder.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_json
+"""
+
+import json
+import time
+
+from cocapi import api
+
+from . import payloads
+
+DECODERS = ("json", "orjson")
+
+
+def measure(decoder: api.JsonDecoder, body: bytes, seconds: float = 1.0):
+    count = 0
+    started_at = time.perf_counter()
+    while (elapsed := time.perf_counter() - started_at) < seconds:
+        decoder(body)
+        count += 1
+    return count * len(body) / elapsed / 2**20, count / elapsed
+
+
+def main():
+    cases = {
+        "player rankings (200 entries)": payloads.rankings(200),
+        "clan rankings (200 entries)": payloads.rankings(200, clans=True),
+        "war log (200 entries)": payloads.warlog(200),
+        "current war (50 vs 50)": payloads.current_war(),
+    }
+
+    for name, payload in cases.items():
+        body = json.dumps(payload).encode()
+        print(f"{name}, {len(body) / 1024:.0f} KiB")
+        for decoder_name in DECODERS:
+            try:
+                decoder = api.get_json_decoder(decoder_name)  # type: ignore
+            except ImportError:
+                print(f"  {decoder_name:<8} not installed")
+                continue
+            throughput, rate = measure(decoder, body)
+            print(f"  {decoder_name:<8} {throughput:8.1f} MiB/s {rate:10,.0f} bodies/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Memory and diff time of columnar ranking snapshots for a full crawl
+(200 entries x 250 locations) compared with keeping raw items.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_rankings
+"""
+
+import random
+import time
+import tracemalloc
+
+from cocapi.rankings import RankingSnapshot, snapshot
+
+from . import payloads
+
+LOCATIONS = 250
+ENTRIES = 200
+
+
+def crawl():
+    pages = []
+    for location_id in range(LOCATIONS):
+        items = payloads.rankings(ENTRIES)["items"]
+        for item in items:
+            # the same players appear in neighbouring locations
+            item["tag"] = payloads.tag(random.randrange(ENTRIES * LOCATIONS // 2))
+        pages.append((location_id, items))
+    return pages
+
+
+def measure_memory(func):
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    print("numpy" if snapshot.numpy is not None else "array (numpy is not installed)")
+
+    pages, raw_size = measure_memory(crawl)
+    snapshots, snapshot_size = measure_memory(
+        lambda: [
+            RankingSnapshot.from_items("players", location_id, items)
+            for location_id, items in pages
+        ]
+    )
+    print(f"raw items  {raw_size / 2**20:8.1f} MiB")
+    print(f"snapshots  {snapshot_size / 2**20:8.1f} MiB")
+
+    random.shuffle(pages)
+    newer = [
+        RankingSnapshot.from_items("players", location_id, items)
+        for location_id, items in pages
+    ]
+    by_location = {old.location_id: old for old in snapshots}
+
+    started_at = time.perf_counter()
+    for new in newer:
+        new.diff(by_location[new.location_id])
+    elapsed = time.perf_counter() - started_at
+    print(f"diff of {LOCATIONS} locations {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Roster queries over player models vs ``RosterMatrix``.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_roster
+"""
+
+import time
+
+from cocapi.roster import RosterMatrix, matrix as roster_matrix
+from cocapi.types import Player
+
+from . import payloads
+
+PLAYERS = 20_000
+
+
+def measure(func, *args):
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started_at
+
+
+def loop_heroes_within_max(players: list[Player], levels: int):
+    return [
+        player.tag
+        for player in players
+        if all(
+            hero.level > 0 and hero.max_level - hero.level <= levels
+            for hero in player.heroes
+            if hero.village == "home"
+        )
+    ]
+
+
+def loop_rush_scores(players: list[Player]):
+    scores = []
+    for player in players:
+        total = gap = 0
+        for troop in [*player.troops, *player.heroes, *player.spells]:
+            total += troop.max_level
+            gap += troop.max_level - troop.level
+        scores.append(gap / total if total else 0.0)
+    return scores
+
+
+def main():
+    backend = (
+        "numpy" if roster_matrix.numpy is not None else "array (numpy is not installed)"
+    )
+    print(f"{PLAYERS:,} players, {backend}")
+
+    players = [
+        Player.construct_trusted(payloads.player(index)) for index in range(PLAYERS)
+    ]
+    matrix, elapsed = measure(RosterMatrix.from_players, players)
+    print(f"  build matrix           {elapsed * 1000:8.1f} ms")
+
+    heroes = matrix.columns(kind="heroes", village="home")
+    cases = {
+        "heroes within 2 of max": (
+            lambda: loop_heroes_within_max(players, 2),
+            lambda: matrix.select(matrix.within_max(2, heroes)),
+        ),
+        "rush score": (
+            lambda: loop_rush_scores(players),
+            matrix.rush_score,
+        ),
+        "upgrade gap of heroes": (
+            lambda: [
+                sum(hero.max_level - hero.level for hero in player.heroes)
+                for player in players
+            ],
+            lambda: matrix.gap(heroes),
+        ),
+    }
+    for name, (loop, query) in cases.items():
+        expected, loop_time = measure(loop)
+        result, query_time = measure(query)
+        assert list(result) == list(expected)
+        print(
+            f"  {name:<22} loop {loop_time * 1000:8.1f} ms"
+            f"  matrix {query_time * 1000:8.1f} ms  x{loop_time / query_time:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
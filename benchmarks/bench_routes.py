@@ -0,0 +1,46 @@
+"""
+URL building cost per request.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_routes
+"""
+
+import timeit
+
+from cocapi import api
+
+NUMBER = 1_000_000
+
+
+def report(name: str, seconds: float):
+    print(f"{name:<40} {seconds / NUMBER * 1e9:8.1f} ns/request")
+
+
+def main():
+    clan_template = api.Methods.CLAN.url
+    clan_path = api.Methods.CLAN.path
+    clan_method = api.Methods.CLAN.method
+
+    cases = {
+        "str.format (url only)": lambda: clan_template.format(clantag="%232P8QU22L2"),
+        # what calling a route replaces: the same request built with str.format
+        "str.format (reference)": lambda: api.Request(
+            clan_method, clan_template.format(clantag="%232P8QU22L2"), clan_path
+        ),
+        "static route (GOLDPASS)": lambda: api.Methods.GOLDPASS(),
+        "1 field route (CLAN)": lambda: api.Methods.CLAN(clantag="%232P8QU22L2"),
+        "1 field route (CLAN_RANKINGS)": lambda: api.Methods.CLAN_RANKINGS(
+            location_id=32000193
+        ),
+        "2 fields route (LEAGUE_SEASONS_RANKINGS)": lambda: api.Methods.LEAGUE_SEASONS_RANKINGS(
+            league_id=29000022, season_id="2022-04"
+        ),
+    }
+
+    for name, case in cases.items():
+        report(name, min(timeit.repeat(case, number=NUMBER, repeat=3)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Memory and lookup speed of tag sets keyed by strings and by encoded integers.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tags
+"""
+
+import random
+import time
+import tracemalloc
+
+from cocapi import utils
+
+from . import payloads
+
+COUNT = 1_000_000
+
+
+def measure_memory(func):
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def measure_lookups(tag_set, keys):
+    started_at = time.perf_counter()
+    found = sum(1 for key in keys if key in tag_set)
+    return found, time.perf_counter() - started_at
+
+
+def main():
+    # tags arrive as fresh strings from decoded responses
+    indexes = random.sample(range(10**10), COUNT)
+
+    str_set, str_size = measure_memory(
+        lambda: {payloads.tag(index, 0) for index in indexes}
+    )
+    int_set, int_size = measure_memory(
+        lambda: {utils.encode_tag(tag) for tag in str_set}
+    )
+    print(f"{COUNT:,} tags")
+    print(f"  set[str] {str_size / 2**20:8.1f} MiB")
+    print(f"  set[int] {int_size / 2**20:8.1f} MiB  x{str_size / int_size:.1f} smaller")
+
+    str_keys = [payloads.tag(index, 0) for index in indexes[:100_000]]
+    int_keys = [utils.encode_tag(tag) for tag in str_keys]
+    _, str_time = measure_lookups(str_set, str_keys)
+    _, int_time = measure_lookups(int_set, int_keys)
+    print(f"  100k lookups: str {str_time * 1000:.1f} ms, int {int_time * 1000:.1f} ms")
+
+    started_at = time.perf_counter()
+    for tag in str_keys:
+        utils.encode_tag(tag)
+    elapsed = time.perf_counter() - started_at
+    print(f"  encode_tag {elapsed / len(str_keys) * 1e6:.2f} us/tag")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Synthetic payloads shaped like real API responses (after ``Client`` preprocessing)
+"""
+
+from typing import Any
+from datetime import datetime, timedelta, timezone
+import random
+
+from cocapi import utils
+
+TIMESTAMP = "20220416T080000.000Z"
+PLAYERS = 10**9
+OPPONENTS = 2 * 10**9
+RANKINGS = 3 * 10**9
+
+TROOPS = [
+    "Barbarian", "Archer", "Goblin", "Giant", "Wall Breaker", "Balloon", "Wizard",
+    "Healer", "Dragon", "P.E.K.K.A", "Minion", "Hog Rider", "Valkyrie", "Golem",
+    "Witch", "Lava Hound", "Bowler", "Baby Dragon", "Miner", "Super Barbarian",
+    "Super Archer", "Super Wall Breaker", "Super Giant", "Raged Barbarian",
+    "Sneaky Archer", "Beta Minion", "Boxer Giant", "Bomber", "Super P.E.K.K.A",
+    "Cannon Cart", "Drop Ship", "Night Witch", "Wall Wrecker", "Battle Blimp",
+    "Yeti", "Sneaky Goblin", "Rocket Balloon", "Ice Golem", "Electro Dragon",
+    "Stone Slammer", "Inferno Dragon", "Super Valkyrie", "Dragon Rider",
+    "Super Witch", "Hog Glider", "Siege Barracks", "Ice Hound", "Headhunter",
+]  # fmt: skip
+HEROES = ["Barbarian King", "Archer Queen", "Grand Warden", "Battle Machine", "Royal Champion"]  # fmt: skip
+SPELLS = [
+    "Lightning Spell", "Healing Spell", "Rage Spell", "Jump Spell", "Freeze Spell",
+    "Clone Spell", "Poison Spell", "Earthquake Spell", "Haste Spell", "Skeleton Spell",
+    "Bat Spell", "Invisibility Spell",
+]  # fmt: skip
+
+
+def tag(index: int, offset: int = PLAYERS) -> str:
+    """Valid tag, different for every ``index`` and ``offset``"""
+    return utils.decode_tag(offset + index)
+
+
+def timestamp(index: int) -> str:
+    """API timestamp of ``index``-th war, wars end every two days"""
+    moment = datetime(2022, 4, 16, 8, tzinfo=timezone.utc) - timedelta(days=2 * index)
+    return moment.strftime("%Y%m%dT%H%M%S.000Z")
+
+
+def troop(name: str, village: str = "home") -> dict[str, Any]:
+    max_level = random.randint(5, 12)
+    return {
+        "name": name,
+        "level": random.randint(1, max_level),
+        "maxLevel": max_level,
+        "village": village,
+    }
+
+
+def achievement(index: int) -> dict[str, Any]:
+    return {
+        "name": f"Achievement {index % 40}",
+        "stars": random.randint(0, 3),
+        "value": random.randint(0, 100_000),
+        "target": 100_000,
+        "info": f"Do something {index % 40} times",
+        "completionInfo": "Total: 100000" if index % 2 else None,
+        "village": "home" if index < 55 else "builderBase",
+    }
+
+
+def player(index: int = 0) -> dict[str, Any]:
+    return {
+        "tag": tag(index),
+        "name": f"player{index}",
+        "townHallLevel": 14,
+        "townHallWeaponLevel": 3,
+        "builderHallLevel": 9,
+        "expLevel": 200,
+        "trophies": random.randint(1000, 6000),
+        "bestTrophies": 6000,
+        "warStars": 1500,
+        "attackWins": 100,
+        "defenseWins": 10,
+        "versusTrophies": 4000,
+        "bestVersusTrophies": 5000,
+        "versusBattleWins": 1000,
+        "donations": 1000,
+        "donationsReceived": 1000,
+        "role": "member",
+        "warPreference": "in",
+        "clan": "#LQGPL8LL",
+        "league": {
+            "id": 29000022,
+            "name": "Legend League",
+            "iconUrls": {"small": "https://...", "tiny": "https://...", "medium": "https://..."},
+        },
+        "troops": [troop(name, "builderBase" if i > 30 else "home") for i, name in enumerate(TROOPS)],
+        "heroes": [troop(name) for name in HEROES],
+        "spells": [troop(name) for name in SPELLS],
+        "achievements": [achievement(i) for i in range(70)],
+    }  # fmt: skip
+
+
+def war_clan(members: int = 0) -> dict[str, Any]:
+    data = {
+        "tag": "#LQGPL8LL",
+        "name": "clan",
+        "stars": 100,
+        "clanLevel": 20,
+        "attacks": 90,
+        "destructionPercentage": 97.5,
+        "badgeUrls": {
+            "small": "https://...",
+            "medium": "https://...",
+            "large": "https://...",
+        },
+    }  # type: dict[str, Any]
+    if members:
+        data["members"] = [
+            {
+                "tag": tag(i),
+                "name": f"player{i}",
+                "mapPosition": i + 1,
+                "townhallLevel": 14,
+                "opponentAttacks": 1,
+                "attacks": [
+                    {
+                        "attackerTag": tag(i),
+                        "defenderTag": tag(i, OPPONENTS),
+                        "stars": 3,
+                        "destructionPercentage": 100,
+                        "order": i * 2 + attack,
+                        "duration": 150,
+                    }
+                    for attack in range(2)
+                ],
+                "bestOpponentAttack": {
+                    "attackerTag": tag(i, OPPONENTS),
+                    "defenderTag": tag(i),
+                    "stars": 2,
+                    "destructionPercentage": 80,
+                    "order": i,
+                    "duration": 170,
+                },
+            }
+            for i in range(members)
+        ]
+    return data
+
+
+def war_result(index: int = 0) -> dict[str, Any]:
+    return {
+        "result": random.choice(["win", "lose", "tie"]),
+        "endTime": timestamp(index),
+        "teamSize": 50,
+        "attacksPerMember": 2,
+        "clan": war_clan(),
+        "opponent": war_clan(),
+    }
+
+
+def current_war() -> dict[str, Any]:
+    return {
+        "state": "inWar",
+        "teamSize": 50,
+        "attacksPerMember": 2,
+        "preparationStartTime": TIMESTAMP,
+        "startTime": TIMESTAMP,
+        "endTime": TIMESTAMP,
+        "clan": war_clan(50),
+        "opponent": war_clan(50),
+    }
+
+
+def warlog(entries: int = 200) -> dict[str, Any]:
+    return {
+        "items": [war_result(index) for index in range(entries)],
+        "paging": {"cursors": {}},
+    }
+
+
+def clan(warlog_entries: int = 50) -> dict[str, Any]:
+    war_league = {"id": 48000015, "name": "Master League I"}
+    return {
+        "tag": "#LQGPL8LL",
+        "name": "clan",
+        "type": "inviteOnly",
+        "description": "description " * 10,
+        "badgeUrls": {"small": "https://...", "medium": "https://...", "large": "https://..."},
+        "requiredTrophies": 4000,
+        "requiredVersusTrophies": 3000,
+        "requiredTownhallLevel": 12,
+        "labels": [
+            {"id": 56000000 + i, "name": f"Label {i}", "iconUrls": {"small": "https://...", "medium": "https://..."}}
+            for i in range(3)
+        ],
+        "clanLevel": 20,
+        "clanPoints": 50000,
+        "clanVersusPoints": 40000,
+        "memberList": [tag(i) for i in range(50)],
+        "location": {"id": 32000193, "name": "Russia", "isCountry": True, "countryCode": "RU"},
+        "chatLanguage": {"id": 75000000, "name": "English", "languageCode": "EN"},
+        "war": {
+            "warWins": 500,
+            "warLosses": 100,
+            "warTies": 10,
+            "warWinStreak": 5,
+            "warFrequency": "always",
+            "warLeague": war_league,
+            "isWarLogPublic": True,
+            "warState": "inWar",
+            "warCurrentwar": current_war(),
+            "warLog": warlog(warlog_entries)["items"],
+        },
+    }  # fmt: skip
+
+
+def rankings(entries: int = 200, clans: bool = False) -> dict[str, Any]:
+    items = []
+    for i in range(entries):
+        item = {
+            "tag": tag(i, RANKINGS),
+            "name": f"entry{i}",
+            "rank": i + 1,
+            "previousRank": i + 2,
+            "location": {
+                "id": 32000193,
+                "name": "Russia",
+                "isCountry": True,
+                "countryCode": "RU",
+            },
+        }  # type: dict[str, Any]
+        if clans:
+            item.update(clanLevel=20, members=50, clanPoints=60000 - i * 10)
+        else:
+            item.update(
+                expLevel=250,
+                trophies=6000 - i * 5,
+                attackWins=100,
+                defenseWins=5,
+                clan={
+                    "tag": "#LQGPL8LL",
+                    "name": "clan",
+                    "badgeUrls": {"small": "https://..."},
+                },
+                league={
+                    "id": 29000022,
+                    "name": "Legend League",
+                    "iconUrls": {"small": "https://..."},
+                },
+            )
+        items.append(item)
+    return {"items": items, "paging": {"cursors": {}}}  # fmt: skip
@@ -1,5 +1,20 @@
-from .client import api, Client
+from .client import (
+    api,
+    Client,
+    CircuitBreaker,
+    ConnectionConfig,
+    KeyPool,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+)
+from . import compact
+from . import discovery
+from . import rankings
+from . import roster
 from . import types
+from . import watcher
+from .watcher import Watcher
 from . import utils
 from .types import aliases
 from .types import exceptions
@@ -8,10 +23,22 @@ __all__ = [
     "api",
     "client",
     "types",
+    "compact",
+    "discovery",
+    "rankings",
+    "roster",
     "aliases",
     "utils",
     "exceptions",
     "Client",
+    "CircuitBreaker",
+    "ConnectionConfig",
+    "KeyPool",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "Watcher",
+    "watcher",
     "__version__",
     "__api_version__",
 ]
@@ -1,5 +1,24 @@
 from . import api
 from .client import Client
 from .baseclient import BaseClient
+from .breaker import CircuitBreaker
+from .cache import ResponseCache, CacheStats
+from .connection import ConnectionConfig
+from .keys import ApiKey, KeyPool
+from .ratelimit import RateLimiter, RateLimiterStats
+from .retry import RetryPolicy
 
-__all__ = ("Client", "BaseClient", "api")
+__all__ = (
+    "Client",
+    "BaseClient",
+    "CircuitBreaker",
+    "ResponseCache",
+    "CacheStats",
+    "ConnectionConfig",
+    "ApiKey",
+    "KeyPool",
+    "RateLimiter",
+    "RateLimiterStats",
+    "RetryPolicy",
+    "api",
+)
@@ -1,5 +1,7 @@
-from typing import Any, Optional
+from typing import Any, Callable, ClassVar, Literal, Mapping, NamedTuple, Optional
 from dataclasses import dataclass, field
+import json
+import string
 
 import aiohttp
 
@@ -7,16 +9,69 @@ from ..types import aliases
 from ..types import exceptions
 
 
-@dataclass
+JsonDecoder = Callable[[bytes], Any]
+JsonDecoderName = Literal["json", "orjson", "auto"]
+
+
+class Response(NamedTuple):
+    """
+    Successful response with already decoded body.
+    Body is decoded only once, so ``data`` must not be mutated,
+    the same response may be shared between callers
+    """
+
+    status: int
+    url: aliases.Url
+    headers: Mapping[str, str]
+    data: Any
+    size: int
+    """Body size in bytes"""
+
+
+class Request(NamedTuple):
+    """
+    Lightweight descriptor of a single request, built by ``BaseMethod``
+    """
+
+    method: aliases.RequestMethod
+    url: aliases.Url
+    path: aliases.RelativeUrl
+    """Path template of the route, e.g. ``/clans/{clantag}``"""
+
+
+_new_tuple = tuple.__new__
+
+
+@dataclass(frozen=True)
 class BaseMethod:
+    """
+    Immutable API route.
+
+    URL template is compiled once on definition into literal segments and field names,
+    calling the route only concatenates them into a new ``Request``
+    and never changes the route itself,
+    so routes can be safely shared between concurrent requests.
+    """
+
     # config
-    base_url: aliases.Url | None = field(init=False, default=None)
-    default_http_method: aliases.RequestMethod | None = field(init=False, default=None)
+    base_url: ClassVar[aliases.Url | None] = None
+    default_http_method: ClassVar[aliases.RequestMethod | None] = None
 
     # actual dataclass members
     path: aliases.RelativeUrl
     method: Optional[aliases.RequestMethod] = None
     url: aliases.Url = field(init=False)
+    """URL template"""
+    fields: tuple[str, ...] = field(init=False)
+    """Names of URL template fields"""
+
+    _head: str = field(init=False, repr=False, compare=False)
+    """Literal segment before the first field"""
+    _segments: tuple[tuple[str, str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    """Every field name with the literal segment following it"""
+    _request: Optional[Request] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.base_url:
@@ -29,18 +84,44 @@ class BaseMethod:
                 f"You must define either static field 'default_http_method' or pass it directly in {self.__class__}"
             ) from None
 
-        self.method = self.default_http_method if self.method is None else self.method
-        self.url = self.base_url + self.path
-
-    def __call__(self, **kwargs: Any):
+        method = self.default_http_method if self.method is None else self.method
+        url = self.base_url + self.path
+        parsed = list(string.Formatter().parse(url))
+        head = parsed[0][0] if parsed else ""
+        segments = tuple(
+            (field_name, next_literal)
+            for (_, field_name, _, _), (next_literal, _, _, _) in zip(
+                parsed, parsed[1:] + [("", None, None, None)]
+            )
+            if field_name is not None
+        )
+        fields = tuple(field_name for field_name, _ in segments)
+
+        # dataclass is frozen
+        object.__setattr__(self, "method", method)
+        object.__setattr__(self, "url", url)
+        object.__setattr__(self, "fields", fields)
+        object.__setattr__(self, "_head", head)
+        object.__setattr__(self, "_segments", segments)
+        object.__setattr__(
+            self, "_request", None if fields else Request(method, url, self.path)
+        )
+
+    def __call__(self, **kwargs: Any) -> Request:
+        if self._request is not None:
+            return self._request
+
+        url = self._head
         try:
-            self.url = self.url.format(**kwargs)
-            return self
+            for field_name, literal in self._segments:
+                url = f"{url}{kwargs[field_name]}{literal}"
         except KeyError as error:
             (missing_field,) = error.args
             raise KeyError(
                 f"Missing field: '{missing_field}' when formatting {self.url}"
             ) from error
+        # skips ``Request.__new__`` wrapper, it is a plain tuple anyway
+        return _new_tuple(Request, (self.method, url, self.path))
 
 
 class Methods:
@@ -128,14 +209,23 @@ class ServiceMethods:
     """`POST`: `/apikey/revoke`"""
 
 
-async def check_result(response: aiohttp.ClientResponse):
+async def check_result(
+    response: aiohttp.ClientResponse, decoder: JsonDecoder = json.loads
+) -> Response:
     """
-    Validate request for success.
+    Validate request for success and decode its body.
 
     Parameters
     ----------
     response : aiohttp.ClientResponse
         Actual response
+    decoder : JsonDecoder
+        Function to decode JSON body, ``json.loads`` by default
+
+    Returns
+    -------
+    Response
+        Response with decoded body.
 
     Raises
     ------
@@ -153,52 +243,70 @@ async def check_result(response: aiohttp.ClientResponse):
     - ``503`` Service is temprorarily unavailable because of maintenance.
     """
 
-    # because json decoding must be executed in request context manager
-    json = await response.json()
+    # because body must be read in request context manager
+    body = await response.read()
 
     if not response.ok:
+        try:
+            error_json = decoder(body)
+        except ValueError:  # e.g. html page from proxy
+            error_json = None
+        if not isinstance(error_json, dict):
+            error_json = {}
+
+        response_data = {
+            "error": error_json.get("error"),
+            "description": error_json.get("description"),
+            "reason": error_json.get("reason"),
+            "message": error_json.get("message"),
+        }
+
         match response.status:
             case 400:
-                raise exceptions.IncorrectParameters(response)
+                raise exceptions.IncorrectParameters(response, data=response_data)
             case 403:
-                raise exceptions.AccessDenied(response)
+                raise exceptions.AccessDenied(response, data=response_data)
             case 404:
-                raise exceptions.ResourceNotFound(response)
+                raise exceptions.ResourceNotFound(response, data=response_data)
             case 429:
-                raise exceptions.TooManyRequests(response)
+                raise exceptions.TooManyRequests(response, data=response_data)
             case 503:
-                raise exceptions.ServiceUnavailable(response)
+                raise exceptions.ServiceUnavailable(response, data=response_data)
             case _:  # 500 also
-                response_data = {
-                    "error": json.get("error"),
-                    "description": json.get("description"),
-                    "reason": json.get("reason"),
-                    "message": json.get("message"),
-                }
-
                 raise exceptions.UnknownError(response, data=response_data)
-    return response
+
+    return Response(
+        status=response.status,
+        url=str(response.url),
+        headers=response.headers,
+        data=decoder(body),
+        size=len(body),
+    )
 
 
 async def make_request(
     session: aiohttp.ClientSession,
-    api_method: BaseMethod,
+    api_method: Request,
+    *,
+    decoder: JsonDecoder = json.loads,
     **kwargs: Any,
-) -> aiohttp.ClientResponse:
+) -> Response:
     """
     Parameters
     ----------
     session : ``aiohttp.ClientSession``
         Client session to be used for requests
-    api_method : ``BaseMethod``
-        Request API method
+    api_method : ``Request``
+        Request built by API method
+    decoder : ``JsonDecoder``
+        Function to decode JSON body, ``json.loads`` by default
     **kwargs:
         This keyword arguments are compatible with :meth:``aiohttp.ClientSession.request``
 
     Returns
     -------
-    aiohttp.ClientResponse
-        Response object.
+    Response
+        Response with decoded body.
     """
 
     params = kwargs.pop("params", None)
@@ -209,8 +317,37 @@ async def make_request(
         kwargs["params"] = filtered_params
 
     async with session.request(
-        method=api_method.method,  # type: ignore
+        method=api_method.method,
         url=api_method.url,
         **kwargs,
     ) as response:
-        return await check_result(response)
+        return await check_result(response, decoder)
+
+
+def get_json_decoder(name: JsonDecoderName = "auto") -> JsonDecoder:
+    """
+    Get JSON decoder by name.
+
+    Parameters
+    ----------
+    name : str
+        - ``json`` standard library decoder
+        - ``orjson`` faster decoder, requires ``orjson`` package
+        - ``auto`` ``orjson`` if installed, otherwise ``json``
+
+    Returns
+    -------
+    JsonDecoder
+        Function that decodes ``bytes``
+    """
+
+    if name == "json":
+        return json.loads
+
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        if name == "orjson":
+            raise
+        return json.loads
+    return orjson.loads  # pylint: disable=no-member
@@ -1,26 +1,120 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
 import asyncio
 
 import aiohttp
 
 from . import api
+from .breaker import CircuitBreaker
+from .cache import CacheKey, ResponseCache, get_max_age, make_key
+from .coalesce import SingleFlight
+from .connection import ConnectionConfig
+from .keys import KeyPool
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from ..types import exceptions
 
 
 class BaseClient:
-    _token: str
+    _keys: KeyPool
+    _rate_limiter: RateLimiter | None
+    _retry_policy: RetryPolicy | None
+    _circuit_breaker: CircuitBreaker | None
+    _cache: ResponseCache | None
+    _coalesce: bool
+    _single_flight: SingleFlight
+    _json_decoder: api.JsonDecoder
+    _connection: ConnectionConfig
+    _connector: aiohttp.BaseConnector | None
     _session: aiohttp.ClientSession | None
     _session_headers: Dict[Any, Any]
 
-    def __init__(self, token: str):
-        self._token = token
+    def __init__(
+        self,
+        token: str | Iterable[str] | KeyPool,
+        *,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        json_decoder: api.JsonDecoder | api.JsonDecoderName = "json",
+        connection: Optional[ConnectionConfig] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+    ):
+        """
+        Parameters
+        ----------
+        token : str | Iterable[str] | KeyPool
+            API token, several tokens or configured ``KeyPool``.
+            Requests are spread between all tokens
+        rate_limiter : RateLimiter
+            Client-side limit of requests per second, not limited by default
+        retry_policy : RetryPolicy
+            Policy to retry throttled and failed requests, requests are not retried by default
+        circuit_breaker : CircuitBreaker
+            Stop sending requests during maintenance, disabled by default
+        cache : ResponseCache
+            Cache of ``GET`` responses honoring ``Cache-Control``, disabled by default
+        coalesce : bool
+            Send only one of concurrent identical ``GET`` requests and share its response
+        json_decoder : JsonDecoder | str
+            Function to decode response bodies or its name (``json``, ``orjson``, ``auto``),
+            standard ``json`` by default
+        connection : ConnectionConfig
+            Connection pool configuration
+        connector : aiohttp.BaseConnector
+            Shared connector (e.g. ``ConnectionConfig.make_connector()``),
+            it is not closed with the client session.
+            If passed, pool settings of ``connection`` are ignored
+        """
+
+        self._keys = token if isinstance(token, KeyPool) else KeyPool(token)
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._cache = cache
+        self._coalesce = coalesce
+        self._single_flight = SingleFlight()
+        self._json_decoder = (
+            api.get_json_decoder(json_decoder)
+            if isinstance(json_decoder, str)
+            else json_decoder
+        )
+        self._connection = connection or ConnectionConfig()
+        self._connector = connector
         self._session = None
         self._session_headers = {
             "accept": "application/json",
-            "authorization": f"Bearer {token}",
         }
 
+    @property
+    def keys(self):
+        return self._keys
+
+    @property
+    def rate_limiter(self):
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self):
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self):
+        return self._circuit_breaker
+
+    @property
+    def cache(self):
+        return self._cache
+
     async def get_new_sesion(self):
-        return aiohttp.ClientSession(headers=self._session_headers)
+        timeout = self._connection.make_timeout()
+        return aiohttp.ClientSession(
+            headers=self._session_headers,
+            connector=self._connector or self._connection.make_connector(),
+            connector_owner=self._connector is None,
+            **({"timeout": timeout} if timeout else {}),
+        )
 
     async def get_session(self):
         if self._session is None:
@@ -33,5 +127,96 @@ class BaseClient:
             await self._session.close()
             await asyncio.sleep(0)
 
-    async def request(self, api_method: api.BaseMethod, **kwargs: Any):
-        return await api.make_request(await self.get_session(), api_method, **kwargs)
+    async def warmup(self, connections: int = 10):
+        """
+        Open ``connections`` connections (including TLS handshakes) ahead of a burst of requests.
+        Warmup requests are not authorized, so they do not spend API token budget.
+
+        Parameters
+        ----------
+        connections : int
+            Number of connections to open, limited by connection pool size
+        """
+
+        session = await self.get_session()
+        base_url = api.Methods.Method.base_url
+
+        async def touch():
+            try:
+                async with session.get(base_url) as response:  # type: ignore
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+        await asyncio.gather(*(touch() for _ in range(connections)))
+
+    async def request(self, api_method: api.Request, **kwargs: Any):
+        if api_method.method != "GET" or (self._cache is None and not self._coalesce):
+            return await self._request_with_retries(api_method, **kwargs)
+
+        key = make_key(api_method, kwargs.get("params"))
+        if self._cache is not None:
+            response = self._cache.get(key)
+            if response is not None:
+                return response
+
+        if not self._coalesce:
+            return await self._fetch(key, api_method, **kwargs)
+        return await self._single_flight.do(
+            key, lambda: self._fetch(key, api_method, **kwargs)
+        )
+
+    async def _fetch(self, key: CacheKey, api_method: api.Request, **kwargs: Any):
+        response = await self._request_with_retries(api_method, **kwargs)
+        if self._cache is not None:
+            self._cache.set(key, response, get_max_age(response))
+        return response
+
+    async def _request_with_retries(self, api_method: api.Request, **kwargs: Any):
+        attempt = 0
+        while True:
+            try:
+                return await self._request_once(api_method, **kwargs)
+            except exceptions.ClientRequestError as error:
+                if self._retry_policy is None:
+                    raise
+
+                delay = self._retry_policy.get_delay(api_method, error, attempt)
+                if delay is None:
+                    raise
+
+                self._retry_policy.record(api_method)
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _request_once(self, api_method: api.Request, **kwargs: Any):
+        if self._circuit_breaker is None:
+            return await self._send(api_method, **kwargs)
+
+        probe = await self._circuit_breaker.acquire()
+        try:
+            response = await self._send(api_method, **kwargs)
+        except BaseException as error:
+            self._circuit_breaker.release(probe, error)
+            raise
+        self._circuit_breaker.release(probe)
+        return response
+
+    async def _send(self, api_method: api.Request, **kwargs: Any):
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+        key = await self._keys.acquire()
+        headers = {**kwargs.pop("headers", {}), **key.headers}
+
+        try:
+            return await api.make_request(
+                await self.get_session(),
+                api_method,
+                decoder=self._json_decoder,
+                headers=headers,
+                **kwargs,
+            )
+        except exceptions.ClientRequestError as error:
+            self._keys.report(key, error)
+            raise
@@ -0,0 +1,141 @@
+from typing import Literal, Optional
+import asyncio
+import time
+
+import aiohttp
+
+from ..types import exceptions
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """
+    Client-wide circuit breaker.
+
+    Circuit opens after ``failure_threshold`` consecutive failures
+    (``ServiceUnavailable``, connection errors or timeouts), for example during maintenance.
+    While it is open, requests either fail fast with ``CircuitOpenError`` or wait (``wait=True``).
+    After ``recovery_timeout`` seconds a single probe request is let through:
+    its success closes the circuit, its failure opens it again.
+
+    Parameters
+    ----------
+    failure_threshold : int
+        Number of consecutive failures to open the circuit
+    recovery_timeout : float
+        Seconds to wait before the probe request
+    wait : bool
+        Park callers until the circuit is closed instead of raising ``CircuitOpenError``
+    """
+
+    FAILURES = (
+        exceptions.ServiceUnavailable,
+        aiohttp.ClientConnectionError,
+        asyncio.TimeoutError,
+    )
+
+    failure_threshold: int
+    recovery_timeout: float
+    wait: bool
+
+    _state: CircuitState
+    _failures: int
+    _opened_at: float
+    _changed: asyncio.Event | None
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        *,
+        wait: bool = False,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("'failure_threshold' must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.wait = wait
+
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._changed = None
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def _notify(self):
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    async def _wait_for_change(self, timeout: Optional[float] = None):
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def acquire(self) -> bool:
+        """
+        Wait for permission to send a request.
+
+        Returns
+        -------
+        bool
+            ``True`` if the caller sends the probe request
+
+        Raises
+        ------
+        ``CircuitOpenError``
+            If circuit is open and ``wait`` is disabled
+        """
+
+        while True:
+            if self._state == "closed":
+                return False
+
+            if self._state == "open":
+                retry_in = self._opened_at + self.recovery_timeout - time.monotonic()
+                if retry_in <= 0:
+                    self._state = "half_open"
+                    return True
+            else:  # half open, probe is in flight
+                retry_in = None
+
+            if not self.wait:
+                raise exceptions.CircuitOpenError(retry_in)
+            await self._wait_for_change(retry_in)
+
+    def release(self, probe: bool, error: Optional[BaseException] = None):
+        """Record the outcome of the request permitted by ``acquire``"""
+
+        if isinstance(error, asyncio.CancelledError):
+            if probe:
+                # nobody knows the outcome, let another caller probe
+                self._state = "open"
+                self._opened_at = time.monotonic() - self.recovery_timeout
+                self._notify()
+            return
+
+        # outcomes of requests sent before the circuit opened are stale,
+        # only the probe decides whether it is closed again
+        if not probe and self._state != "closed":
+            return
+
+        if isinstance(error, self.FAILURES):
+            self._failures += 1
+            if probe or self._failures >= self.failure_threshold:
+                self._state = "open"
+                self._opened_at = time.monotonic()
+                self._notify()
+            return
+
+        self._failures = 0
+        if probe:
+            self._state = "closed"
+            self._notify()
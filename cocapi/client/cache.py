@@ -0,0 +1,135 @@
+from typing import Any, Hashable, Mapping, Optional
+from dataclasses import dataclass
+import collections
+import re
+import time
+
+from . import api
+
+CacheKey = Hashable
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class CacheEntry:
+    response: api.Response
+    expires_at: float
+    size: int
+
+
+class ResponseCache:
+    """
+    LRU cache of ``GET`` responses.
+
+    Every response is stored for ``max-age`` seconds from its ``Cache-Control`` header,
+    responses without ``max-age`` (or with ``no-store``/``no-cache``) are not stored.
+    The least recently used responses are evicted when ``max_entries`` or ``max_bytes`` is exceeded.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of stored responses
+    max_bytes : int
+        Maximum total size of stored response bodies, not limited by default
+    """
+
+    max_entries: int
+    max_bytes: int | None
+    stats: CacheStats
+
+    _entries: collections.OrderedDict[CacheKey, CacheEntry]
+    _size: int
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None):
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+        self._entries = collections.OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """Total size of stored response bodies in bytes"""
+        return self._size
+
+    def get(self, key: CacheKey) -> api.Response | None:
+        entry = self._entries.get(key)
+
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.response
+
+    def set(self, key: CacheKey, response: api.Response, ttl: float):
+        size = response.size
+        if ttl <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = CacheEntry(response, time.monotonic() + ttl, size)
+        self._size += size
+
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._size > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.stats.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: CacheKey):
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+
+def make_key(
+    api_method: api.Request, params: Optional[Mapping[str, Any]] = None
+) -> CacheKey:
+    """Key of ``GET`` request, unset (``None``) params are ignored"""
+
+    filtered_params = tuple(
+        sorted(
+            (key, str(value))
+            for key, value in (params or {}).items()
+            if value is not None
+        )
+    )
+    return api_method.method, api_method.url, filtered_params
+
+
+def get_max_age(response: api.Response) -> float:
+    """Get freshness lifetime (seconds) from ``Cache-Control`` header"""
+
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0.0
+
+    match = MAX_AGE_PATTERN.search(cache_control)
+    return float(match.group(1)) if match else 0.0
@@ -1,5 +1,17 @@
 import asyncio
-from typing import Optional
+import functools
+import math
+import typing
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    Optional,
+)
 
 from . import api
 from .. import utils
@@ -8,14 +20,31 @@ from ..types import (
     exceptions,
     Clan,
     ClanLabel,
+    ClanMember,
     ClanWarLeague,
+    ClanWarLeagueGroup,
+    ClanWarLeagueWar,
     GoldPass,
     Location,
     Player,
     PlayerLabel,
     PlayerLeague,
 )
+from ..types.base import DefaultBaseModel
+from ..rankings import Leaderboard, RankingKind, RankingSnapshot
 from .baseclient import BaseClient
+from .cache import ResponseCache
+from .keys import KeyPool
+
+CLAN_SECTIONS = typing.get_args(aliases.ClanSection)
+NO_WAR_TAG = "#0"
+"""War tag of league round that is not scheduled yet"""
+RANKING_METHODS: dict[RankingKind, api.BaseMethod] = {
+    "clans": api.Methods.CLAN_RANKINGS,
+    "players": api.Methods.PLAYER_RANKINGS,
+    "clans-versus": api.Methods.CLAN_VERSUS_RANKINGS,
+    "players-versus": api.Methods.PLAYER_VERSUS_RANKINGS,
+}
 
 
 class Client(BaseClient):
@@ -29,11 +58,63 @@ class Client(BaseClient):
     _clan_leagues: dict[str, ClanWarLeague]
     _player_labels: dict[str, PlayerLabel]
     _player_leagues: dict[str, PlayerLeague]
+    _decode_mode: aliases.DecodeMode
+    _league_war_cache: ResponseCache
+
+    def __init__(
+        self,
+        token: str | Iterable[str] | KeyPool,
+        *,
+        decode: aliases.DecodeMode = "validate",
+        league_war_cache: Optional[ResponseCache] = None,
+        **kwargs: Any,
+    ):
+        """
+        Parameters
+        ----------
+        token : str | Iterable[str] | KeyPool
+            API token, several tokens or configured ``KeyPool``
+        decode : str
+            How responses are turned into models, see ``DecodeMode``.
+            Can be overridden for every single call
+        league_war_cache : ResponseCache
+            Cache of ended clan war league wars, they never expire,
+            but least recently used ones are evicted, 1024 wars by default
+        **kwargs:
+            Other ``BaseClient`` parameters
+        """
+
+        super().__init__(token, **kwargs)
+        self._decode_mode = decode
+        self._league_war_cache = league_war_cache or ResponseCache(max_entries=1024)
+
+    def _decode(
+        self,
+        model: type[DefaultBaseModel],
+        data: dict[str, Any],
+        decode: Optional[aliases.DecodeMode] = None,
+    ) -> Any:
+        match decode or self._decode_mode:
+            case "raw":
+                return data
+            case "construct":
+                return model.construct_trusted(data)
+            case _:
+                return model(**data)
+
+    async def _request_if(self, condition: bool, api_method: api.Request):
+        return await self.request(api_method) if condition else None
+
+    async def _get_catalog(self, name: str, loader: Callable[[], Awaitable[Any]]):
+        # concurrent callers share the same loader call
+        if not hasattr(self, name):
+            setattr(self, name, await self._single_flight.do(name, loader))
+        return getattr(self, name)
 
     async def _get_locations(self):
         location_mapping = {}  # type: dict[str, Location]
         response = await self.request(api.Methods.LOCATIONS())
-        location_data = await response.json()
+        location_data = response.data
 
         for data in location_data["items"]:
             location = Location(**data)
@@ -48,7 +129,7 @@ class Client(BaseClient):
     async def _get_clan_labels(self):
         clan_labels_mapping = {}  # type: dict[str, ClanLabel]
         response = await self.request(api.Methods.CLAN_LABELS())
-        clan_label_data = await response.json()
+        clan_label_data = response.data
 
         for data in clan_label_data["items"]:
             clan_label = ClanLabel(**data)
@@ -60,7 +141,7 @@ class Client(BaseClient):
     async def _get_clan_leagues(self):
         clan_leagues_mapping = {}  # type: dict[str, ClanWarLeague]
         response = await self.request(api.Methods.WARLEAGUES())
-        clan_leagues_data = await response.json()
+        clan_leagues_data = response.data
 
         for data in clan_leagues_data["items"]:
             clan_league = ClanWarLeague(**data)
@@ -72,7 +153,7 @@ class Client(BaseClient):
     async def _get_player_labels(self):
         player_labels_mapping = {}  # type: dict[str, PlayerLabel]
         response = await self.request(api.Methods.WARLEAGUES())
-        player_labels_data = await response.json()
+        player_labels_data = response.data
 
         for data in player_labels_data["items"]:
             player_label = PlayerLabel(**data)
@@ -84,7 +165,7 @@ class Client(BaseClient):
     async def _get_player_leagues(self):
         player_leagues_mapping = {}  # type: dict[str, PlayerLeague]
         response = await self.request(api.Methods.WARLEAGUES())
-        player_leagues_data = await response.json()
+        player_leagues_data = response.data
 
         for data in player_leagues_data["items"]:
             player_league = PlayerLeague(**data)
@@ -93,6 +174,81 @@ class Client(BaseClient):
 
         return player_leagues_mapping
 
+    async def _clan_search_params(
+        self,
+        *,
+        name: Optional[str] = None,
+        min_members: Optional[aliases.PositiveInt] = None,
+        max_members: Optional[aliases.PositiveInt] = None,
+        min_clan_points: Optional[aliases.PositiveInt] = None,
+        min_clan_level: Optional[aliases.PositiveInt] = None,
+        war_frequency: Optional[aliases.ClanWarFrequency] = None,
+        location: Optional[aliases.LocationName | aliases.CountryCode] = None,
+        labels: Optional[list[aliases.LabelName] | aliases.LabelName] = None,
+    ):
+        params = {}  # type: dict[str, Any]
+        if name:
+            params["name"] = name
+
+        if min_members:
+            params["minMembers"] = min_members
+
+        if max_members:
+            params["maxMembers"] = max_members
+
+        if min_clan_points:
+            params["minClanPoints"] = min_clan_points
+
+        if min_clan_level:
+            params["minClanLevel"] = min_clan_level
+
+        if war_frequency:
+            params["warFrequency"] = war_frequency
+
+        if location:
+            loc = await self.get_location(location)
+            loc_id = loc.id
+            params["locationId"] = loc_id
+
+        if labels:
+            if not isinstance(labels, list):
+                labels = [labels]
+
+            lab_ids = []  # type: list[int]
+
+            for lab in labels:
+                lab = lab.lower()
+                clan_lab = await self.get_clan_label(lab)
+                lab_ids.append(clan_lab.id)
+
+            # [1, 2, 3] => "1,2,3"
+            comma_separated_lab_ids = ",".join(map(str, lab_ids))
+            params["labelIds"] = comma_separated_lab_ids
+
+        return params
+
+    async def _iter_pages(
+        self,
+        api_method: api.Request,
+        *,
+        page_size: aliases.PositiveInt,
+        params: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        params = dict(params or {}, limit=page_size)
+
+        while True:
+            response = await self.request(api_method, params=params)
+            page_data = response.data
+
+            items = page_data["items"]
+            if items:
+                yield items
+
+            after = page_data.get("paging", {}).get("cursors", {}).get("after")
+            if not items or not after:
+                return
+            params["after"] = after
+
     async def clans(
         self,
         *,
@@ -104,6 +260,7 @@ class Client(BaseClient):
         war_frequency: Optional[aliases.ClanWarFrequency] = None,
         location: Optional[aliases.LocationName | aliases.CountryCode] = None,
         labels: Optional[list[aliases.LabelName] | aliases.LabelName] = None,
+        limit: Optional[aliases.PositiveInt] = None,
     ) -> list[aliases.Tag]:
         """
         Search all clans by name and/or filtering the results using various criteria.
@@ -131,6 +288,8 @@ class Client(BaseClient):
             Location name or country code
         labels : list[str] | str
             List of clan labels or just 1 clan label
+        limit : int
+            Maximum number of clans
 
         Returns
         -------
@@ -142,51 +301,82 @@ class Client(BaseClient):
         ['#RLU20URV', '#RV9RCQV', '#2LVV8RCJJ', ...]
         """
 
-        params = {}
-        if name:
-            params["name"] = name
-
-        if min_members:
-            params["minMembers"] = min_members
-
-        if max_members:
-            params["maxMembers"] = max_members
-
-        if min_clan_points:
-            params["minClanPoints"] = min_clan_points
-
-        if min_clan_level:
-            params["minClanLevel"] = min_clan_level
+        params = await self._clan_search_params(
+            name=name,
+            min_members=min_members,
+            max_members=max_members,
+            min_clan_points=min_clan_points,
+            min_clan_level=min_clan_level,
+            war_frequency=war_frequency,
+            location=location,
+            labels=labels,
+        )
+        if limit:
+            params["limit"] = limit
+        response = await self.request(api.Methods.CLANS(), params=params)
+        clans_data = response.data
+        tag_list = [clan["tag"] for clan in clans_data["items"]]
+        return tag_list
 
-        if war_frequency:
-            params["warFrequency"] = war_frequency
+    async def iter_clans(
+        self,
+        *,
+        name: Optional[str] = None,
+        min_members: Optional[aliases.PositiveInt] = None,
+        max_members: Optional[aliases.PositiveInt] = None,
+        min_clan_points: Optional[aliases.PositiveInt] = None,
+        min_clan_level: Optional[aliases.PositiveInt] = None,
+        war_frequency: Optional[aliases.ClanWarFrequency] = None,
+        location: Optional[aliases.LocationName | aliases.CountryCode] = None,
+        labels: Optional[list[aliases.LabelName] | aliases.LabelName] = None,
+        page_size: aliases.PositiveInt = 100,
+    ) -> AsyncIterator[list[aliases.Tag]]:
+        """
+        Same as ``Client.clans``, but walks through all result pages.
+        Every page is yielded as soon as it is received.
 
-        if location:
-            loc = await self.get_location(location)
-            loc_id = loc.id
-            params["locationId"] = loc_id
+        Parameters
+        ----------
+        page_size : int
+            Number of clans per page (request)
 
-        if labels:
-            if not isinstance(labels, list):
-                labels = [labels]
+        Other parameters are the same as for ``Client.clans``
 
-            lab_ids = []  # type: list[int]
+        Yields
+        ------
+        list[str]
+            Page of clan tags
 
-            for lab in labels:
-                lab = lab.lower()
-                clan_lab = await self.get_clan_label(lab)
-                lab_ids.append(clan_lab.id)
+        Examples
+        --------
+        >>> async for tags in client.iter_clans(location='ru', min_members=30, page_size=50):
+        ...     print(len(tags))
+        """
 
-            # [1, 2, 3] => "1,2,3"
-            comma_separated_lab_ids = ",".join(map(str, lab_ids))
-            params["labelIds"] = comma_separated_lab_ids
+        params = await self._clan_search_params(
+            name=name,
+            min_members=min_members,
+            max_members=max_members,
+            min_clan_points=min_clan_points,
+            min_clan_level=min_clan_level,
+            war_frequency=war_frequency,
+            location=location,
+            labels=labels,
+        )
 
-        response = await self.request(api.Methods.CLANS(), params=params)
-        clans_data = await response.json()
-        tag_list = [clan["tag"] for clan in clans_data["items"]]
-        return tag_list
+        async for page in self._iter_pages(
+            api.Methods.CLANS(), page_size=page_size, params=params
+        ):
+            yield [clan["tag"] for clan in page]
 
-    async def clan(self, tag: aliases.Tag) -> Clan:
+    async def clan(
+        self,
+        tag: aliases.Tag | aliases.TagId,
+        *,
+        include: Optional[Collection[aliases.ClanSection]] = None,
+        exclude: Optional[Collection[aliases.ClanSection]] = None,
+        decode: Optional[aliases.DecodeMode] = None,
+    ) -> Clan:
         """
         Get information about a single clan by clan tag.
         Clan tags can be found using clan search operation.
@@ -194,32 +384,49 @@ class Client(BaseClient):
 
         Parameters
         ----------
-        tag : str
+        tag : str | int
             Clan tag.
+        include : Collection[str]
+            Sections to fetch, see ``ClanSection``. All sections by default
+        exclude : Collection[str]
+            Sections to skip, see ``ClanSection``
+        decode : str
+            Override client decode mode, see ``DecodeMode``
 
         Returns
         -------
         Clan
-            Clan object.
+            Clan object (or dict if ``decode='raw'``).
 
         Remarks
         -------
-        Performs 1 or 3 requests:
+        Performs 1 to 3 requests:
         - '/clans/{tag}' (always)
 
         If clan war log is public:
-            - '/clans/{tag}/currentwar' (information about current war)
-            - '/clans/{tag}/warlog' (log all war results)
+            - '/clans/{tag}/currentwar' (information about current war, ``currentwar`` section)
+            - '/clans/{tag}/warlog' (log all war results, ``warlog`` section)
+
+        Skipped sections are ``None`` in ``Clan.war``,
+        ``Clan.war.state`` is known only with ``currentwar`` section.
 
         Examples
         --------
         >>> await client.clan('#2P8QU22L2')
         #TODO: examples
+
+        >>> clan = await client.clan('#2P8QU22L2', include=())  # only 1 request
+        >>> clan.member_list
+        ['#...', ...]
         """
 
+        sections = set(CLAN_SECTIONS if include is None else include)
+        sections.difference_update(exclude or ())
+
         shaped_tag = utils.shape_tag(tag)
         response = await self.request(api.Methods.CLAN(clantag=shaped_tag))
-        clan_data = await response.json()
+        # response data may be shared, so it is copied before changes
+        clan_data = dict(response.data)
 
         member_tags = [member["tag"] for member in clan_data["memberList"]]
         clan_data["memberList"] = member_tags
@@ -239,26 +446,81 @@ class Client(BaseClient):
             )
         }
 
-        if clan_data["war"]["isWarLogPublic"]:
+        if clan_data["war"]["isWarLogPublic"] and sections:
             war_response, warlog_response = await asyncio.gather(
-                self.request(api.Methods.CLAN_CURRENT_WAR(clantag=shaped_tag)),
-                self.request(api.Methods.CLAN_WARLOG(clantag=shaped_tag)),
+                self._request_if(
+                    "currentwar" in sections,
+                    api.Methods.CLAN_CURRENT_WAR(clantag=shaped_tag),
+                ),
+                self._request_if(
+                    "warlog" in sections,
+                    api.Methods.CLAN_WARLOG(clantag=shaped_tag),
+                ),
             )
-            war_data, war_log_data = await asyncio.gather(
-                war_response.json(), warlog_response.json()
-            )
-            war_state = war_data["state"]
 
-            clan_data["war"]["warState"] = war_state
-            clan_data["war"]["warLog"] = war_log_data["items"]
+            if war_response is not None:
+                war_data = war_response.data
+                war_state = war_data["state"]
+
+                clan_data["war"]["warState"] = war_state
+                if war_state != "notInWar":
+                    clan_data["war"]["warCurrentwar"] = war_data
 
-            if war_state != "notInWar":
-                clan_data["war"]["warCurrentwar"] = war_data
+            if warlog_response is not None:
+                clan_data["war"]["warLog"] = warlog_response.data["items"]
 
-        clan_object = Clan(**clan_data)
+        clan_object = self._decode(Clan, clan_data, decode)
         return clan_object
 
-    async def player(self, tag: aliases.Tag) -> Player:
+    async def clan_members(
+        self,
+        tag: aliases.Tag | aliases.TagId,
+        *,
+        decode: Optional[aliases.DecodeMode] = None,
+    ) -> list[ClanMember]:
+        """
+        List clan members with their stats (role, trophies, donations, league, etc.).
+        Much cheaper than ``Client.clan`` and ``Client.player`` for every member.
+
+        Parameters
+        ----------
+        tag : str | int
+            Clan tag.
+        decode : str
+            Override client decode mode, see ``DecodeMode``
+
+        Returns
+        -------
+        list[ClanMember]
+            Clan members (or dicts if ``decode='raw'``), ordered by clan rank.
+
+        Remarks
+        -------
+        Performs 1 request:
+        - '/clans/{tag}/members'
+
+        Examples
+        --------
+        >>> members = await client.clan_members('#2P8QU22L2')
+        >>> print(members[0].name, members[0].role, members[0].donations)
+        """
+
+        shaped_tag = utils.shape_tag(tag)
+        response = await self.request(api.Methods.CLAN_MEMBERS(clantag=shaped_tag))
+        members_data = response.data
+
+        member_list = [
+            self._decode(ClanMember, member_data, decode)
+            for member_data in members_data["items"]
+        ]
+        return member_list
+
+    async def player(
+        self,
+        tag: aliases.Tag | aliases.TagId,
+        *,
+        decode: Optional[aliases.DecodeMode] = None,
+    ) -> Player:
         """
         Get information about a single player by player tag.
         Player tags can be found either in game or by from clan member lists.
@@ -266,13 +528,15 @@ class Client(BaseClient):
 
         Parameters
         ----------
-        tag : str
+        tag : str | int
             Tag.
+        decode : str
+            Override client decode mode, see ``DecodeMode``
 
         Returns
         -------
         Player
-            Player object.
+            Player object (or dict if ``decode='raw'``).
 
         Examples
         --------
@@ -282,12 +546,355 @@ class Client(BaseClient):
 
         shaped_tag = utils.shape_tag(tag)
         response = await self.request(api.Methods.PLAYER(playertag=shaped_tag))
-        player_data = await response.json()
-        player_data["clan"] = player_data["clan"]["tag"]
+        player_data = dict(response.data)
+        if "clan" in player_data:
+            player_data["clan"] = player_data["clan"]["tag"]
 
-        player_object = Player(**player_data)
+        player_object = self._decode(Player, player_data, decode)
         return player_object
 
+    async def players(
+        self,
+        tags: Iterable[aliases.Tag | aliases.TagId]
+        | AsyncIterable[aliases.Tag | aliases.TagId],
+        *,
+        concurrency: aliases.PositiveInt = 10,
+        ordered: bool = False,
+        decode: Optional[aliases.DecodeMode] = None,
+    ) -> AsyncIterator[tuple[aliases.Tag, Player | Exception]]:
+        """
+        Get information about many players.
+        At most ``concurrency`` requests are made at once,
+        tags are consumed lazily, so any amount of tags can be passed.
+
+        Parameters
+        ----------
+        tags : Iterable[str | int] | AsyncIterable[str | int]
+            Player tags, string or encoded (see ``utils.encode_tag``)
+        concurrency : int
+            Maximum number of concurrent requests
+        ordered : bool
+            Yield players in the same order as tags instead of completion order
+        decode : str
+            Override client decode mode, see ``DecodeMode``
+
+        Yields
+        ------
+        tuple[str, Player | Exception]
+            Tag and either player object or error raised while getting it
+
+        Examples
+        --------
+        >>> async for tag, player in client.players(['#LJJOUY2U8', '#2PP'], concurrency=50):
+        ...     if isinstance(player, Exception):
+        ...         print(tag, 'failed:', player)
+        """
+
+        async for result in utils.bounded_map(
+            functools.partial(self.player, decode=decode),
+            tags,
+            concurrency=concurrency,
+            ordered=ordered,
+        ):
+            yield result
+
+    async def clans_by_tags(
+        self,
+        tags: Iterable[aliases.Tag | aliases.TagId]
+        | AsyncIterable[aliases.Tag | aliases.TagId],
+        *,
+        concurrency: aliases.PositiveInt = 10,
+        ordered: bool = False,
+        include: Optional[Collection[aliases.ClanSection]] = None,
+        exclude: Optional[Collection[aliases.ClanSection]] = None,
+        decode: Optional[aliases.DecodeMode] = None,
+    ) -> AsyncIterator[tuple[aliases.Tag, Clan | Exception]]:
+        """
+        Get information about many clans.
+        At most ``concurrency`` clans are fetched at once,
+        tags are consumed lazily, so any amount of tags can be passed.
+
+        Parameters
+        ----------
+        tags : Iterable[str | int] | AsyncIterable[str | int]
+            Clan tags, string or encoded (see ``utils.encode_tag``)
+        concurrency : int
+            Maximum number of concurrently fetched clans
+        ordered : bool
+            Yield clans in the same order as tags instead of completion order
+        include : Collection[str]
+            Sections to fetch, see ``Client.clan``
+        exclude : Collection[str]
+            Sections to skip, see ``Client.clan``
+        decode : str
+            Override client decode mode, see ``DecodeMode``
+
+        Yields
+        ------
+        tuple[str, Clan | Exception]
+            Tag and either clan object or error raised while getting it
+
+        Remarks
+        -------
+        Every clan may take up to 3 requests depending on sections, see ``Client.clan``
+
+        Examples
+        --------
+        >>> tags = await client.clans(location='ru', war_frequency='always')
+        >>> async for tag, clan in client.clans_by_tags(tags, ordered=True):
+        ...     print(tag, clan.name)
+        """
+
+        async for result in utils.bounded_map(
+            functools.partial(
+                self.clan, include=include, exclude=exclude, decode=decode
+            ),
+            tags,
+            concurrency=concurrency,
+            ordered=ordered,
+        ):
+            yield result
+
+    async def clan_with_players(
+        self,
+        tag: aliases.Tag | aliases.TagId,
+        *,
+        concurrency: aliases.PositiveInt = 10,
+        ordered: bool = False,
+        include: Optional[Collection[aliases.ClanSection]] = None,
+        exclude: Optional[Collection[aliases.ClanSection]] = None,
+        decode: Optional[aliases.DecodeMode] = None,
+    ) -> tuple[Clan, AsyncIterator[tuple[aliases.Tag, Player | Exception]]]:
+        """
+        Get clan and full information about all its members.
+        Clan is returned as soon as it is received,
+        members are fetched lazily with at most ``concurrency`` requests at once.
+
+        Parameters
+        ----------
+        tag : str | int
+            Clan tag.
+        concurrency : int
+            Maximum number of concurrent player requests
+        ordered : bool
+            Yield players in the clan rank order instead of completion order
+        include : Collection[str]
+            Clan sections to fetch, see ``Client.clan``
+        exclude : Collection[str]
+            Clan sections to skip, see ``Client.clan``
+        decode : str
+            Override client decode mode, see ``DecodeMode``
+
+        Returns
+        -------
+        tuple[Clan, AsyncIterator[tuple[str, Player | Exception]]]
+            Clan object and async iterator over member tags and
+            either player object or error raised while getting it
+
+        Remarks
+        -------
+        Performs requests of ``Client.clan`` and 1 request per clan member.
+        Requests share the client session, rate limiter, key pool and cache.
+
+        Examples
+        --------
+        >>> clan, players = await client.clan_with_players('#2P8QU22L2', include=())
+        >>> async for tag, player in players:
+        ...     if isinstance(player, Exception):
+        ...         print(tag, 'failed:', player)
+        ...     else:
+        ...         print(clan.name, player.name, player.town_hall_level)
+        """
+
+        clan = await self.clan(tag, include=include, exclude=exclude, decode=decode)
+        member_tags = clan["memberList"] if isinstance(clan, dict) else clan.member_list
+
+        players = self.players(
+            member_tags, concurrency=concurrency, ordered=ordered, decode=decode
+        )
+        return clan, players
+
+    async def league_group(
+        self, tag: aliases.Tag, *, decode: Optional[aliases.DecodeMode] = None
+    ) -> ClanWarLeagueGroup:
+        """
+        Get information about clan's current clan war league group.
+
+        Parameters
+        ----------
+        tag : str
+            Clan tag.
+        decode : str
+            Override client decode mode, see ``DecodeMode``
+
+        Returns
+        -------
+        ClanWarLeagueGroup
+            League group object (or dict if ``decode='raw'``).
+
+        Raises
+        ------
+        ``ResourceNotFound``
+            If clan is not in clan war league
+
+        Examples
+        --------
+        >>> group = await client.league_group('#2P8QU22L2')
+        >>> print(group.season, [clan.name for clan in group.clans])
+        """
+
+        shaped_tag = utils.shape_tag(tag)
+        response = await self.request(
+            api.Methods.CLAN_CURRENT_WAR_LEAGUEGROUP(clantag=shaped_tag)
+        )
+        group_data = response.data
+
+        group_object = self._decode(ClanWarLeagueGroup, group_data, decode)
+        return group_object
+
+    async def league_war(
+        self, war_tag: aliases.Tag, *, decode: Optional[aliases.DecodeMode] = None
+    ) -> ClanWarLeagueWar:
+        """
+        Get information about single clan war league war.
+        Ended wars never change, so they are cached without expiration
+        in ``league_war_cache`` (an LRU cache of 1024 wars by default).
+
+        Parameters
+        ----------
+        war_tag : str
+            War tag, see ``ClanWarLeagueRound.war_tags``
+        decode : str
+            Override client decode mode, see ``DecodeMode``
+
+        Returns
+        -------
+        ClanWarLeagueWar
+            League war object (or dict if ``decode='raw'``).
+
+        Examples
+        --------
+        >>> war = await client.league_war('#2QJQPYLJU')
+        >>> print(war.state, war.clan.name, war.opponent.name)
+        """
+
+        shaped_tag = utils.shape_tag(war_tag)
+        api_method = api.Methods.CLAN_CURRENT_LEAGUE_WAR(wartag=shaped_tag)
+
+        response = self._league_war_cache.get(api_method.url)
+        if response is None:
+            response = await self.request(api_method)
+            if response.data.get("state") == "warEnded":
+                self._league_war_cache.set(api_method.url, response, math.inf)
+
+        war_data = dict(response.data, warTag=utils.to_tag(war_tag))
+        war_object = self._decode(ClanWarLeagueWar, war_data, decode)
+        return war_object
+
+    async def league_wars(
+        self,
+        tags: aliases.Tag | Iterable[aliases.Tag],
+        *,
+        concurrency: aliases.PositiveInt = 10,
+        ordered: bool = False,
+        decode: Optional[aliases.DecodeMode] = None,
+    ) -> tuple[
+        dict[aliases.Tag, ClanWarLeagueGroup | Exception],
+        AsyncIterator[tuple[aliases.Tag, ClanWarLeagueWar | Exception]],
+    ]:
+        """
+        Get league groups of clans and all wars of these groups.
+
+        Every war is shared by 2 clans, it is requested only once.
+        Every group is shared by up to 8 clans, clans are pulled lazily
+        and ones found in already received groups are skipped,
+        but up to ``concurrency`` groups are requested at once,
+        so the same group can still be requested for several of these clans.
+        Unscheduled rounds (war tag ``#0``) are skipped.
+
+        Parameters
+        ----------
+        tags : str | Iterable[str]
+            Clan tag or tags
+        concurrency : int
+            Maximum number of concurrent requests
+        ordered : bool
+            Yield wars in round order instead of completion order
+        decode : str
+            Override client decode mode, see ``DecodeMode``
+
+        Returns
+        -------
+        tuple[dict, AsyncIterator[tuple[str, ClanWarLeagueWar | Exception]]]
+            League groups (or errors, e.g. ``ResourceNotFound`` for clans not in league) by clan tag
+            and async iterator over war tags and either war object or error raised while getting it
+
+        Examples
+        --------
+        >>> groups, wars = await client.league_wars(['#2P8QU22L2', '#LQGPL8LL'])
+        >>> async for war_tag, war in wars:
+        ...     if not isinstance(war, Exception):
+        ...         print(war_tag, war.state, war.clan.name, war.opponent.name)
+        """
+
+        tags = [tags] if isinstance(tags, str) else list(tags)
+
+        errors = {}  # type: dict[aliases.Tag, Exception]
+        known_groups = {}  # type: dict[aliases.Tag, Any]
+        war_tags = {}  # type: dict[aliases.Tag, None]
+
+        def canonical(tag: aliases.Tag) -> aliases.Tag:
+            # group clans are listed with canonical tags
+            try:
+                return utils.to_tag(tag)
+            except exceptions.InvalidTagError:
+                return tag  # its request fails with the same error
+
+        def pending_tags():
+            # tags are pulled lazily, so clans of already received groups are skipped
+            for tag in tags:
+                if canonical(tag) not in known_groups:
+                    yield tag
+
+        async for tag, group in utils.bounded_map(
+            functools.partial(self.league_group, decode="raw"),
+            pending_tags(),
+            concurrency=concurrency,
+            ordered=True,
+        ):
+            if isinstance(group, Exception):
+                errors[tag] = group
+                continue
+
+            group_object = self._decode(ClanWarLeagueGroup, group, decode)
+            known_groups[canonical(tag)] = group_object
+            for clan in group["clans"]:
+                known_groups[clan["tag"]] = group_object
+
+            for league_round in group["rounds"]:
+                war_tags.update(
+                    dict.fromkeys(
+                        war_tag
+                        for war_tag in league_round["warTags"]
+                        if war_tag != NO_WAR_TAG
+                    )
+                )
+
+        groups = {
+            tag: known_groups[canonical(tag)]
+            if canonical(tag) in known_groups
+            else errors[tag]
+            for tag in tags
+        }  # type: dict[aliases.Tag, ClanWarLeagueGroup | Exception]
+
+        wars = utils.bounded_map(
+            functools.partial(self.league_war, decode=decode),
+            war_tags,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+        return groups, wars
+
     async def clan_rankings(
         self, location: aliases.LocationName | aliases.CountryCode
     ) -> list[aliases.Tag]:
@@ -313,7 +920,7 @@ class Client(BaseClient):
 
         loc = await self.get_location(location)
         response = await self.request(api.Methods.CLAN_RANKINGS(location_id=loc.id))
-        rankings_data = await response.json()
+        rankings_data = response.data
 
         tag_list = [clan["tag"] for clan in rankings_data["items"]]
         return tag_list
@@ -343,7 +950,7 @@ class Client(BaseClient):
 
         loc = await self.get_location(location)
         response = await self.request(api.Methods.PLAYER_RANKINGS(location_id=loc.id))
-        rankings_data = await response.json()
+        rankings_data = response.data
 
         tag_list = [clan["tag"] for clan in rankings_data["items"]]
         return tag_list
@@ -375,7 +982,7 @@ class Client(BaseClient):
         response = await self.request(
             api.Methods.CLAN_VERSUS_RANKINGS(location_id=loc.id)
         )
-        rankings_data = await response.json()
+        rankings_data = response.data
 
         tag_list = [clan["tag"] for clan in rankings_data["items"]]
         return tag_list
@@ -407,19 +1014,303 @@ class Client(BaseClient):
         response = await self.request(
             api.Methods.PLAYER_VERSUS_RANKINGS(location_id=loc.id)
         )
-        rankings_data = await response.json()
+        rankings_data = response.data
 
         tag_list = [clan["tag"] for clan in rankings_data["items"]]
         return tag_list
 
-    async def goldpass(self) -> GoldPass:
+    async def rankings_snapshot(
+        self,
+        location: aliases.LocationName | aliases.CountryCode,
+        kind: RankingKind = "players",
+        *,
+        limit: Optional[aliases.PositiveInt] = None,
+    ) -> RankingSnapshot:
+        """
+        Get rankings for a specific location with all entry fields
+        as compact columnar snapshot.
+
+        Parameters
+        ----------
+        location : str
+            Location name or its code
+        kind : str
+            Rankings kind: ``players`` (default), ``clans``, ``players-versus`` or ``clans-versus``
+        limit : int
+            Maximum number of entries, all entries (up to 200) by default
+
+        Returns
+        -------
+        RankingSnapshot
+            Ranks, previous ranks, scores, levels, tags and clan tags as parallel columns
+
+        Examples
+        --------
+        >>> old = await client.rankings_snapshot('ru')
+        >>> new = await client.rankings_snapshot('ru')
+        >>> diff = new.diff(old)
+        >>> print(new.tags[0], new.score[0], diff.rank_delta[0])
+        """
+
+        loc = await self.get_location(location)
+        return await self._rankings_snapshot(loc.id, kind, limit)
+
+    async def _rankings_snapshot(
+        self,
+        location_id: int,
+        kind: RankingKind,
+        limit: Optional[aliases.PositiveInt] = None,
+    ):
+        response = await self.request(
+            RANKING_METHODS[kind](location_id=location_id), params={"limit": limit}
+        )
+        rankings_data = response.data
+
+        return RankingSnapshot.from_items(kind, location_id, rankings_data["items"])
+
+    async def crawl_rankings(
+        self,
+        kind: RankingKind = "players",
+        *,
+        locations: Optional[
+            Iterable[aliases.LocationName | aliases.CountryCode]
+        ] = None,
+        concurrency: aliases.PositiveInt = 10,
+        limit: Optional[aliases.PositiveInt] = None,
+    ) -> AsyncIterator[tuple[int, RankingSnapshot | Exception]]:
+        """
+        Get rankings of many locations concurrently.
+        Every location is yielded as soon as it is received.
+
+        Parameters
+        ----------
+        kind : str
+            Rankings kind, see ``Client.rankings_snapshot``
+        locations : Iterable[str]
+            Location names or codes, all countries by default
+        concurrency : int
+            Maximum number of concurrent requests
+        limit : int
+            Maximum number of entries per location
+
+        Yields
+        ------
+        tuple[int, RankingSnapshot | Exception]
+            Location id and either rankings snapshot or error raised while getting it
+
+        Examples
+        --------
+        >>> async for location_id, snapshot in client.crawl_rankings('clans', concurrency=20):
+        ...     print(location_id, snapshot.tags[:3])
+        """
+
+        if locations is None:
+            locations_mapping = await self.all_locations()
+            location_ids = list(
+                {loc.id: None for loc in locations_mapping.values() if loc.is_country}
+            )
+        else:
+            location_ids = [(await self.get_location(name)).id for name in locations]
+
+        async for result in utils.bounded_map(
+            functools.partial(self._rankings_snapshot, kind=kind, limit=limit),
+            location_ids,
+            concurrency=concurrency,
+        ):
+            yield result
+
+    async def global_rankings(
+        self,
+        kind: RankingKind = "players",
+        *,
+        locations: Optional[
+            Iterable[aliases.LocationName | aliases.CountryCode]
+        ] = None,
+        concurrency: aliases.PositiveInt = 10,
+        limit: Optional[aliases.PositiveInt] = None,
+    ) -> Leaderboard:
+        """
+        Build global leaderboard from rankings of many locations,
+        see ``Client.crawl_rankings``.
+
+        Parameters
+        ----------
+        The same as for ``Client.crawl_rankings``
+
+        Returns
+        -------
+        Leaderboard
+            Leaderboard of all loaded locations,
+            errors of failed locations are in ``Leaderboard.errors``
+
+        Examples
+        --------
+        >>> leaderboard = await client.global_rankings('players', concurrency=20)
+        >>> for entry in leaderboard.top(100):
+        ...     print(entry.tag, entry.name, entry.score, entry.location_id)
+        """
+
+        leaderboard = Leaderboard(kind)
+        async for location_id, snapshot in self.crawl_rankings(
+            kind, locations=locations, concurrency=concurrency, limit=limit
+        ):
+            if isinstance(snapshot, Exception):
+                leaderboard.errors[location_id] = snapshot
+            else:
+                leaderboard.add(snapshot)
+        return leaderboard
+
+    async def _iter_rankings(
+        self,
+        api_method: api.BaseMethod,
+        location: aliases.LocationName | aliases.CountryCode,
+        page_size: aliases.PositiveInt,
+    ) -> AsyncIterator[list[aliases.Tag]]:
+        loc = await self.get_location(location)
+        async for page in self._iter_pages(
+            api_method(location_id=loc.id), page_size=page_size
+        ):
+            yield [item["tag"] for item in page]
+
+    def iter_clan_rankings(
+        self,
+        location: aliases.LocationName | aliases.CountryCode,
+        *,
+        page_size: aliases.PositiveInt = 50,
+    ) -> AsyncIterator[list[aliases.Tag]]:
+        """
+        Same as ``Client.clan_rankings``, but walks through all result pages.
+        Every page is yielded as soon as it is received.
+
+        Parameters
+        ----------
+        location : str
+            Location name or its code
+        page_size : int
+            Number of clans per page (request)
+
+        Yields
+        ------
+        list[str]
+            Page of clan tags (descending by score)
+
+        Examples
+        --------
+        >>> async for tags in client.iter_clan_rankings('ru', page_size=20):
+        ...     print(tags)
+        """
+
+        return self._iter_rankings(api.Methods.CLAN_RANKINGS, location, page_size)
+
+    def iter_player_rankings(
+        self,
+        location: aliases.LocationName | aliases.CountryCode,
+        *,
+        page_size: aliases.PositiveInt = 50,
+    ) -> AsyncIterator[list[aliases.Tag]]:
+        """
+        Same as ``Client.player_rankings``, but walks through all result pages.
+        Every page is yielded as soon as it is received.
+
+        Parameters
+        ----------
+        location : str
+            Location name or its code
+        page_size : int
+            Number of players per page (request)
+
+        Yields
+        ------
+        list[str]
+            Page of player tags (descending by trophies)
+
+        Examples
+        --------
+        >>> async for tags in client.iter_player_rankings('ru', page_size=20):
+        ...     print(tags)
+        """
+
+        return self._iter_rankings(api.Methods.PLAYER_RANKINGS, location, page_size)
+
+    def iter_clan_versus_rankings(
+        self,
+        location: aliases.LocationName | aliases.CountryCode,
+        *,
+        page_size: aliases.PositiveInt = 50,
+    ) -> AsyncIterator[list[aliases.Tag]]:
+        """
+        Same as ``Client.clan_versus_rankings``, but walks through all result pages.
+        Every page is yielded as soon as it is received.
+
+        Parameters
+        ----------
+        location : str
+            Location name or its code
+        page_size : int
+            Number of clans per page (request)
+
+        Yields
+        ------
+        list[str]
+            Page of clan tags (descending by versus score)
+
+        Examples
+        --------
+        >>> async for tags in client.iter_clan_versus_rankings('ru', page_size=20):
+        ...     print(tags)
+        """
+
+        return self._iter_rankings(
+            api.Methods.CLAN_VERSUS_RANKINGS, location, page_size
+        )
+
+    def iter_player_versus_rankings(
+        self,
+        location: aliases.LocationName | aliases.CountryCode,
+        *,
+        page_size: aliases.PositiveInt = 50,
+    ) -> AsyncIterator[list[aliases.Tag]]:
+        """
+        Same as ``Client.player_versus_rankings``, but walks through all result pages.
+        Every page is yielded as soon as it is received.
+
+        Parameters
+        ----------
+        location : str
+            Location name or its code
+        page_size : int
+            Number of players per page (request)
+
+        Yields
+        ------
+        list[str]
+            Page of player tags (descending by versus trophies)
+
+        Examples
+        --------
+        >>> async for tags in client.iter_player_versus_rankings('ru', page_size=20):
+        ...     print(tags)
+        """
+
+        return self._iter_rankings(
+            api.Methods.PLAYER_VERSUS_RANKINGS, location, page_size
+        )
+
+    async def goldpass(
+        self, *, decode: Optional[aliases.DecodeMode] = None
+    ) -> GoldPass:
         """
         Get information about the current gold pass season
 
+        Parameters
+        ----------
+        decode : str
+            Override client decode mode, see ``DecodeMode``
+
         Returns
         -------
         GoldPass
-            Gold pass object.
+            Gold pass object (or dict if ``decode='raw'``).
 
         Examples
         --------
@@ -428,9 +1319,9 @@ class Client(BaseClient):
         """
 
         response = await self.request(api.Methods.GOLDPASS())
-        goldpass_data = await response.json()
+        goldpass_data = response.data
 
-        goldpass_object = GoldPass(**goldpass_data)
+        goldpass_object = self._decode(GoldPass, goldpass_data, decode)
         return goldpass_object
 
     async def all_locations(self):
@@ -451,9 +1342,7 @@ class Client(BaseClient):
         # TODO: Location(...)
         """
 
-        if not hasattr(self, "_locations"):
-            setattr(self, "_locations", await self._get_locations())
-        return self._locations
+        return await self._get_catalog("_locations", self._get_locations)
 
     async def get_location(
         self, location_name: aliases.LocationName | aliases.CountryCode
@@ -508,9 +1397,7 @@ class Client(BaseClient):
         # TODO: ClanLabel(...)
         """
 
-        if not hasattr(self, "_clan_labels"):
-            setattr(self, "_clan_labels", await self._get_clan_labels())
-        return self._clan_labels
+        return await self._get_catalog("_clan_labels", self._get_clan_labels)
 
     async def get_clan_label(self, label_name: str):
         """
@@ -559,9 +1446,7 @@ class Client(BaseClient):
         # TODO: League(...)
         """
 
-        if not hasattr(self, "_clan_leagues"):
-            setattr(self, "_clan_leagues", await self._get_clan_leagues())
-        return self._clan_leagues
+        return await self._get_catalog("_clan_leagues", self._get_clan_leagues)
 
     async def get_clan_league(self, league_name: str):
         """
@@ -610,9 +1495,7 @@ class Client(BaseClient):
         # TODO: PlayerLabel(...)
         """
 
-        if not hasattr(self, "_player_labels"):
-            setattr(self, "_player_labels", await self._get_player_labels())
-        return self._player_labels
+        return await self._get_catalog("_player_labels", self._get_player_labels)
 
     async def get_player_label(self, label_name: str):
         """
@@ -660,9 +1543,7 @@ class Client(BaseClient):
         # TODO: League(...)
         """
 
-        if not hasattr(self, "_player_leagues"):
-            setattr(self, "_player_leagues", await self._get_player_leagues())
-        return self._player_leagues
+        return await self._get_catalog("_player_leagues", self._get_player_leagues)
 
     async def get_player_league(self, league_name: str):
         """
@@ -0,0 +1,54 @@
+from typing import Awaitable, Callable, Hashable, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key:
+    while a call is in flight, other callers with the same key wait for its result
+    instead of starting their own call.
+    Nothing is stored after the call is finished.
+    """
+
+    _calls: dict[Hashable, asyncio.Future]
+
+    def __init__(self):
+        self._calls = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Call ``func`` or join the call with the same ``key`` that is already in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            Call key
+        func : Callable
+            Coroutine function without arguments
+
+        Returns
+        -------
+        Result of ``func``, the same object for every joined caller
+        """
+
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+
+        # cancellation of one caller must not cancel the call for the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+
+        # avoid "exception was never retrieved" if every caller was cancelled
+        if not future.cancelled():
+            future.exception()
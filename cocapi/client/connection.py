@@ -0,0 +1,52 @@
+from typing import Optional
+from dataclasses import dataclass
+
+import aiohttp
+
+
+@dataclass
+class ConnectionConfig:
+    """
+    Connection pool configuration.
+
+    Fields
+    ------
+    limit : int
+        Total number of simultaneous connections, ``0`` means unlimited
+    limit_per_host : int
+        Number of simultaneous connections to the same host, ``0`` means unlimited
+    keepalive_timeout : float
+        How long idle connection is kept open (seconds)
+    ttl_dns_cache : int | None
+        How long resolved addresses are cached (seconds), ``None`` means forever
+    use_dns_cache : bool
+        Cache resolved addresses
+    timeout : float | None
+        Total timeout of a single request (seconds), ``None`` means aiohttp default
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    ttl_dns_cache: Optional[int] = 300
+    use_dns_cache: bool = True
+    timeout: Optional[float] = None
+
+    def make_connector(self) -> aiohttp.TCPConnector:
+        """
+        Create connector with this configuration.
+        Connector can be shared between several clients, must be called inside running event loop.
+        """
+
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.use_dns_cache,
+        )
+
+    def make_timeout(self) -> aiohttp.ClientTimeout | None:
+        if self.timeout is None:
+            return None
+        return aiohttp.ClientTimeout(total=self.timeout)
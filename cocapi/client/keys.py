@@ -0,0 +1,170 @@
+from typing import Iterable, Optional
+from dataclasses import dataclass, field
+import asyncio
+import math
+import time
+
+from ..types import exceptions
+from .retry import parse_retry_after
+
+
+@dataclass
+class ApiKey:
+    """
+    Single API token with its own request budget.
+
+    Budget is counted in fixed windows: at most ``limit`` requests
+    are sent with this token every ``period`` seconds.
+    ``limit=None`` means that the budget is not limited.
+    """
+
+    token: str
+    limit: Optional[int] = None
+    period: float = 1.0
+
+    used: int = field(init=False, default=0)
+    window_start: float = field(init=False, default_factory=time.monotonic)
+    benched_until: float = field(init=False, default=0.0)
+    disabled: bool = field(init=False, default=False)
+
+    @property
+    def headers(self):
+        return {"authorization": f"Bearer {self.token}"}
+
+    def _roll_window(self, now: float):
+        if now - self.window_start >= self.period:
+            self.window_start = now
+            self.used = 0
+
+    def remaining(self, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        self._roll_window(now)
+        if self.limit is None:
+            return math.inf
+        return self.limit - self.used
+
+    def is_available(self, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        return (
+            not self.disabled and self.benched_until <= now and self.remaining(now) > 0
+        )
+
+    def ready_at(self) -> float:
+        """Monotonic time when this key can be used again."""
+        ready = self.benched_until
+        if self.limit is not None and self.used >= self.limit:
+            ready = max(ready, self.window_start + self.period)
+        return ready
+
+    def consume(self, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        self._roll_window(now)
+        self.used += 1
+
+    def bench(self, seconds: Optional[float] = None):
+        """Bench this key for ``seconds`` or forever if ``seconds`` is ``None``"""
+        if seconds is None:
+            self.disabled = True
+        else:
+            self.benched_until = max(self.benched_until, time.monotonic() + seconds)
+
+
+class KeyPool:
+    """
+    Pool of API tokens.
+
+    Every request takes the key with the largest remaining budget,
+    so the load is spread between all registered tokens.
+
+    Keys are benched automatically:
+    - ``TooManyRequests`` benches the key for ``Retry-After`` seconds sent by server
+      or for ``throttle_bench_time`` seconds if there is no such header
+    - ``AccessDenied`` caused by invalid credentials (wrong token or IP) disables the key
+
+    Parameters
+    ----------
+    tokens : str | Iterable[str]
+        API token or tokens
+    limit : int
+        Requests per ``period`` allowed for every single key, unlimited by default
+    period : float
+        Budget window in seconds
+    throttle_bench_time : float
+        How long throttled key stays benched if server does not send ``Retry-After``
+    """
+
+    _keys: list[ApiKey]
+    throttle_bench_time: float
+
+    def __init__(
+        self,
+        tokens: str | Iterable[str],
+        *,
+        limit: Optional[int] = None,
+        period: float = 1.0,
+        throttle_bench_time: float = 5.0,
+    ):
+        if isinstance(tokens, str):
+            tokens = [tokens]
+
+        self._keys = [ApiKey(token, limit, period) for token in dict.fromkeys(tokens)]
+        self.throttle_bench_time = throttle_bench_time
+
+        if not self._keys:
+            raise ValueError("At least one API token must be provided")
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def keys(self):
+        return tuple(self._keys)
+
+    async def acquire(self) -> ApiKey:
+        """
+        Get the key with the largest remaining budget.
+        Waits if every key is benched or has spent its budget.
+
+        Raises
+        ------
+        ``NoAvailableKeysError``
+            If every key in the pool is disabled
+        """
+
+        while True:
+            now = time.monotonic()
+            available = [key for key in self._keys if key.is_available(now)]
+
+            if available:
+                key = max(available, key=lambda key: (key.remaining(now), -key.used))
+                key.consume(now)
+                return key
+
+            alive = [key for key in self._keys if not key.disabled]
+            if not alive:
+                raise exceptions.NoAvailableKeysError(len(self._keys))
+
+            await asyncio.sleep(max(min(key.ready_at() for key in alive) - now, 0))
+
+    def report(self, key: ApiKey, error: exceptions.ClientRequestError):
+        """Bench the key if ``error`` was caused by the key itself"""
+        if isinstance(error, exceptions.TooManyRequests):
+            # the retry waits for ``Retry-After`` too, so the key is ready by then
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+            key.bench(self.throttle_bench_time if retry_after is None else retry_after)
+        elif isinstance(error, exceptions.AccessDenied) and is_credentials_error(error):
+            key.bench()
+
+
+def is_credentials_error(error: exceptions.AccessDenied) -> bool:
+    """
+    ``403`` is returned both for invalid credentials and for private resources
+    (like private war log), only the first one means that the key is broken.
+    """
+
+    data = error.data if isinstance(error.data, dict) else {}
+    reason = data.get("reason") or ""
+    message = data.get("message") or ""
+    return reason == "accessDenied.invalidIp" or message.startswith(
+        "Invalid authorization"
+    )
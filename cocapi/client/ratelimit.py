@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+import asyncio
+import time
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Queue statistics of ``RateLimiter``
+
+    Fields
+    ------
+    requests : int
+        Number of requests passed through the limiter
+    delayed : int
+        Number of requests that had to wait in the queue
+    total_wait : float
+        Total time (seconds) requests spent in the queue
+    max_wait : float
+        The longest time (seconds) a single request spent in the queue
+    """
+
+    requests: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+    def record(self, wait: float, delayed: bool):
+        self.requests += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if delayed:
+            self.delayed += 1
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter.
+
+    The bucket holds up to ``burst`` tokens and is refilled with ``rate`` tokens per second,
+    every request takes one token. Callers wait in FIFO order, so nobody starves.
+
+    Parameters
+    ----------
+    rate : float
+        Requests per second
+    burst : int
+        Maximum number of requests that can be sent at once
+    """
+
+    rate: float
+    burst: int
+    stats: RateLimiterStats
+
+    _tokens: float
+    _updated_at: float
+    _lock: asyncio.Lock
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("'rate' must be positive")
+        if burst < 1:
+            raise ValueError("'burst' must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.stats = RateLimiterStats()
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot.
+
+        Returns
+        -------
+        float
+            Time (seconds) spent in the queue
+        """
+
+        started_at = time.monotonic()
+        delayed = self._lock.locked()
+
+        # asyncio.Lock wakes up waiters in FIFO order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delayed = True
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+        wait = time.monotonic() - started_at
+        self.stats.record(wait, delayed)
+        return wait
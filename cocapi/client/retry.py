@@ -0,0 +1,111 @@
+from typing import Counter, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import collections
+import random
+
+from . import api
+from ..types import exceptions
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy for failed requests.
+
+    Only idempotent requests (``GET`` by default) are retried.
+    Delay between attempts is chosen with exponential backoff and full jitter:
+    ``random(0, min(backoff_cap, backoff_base * 2 ** attempt))``.
+    If server sends ``Retry-After`` header, its value is used instead.
+    ``Retry-After`` longer than ``backoff_cap`` is not waited, the error is raised.
+
+    Fields
+    ------
+    max_attempts : int
+        Maximum number of attempts (including the first one)
+    backoff_base : float
+        Base delay in seconds
+    backoff_cap : float
+        Maximum delay in seconds
+    retry_statuses : frozenset[int]
+        Response statuses that can be retried
+    methods : frozenset[str]
+        HTTP methods that can be retried
+    retries : Counter[str]
+        Number of retries made for every endpoint (path template)
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    methods: frozenset[str] = frozenset({"GET"})
+    retries: Counter[str] = field(init=False, default_factory=collections.Counter)
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("'max_attempts' must be at least 1")
+
+    def get_delay(
+        self,
+        api_method: api.Request,
+        error: exceptions.ClientRequestError,
+        attempt: int,
+    ) -> Optional[float]:
+        """
+        Get delay before the next attempt.
+
+        Parameters
+        ----------
+        api_method : Request
+            Failed request API method
+        error : ClientRequestError
+            Error of the failed request
+        attempt : int
+            Number of the failed attempt, starting from 0
+
+        Returns
+        -------
+        float | None
+            Delay in seconds or ``None`` if request must not be retried
+        """
+
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if api_method.method not in self.methods:
+            return None
+        if error.response.status not in self.retry_statuses:
+            return None
+
+        retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return retry_after if retry_after <= self.backoff_cap else None
+
+        return random.uniform(
+            0, min(self.backoff_cap, self.backoff_base * 2**attempt)
+        )
+
+    def record(self, api_method: api.Request):
+        self.retries[api_method.path] += 1
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """``Retry-After`` can be either delay in seconds or HTTP date"""
+
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -0,0 +1,23 @@
+from .catalog import Catalog
+from .records import (
+    AchievementInfo,
+    CompactAchievements,
+    CompactClan,
+    CompactPlayer,
+    CompactTroops,
+    TroopInfo,
+    pack,
+    unpack,
+)
+
+__all__ = (
+    "Catalog",
+    "CompactPlayer",
+    "CompactClan",
+    "CompactTroops",
+    "CompactAchievements",
+    "TroopInfo",
+    "AchievementInfo",
+    "pack",
+    "unpack",
+)
@@ -0,0 +1,230 @@
+from typing import Any, Hashable, Iterable, Mapping, Optional, TypeVar
+import array
+import sys
+
+from ..types import BadgeURLs, Clan, ClanLabel, Player, PlayerAchievment, PlayerTroop
+from ..types.base import DefaultBaseModel
+from .records import (
+    SUPER_TROOP_FLAGS,
+    AchievementInfo,
+    CompactAchievements,
+    CompactClan,
+    CompactPlayer,
+    CompactTroops,
+    Levels,
+    TroopInfo,
+    pack,
+)
+
+T = TypeVar("T", bound=Hashable)
+Shared = TypeVar("Shared", bound=DefaultBaseModel)
+
+
+class Catalog:
+    """
+    Shared metadata of compact records.
+
+    Every distinct troop, achievement stage, troop list (schema), league,
+    label, location and badge is stored once and referenced by all records
+    built with the same catalog, strings of records are interned.
+    Records hold no reference to the catalog, so it can be dropped
+    after building (new records just will not share metadata with old ones).
+
+    Examples
+    --------
+    >>> catalog = Catalog()
+    >>> player = catalog.player(await client.player('#LJJOUY2U8', decode='raw'))
+    >>> player.troops.schema[0].name, player.troops.levels[0]
+    ('Barbarian', 11)
+    >>> player.to_model().troops[0].level
+    11
+    """
+
+    _shared: dict[Hashable, Any]
+
+    def __init__(self):
+        self._shared = {}
+
+    def __len__(self):
+        """Number of shared objects"""
+        return len(self._shared)
+
+    def share(self, value: T) -> T:
+        """The first seen value equal to ``value``"""
+        return self._shared.setdefault(value, value)
+
+    def player(self, player: Player | Mapping[str, Any]) -> CompactPlayer:
+        """
+        Build compact player.
+
+        Parameters
+        ----------
+        player : Player | dict
+            Player model or raw player data (``decode='raw'``)
+        """
+
+        if not isinstance(player, Player):
+            player = Player.construct_trusted(player)
+
+        return CompactPlayer(
+            tag=sys.intern(player.tag),
+            name=player.name,
+            town_hall_level=player.town_hall_level,
+            builder_hall_level=player.builder_hall_level,
+            exp_level=player.exp_level,
+            trophies=player.trophies,
+            best_trophies=player.best_trophies,
+            war_stars=player.war_stars,
+            attack_wins=player.attack_wins,
+            defense_wins=player.defense_wins,
+            versus_trophies=player.versus_trophies,
+            best_versus_trophies=player.best_versus_trophies,
+            versus_battle_wins=player.versus_battle_wins,
+            donations=player.donations,
+            donations_received=player.donations_received,
+            troops=self.troops(player.troops),
+            heroes=self.troops(player.heroes),
+            spells=self.troops(player.spells),
+            achievements=self.achievements(player.achievements),
+            league=self._share_model(player.league),
+            clan=_intern(player.clan),
+            role=_intern(player.role),
+            war_preference=_intern(player.war_preference),
+            town_hall_weapon_level=player.town_hall_weapon_level,
+        )
+
+    def clan(self, clan: Clan | Mapping[str, Any]) -> CompactClan:
+        """
+        Build compact clan.
+
+        Parameters
+        ----------
+        clan : Clan | dict
+            Clan model or raw clan data (``decode='raw'``)
+        """
+
+        if not isinstance(clan, Clan):
+            clan = Clan.construct_trusted(clan)
+
+        war = clan.war
+        return CompactClan(
+            tag=sys.intern(clan.tag),
+            name=clan.name,
+            type=sys.intern(clan.type),
+            description=clan.description,
+            badge_urls=self._share_badge(clan.badge_urls),
+            required_trophies=clan.required_trophies,
+            required_versus_trophies=clan.required_versus_trophies,
+            required_townhall_level=clan.required_townhall_level,
+            labels=self._share_labels(clan.labels),
+            clan_level=clan.clan_level,
+            clan_points=clan.clan_points,
+            clan_versus_points=clan.clan_versus_points,
+            member_list=tuple(sys.intern(tag) for tag in clan.member_list),
+            location=self._share_model(clan.location),
+            chat_language=self._share_model(clan.chat_language),
+            war_wins=war.wins,
+            war_losses=war.losses,
+            war_ties=war.ties,
+            war_win_streak=war.win_streak,
+            is_war_log_public=war.is_war_log_public,
+            war_league=self._share_model(war.league),
+            war_frequency=sys.intern(war.frequency),
+            war_state=_intern(war.state),
+            war_currentwar=war.currentwar and pack(war.currentwar),
+            war_log=None if war.log is None else tuple(pack(item) for item in war.log),
+        )
+
+    def troops(self, troops: Iterable[PlayerTroop]) -> CompactTroops:
+        """Build compact troops (heroes, spells) of one player"""
+
+        schema = []
+        levels = []
+        flags = []
+        for troop in troops:
+            schema.append(
+                self.share(
+                    TroopInfo(sys.intern(troop.name), troop.village, troop.max_level)
+                )
+            )
+            levels.append(troop.level)
+            flags.append(SUPER_TROOP_FLAGS[troop.super_troop_is_active])
+
+        return CompactTroops(
+            schema=self.share(tuple(schema)),
+            levels=_pack_levels(levels),
+            super_troop_flags=self.share(bytes(flags)),
+        )
+
+    def achievements(
+        self, achievements: Iterable[PlayerAchievment]
+    ) -> CompactAchievements:
+        """Build compact achievements of one player"""
+
+        schema = []
+        values = array.array("q")
+        completion_info = []
+        for achievement in achievements:
+            schema.append(
+                self.share(
+                    AchievementInfo(
+                        sys.intern(achievement.name),
+                        achievement.stars,
+                        achievement.target,
+                        sys.intern(achievement.info),
+                        achievement.village,
+                    )
+                )
+            )
+            values.append(achievement.value)
+            completion_info.append(_intern(achievement.completion_info))
+
+        return CompactAchievements(
+            schema=self.share(tuple(schema)),
+            values=values,
+            completion_info=tuple(completion_info),
+        )
+
+    def _share_model(self, model: Optional[Shared]) -> Optional[Shared]:
+        # models are shared only if all fields are equal, validated models
+        # of some types are lowercased, unlike constructed ones
+        if model is None:
+            return None
+        return self._shared.setdefault(_model_key(model), model)
+
+    def _share_labels(self, labels: list[ClanLabel]) -> tuple[ClanLabel, ...]:
+        key = (ClanLabel, tuple(_model_key(label) for label in labels))
+        shared = self._shared.get(key)
+        if shared is None:
+            shared = self._shared[key] = tuple(
+                self._share_model(label) for label in labels
+            )
+        return shared
+
+    def _share_badge(self, badge: BadgeURLs) -> BadgeURLs:
+        return self._share_model(badge)
+
+
+def _model_key(value: Any) -> Hashable:
+    """Hashable key of model that is equal for models with equal fields"""
+
+    if isinstance(value, DefaultBaseModel):
+        return type(value), tuple(
+            (name, _model_key(field)) for name, field in value.__dict__.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_model_key(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _model_key(item)) for key, item in value.items())
+    return value
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+def _pack_levels(levels: list[int]) -> Levels:
+    try:
+        return bytes(levels)
+    except ValueError:  # some level is out of byte range
+        return tuple(levels)
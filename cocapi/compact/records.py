@@ -0,0 +1,259 @@
+"""
+Memory-lean records of players and clans.
+
+Records are named tuples: strings repeated by every player (troop names,
+achievement descriptions, leagues, etc.) are kept once in ``Catalog``
+and records only reference them, levels are packed into ``bytes``
+and achievement values into ``array``.
+Deeply nested models (e.g. current war) are packed into plain tuples.
+"""
+
+from typing import Any, NamedTuple, Optional, Type, TypeVar
+import array
+import sys
+
+from pydantic.fields import ModelField, SHAPE_LIST
+
+from ..types import (
+    aliases,
+    BadgeURLs,
+    Clan,
+    ClanChatLanguage,
+    ClanLabel,
+    ClanWar,
+    ClanWarInfo,
+    ClanWarLeague,
+    ClanWarResult,
+    Location,
+    Player,
+    PlayerAchievment,
+    PlayerLeague,
+    PlayerTroop,
+)
+from ..types.base import DefaultBaseModel
+
+Model = TypeVar("Model", bound=DefaultBaseModel)
+Packed = tuple
+"""Model packed with ``pack``: field values in field order, nested models are packed too"""
+Levels = bytes | tuple[int, ...]
+"""Troop levels, ``bytes`` unless some level does not fit in a byte"""
+
+SUPER_TROOP_FLAGS: dict[Optional[bool], int] = {None: 0, False: 1, True: 2}
+SUPER_TROOP_VALUES: tuple[Optional[bool], ...] = (None, False, True)
+
+
+class TroopInfo(NamedTuple):
+    """Shared metadata of troop, hero or spell"""
+
+    name: str
+    village: aliases.Village
+    max_level: int
+
+
+class AchievementInfo(NamedTuple):
+    """Shared metadata of achievement stage"""
+
+    name: str
+    stars: int
+    target: int
+    info: str
+    village: aliases.Village
+
+
+class CompactTroops(NamedTuple):
+    """
+    Troops (heroes, spells) of one player.
+
+    ``schema`` is shared by all players with the same troops,
+    ``levels`` and ``super_troop_flags`` have one byte per troop
+    (``super_troop_is_active`` is encoded as ``SUPER_TROOP_FLAGS``).
+    """
+
+    schema: tuple[TroopInfo, ...]
+    levels: Levels
+    super_troop_flags: bytes
+
+    def __len__(self):
+        return len(self.schema)
+
+    def to_models(self) -> list[PlayerTroop]:
+        return [
+            PlayerTroop.construct(
+                name=info.name,
+                level=level,
+                max_level=info.max_level,
+                village=info.village,
+                super_troop_is_active=SUPER_TROOP_VALUES[flag],
+            )
+            for info, level, flag in zip(
+                self.schema, self.levels, self.super_troop_flags
+            )
+        ]
+
+
+class CompactAchievements(NamedTuple):
+    """Achievements of one player, ``schema`` is shared like in ``CompactTroops``"""
+
+    schema: tuple[AchievementInfo, ...]
+    values: array.array
+    completion_info: tuple[Optional[str], ...]
+
+    def to_models(self) -> list[PlayerAchievment]:
+        return [
+            PlayerAchievment.construct(
+                name=info.name,
+                stars=info.stars,
+                value=value,
+                target=info.target,
+                info=info.info,
+                village=info.village,
+                completion_info=completion_info,
+            )
+            for info, value, completion_info in zip(
+                self.schema, self.values, self.completion_info
+            )
+        ]
+
+
+class CompactPlayer(NamedTuple):
+    """Memory-lean ``Player``, build it with ``Catalog.player``"""
+
+    tag: aliases.Tag
+    name: str
+    town_hall_level: int
+    builder_hall_level: int
+    exp_level: int
+    trophies: int
+    best_trophies: int
+    war_stars: int
+    attack_wins: int
+    defense_wins: int
+    versus_trophies: int
+    best_versus_trophies: int
+    versus_battle_wins: int
+    donations: int
+    donations_received: int
+    troops: CompactTroops
+    heroes: CompactTroops
+    spells: CompactTroops
+    achievements: CompactAchievements
+    league: Optional[PlayerLeague]
+    clan: Optional[aliases.Tag]
+    role: Optional[aliases.ClanRole]
+    war_preference: Optional[aliases.ClanWarPreference]
+    town_hall_weapon_level: Optional[int]
+
+    def to_model(self) -> Player:
+        """Convert back to ``Player``, shared models (e.g. league) are reused"""
+
+        values = self._asdict()
+        for field in ("troops", "heroes", "spells", "achievements"):
+            values[field] = values[field].to_models()
+        return Player.construct(**values)
+
+
+class CompactClan(NamedTuple):
+    """
+    Memory-lean ``Clan``, build it with ``Catalog.clan``.
+    War fields are flattened, current war and war log entries are packed with ``pack``.
+    """
+
+    tag: aliases.Tag
+    name: str
+    type: aliases.ClanType
+    description: str
+    badge_urls: BadgeURLs
+    required_trophies: int
+    required_versus_trophies: int
+    required_townhall_level: int
+    labels: tuple[ClanLabel, ...]
+    clan_level: int
+    clan_points: int
+    clan_versus_points: int
+    member_list: tuple[aliases.Tag, ...]
+    location: Optional[Location]
+    chat_language: Optional[ClanChatLanguage]
+    war_wins: int
+    war_losses: int
+    war_ties: int
+    war_win_streak: int
+    is_war_log_public: bool
+    war_league: ClanWarLeague
+    war_frequency: aliases.ClanWarFrequency
+    war_state: Optional[aliases.ClanWarState]
+    war_currentwar: Optional[Packed]
+    war_log: Optional[tuple[Packed, ...]]
+
+    def to_model(self) -> Clan:
+        """Convert back to ``Clan``, shared models (e.g. labels) are reused"""
+
+        values = self._asdict()  # type: dict[str, Any]
+        currentwar = values.pop("war_currentwar")
+        log = values.pop("war_log")
+        war = ClanWar.construct(
+            wins=values.pop("war_wins"),
+            losses=values.pop("war_losses"),
+            ties=values.pop("war_ties"),
+            win_streak=values.pop("war_win_streak"),
+            is_war_log_public=values.pop("is_war_log_public"),
+            league=values.pop("war_league"),
+            frequency=values.pop("war_frequency"),
+            state=values.pop("war_state"),
+            currentwar=currentwar and unpack(ClanWarInfo, currentwar),
+            log=None if log is None else [unpack(ClanWarResult, item) for item in log],
+        )
+        values["labels"] = list(self.labels)
+        values["member_list"] = list(self.member_list)
+        return Clan.construct(war=war, **values)
+
+
+def pack(model: DefaultBaseModel) -> Packed:
+    """
+    Pack model into tuple of field values (strings are interned),
+    nested models are packed recursively. Use ``unpack`` to get model back.
+
+    Examples
+    --------
+    >>> pack(attack)
+    (3, 1, 150, '#2PP', '#2PY', 100.0)
+    >>> unpack(ClanWarAttack, pack(attack)) == attack
+    True
+    """
+
+    return tuple(
+        _pack_value(field, getattr(model, name))
+        for name, field in type(model).__fields__.items()
+    )
+
+
+def unpack(model_type: Type[Model], values: Packed) -> Model:
+    """Build model from ``pack`` result without validation"""
+
+    return model_type.construct(
+        **{
+            name: _unpack_value(field, value)
+            for (name, field), value in zip(model_type.__fields__.items(), values)
+        }
+    )
+
+
+def _pack_value(field: ModelField, value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if value is None or not _is_model_field(field):
+        return value
+    if field.shape == SHAPE_LIST:
+        return tuple(pack(item) for item in value)
+    return pack(value)
+
+
+def _unpack_value(field: ModelField, value: Any) -> Any:
+    if value is None or not _is_model_field(field):
+        return value
+    if field.shape == SHAPE_LIST:
+        return [unpack(field.type_, item) for item in value]
+    return unpack(field.type_, value)
+
+
+def _is_model_field(field: ModelField) -> bool:
+    return isinstance(field.type_, type) and issubclass(field.type_, DefaultBaseModel)
@@ -0,0 +1,3 @@
+from .discovery import ClanDiscovery, DiscoveryStats, SearchPartition
+
+__all__ = ("ClanDiscovery", "DiscoveryStats", "SearchPartition")
@@ -0,0 +1,193 @@
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
+from dataclasses import dataclass, field, replace
+import typing
+
+from .. import utils
+from ..client import Client
+from ..types import aliases
+
+MIN_MEMBERS = 1
+MAX_MEMBERS = 50
+WAR_FREQUENCIES: tuple[aliases.ClanWarFrequency, ...] = typing.get_args(
+    aliases.ClanWarFrequency
+)
+
+
+@dataclass(frozen=True)
+class SearchPartition:
+    """
+    Part of clan search space, i.e. set of ``Client.clans`` filters.
+
+    Members range and war frequency split the search space into disjoint parts.
+    Clan level, clan points and labels can only narrow the search,
+    they are used when disjoint splits are exhausted.
+    """
+
+    min_members: int = MIN_MEMBERS
+    max_members: int = MAX_MEMBERS
+    war_frequency: Optional[aliases.ClanWarFrequency] = None
+    min_clan_level: Optional[int] = None
+    min_clan_points: Optional[int] = None
+    label: Optional[aliases.LabelName] = None
+
+    def filters(self) -> dict[str, Any]:
+        """Keyword arguments for ``Client.clans``"""
+        return {
+            "min_members": self.min_members if self.min_members > MIN_MEMBERS else None,
+            "max_members": self.max_members if self.max_members < MAX_MEMBERS else None,
+            "war_frequency": self.war_frequency,
+            "min_clan_level": self.min_clan_level,
+            "min_clan_points": self.min_clan_points,
+            "labels": self.label,
+        }
+
+
+@dataclass
+class DiscoveryStats:
+    requests: int = 0
+    """Number of search requests"""
+    capped: int = 0
+    """Number of searches that hit the result cap"""
+    unresolved: int = 0
+    """Number of capped searches that could not be split further"""
+    clans: int = 0
+    """Number of unique discovered clans"""
+    failed: list[SearchPartition] = field(default_factory=list)
+    """Searches that failed (e.g. ran out of retries), their clans can be missed.
+    Pass them as ``root`` to search them again"""
+
+
+@dataclass
+class ClanDiscovery:
+    """
+    Find (nearly) all clans matching the base filters (e.g. location).
+
+    Clan search returns at most ``cap`` clans, so every search that hits the cap
+    is split into smaller searches, recursively:
+
+    1. members range is halved until it is a single value
+    2. then every war frequency is searched separately
+    3. then clans with at least ``clan_level_steps`` levels,
+       then with at least ``clan_points_steps`` points,
+       then with every label in ``labels`` are searched
+
+    Steps 1-2 split the search space into disjoint parts, so clans are not missed.
+    Step 3 only narrows searches, it finds more clans of big searches,
+    but clans can still be missed (see ``DiscoveryStats.unresolved``).
+    Failed searches do not stop discovery, they are recorded in ``DiscoveryStats.failed``.
+
+    Searches of the same depth run concurrently, found tags are deduplicated
+    and yielded as soon as they are received.
+
+    Fields
+    ------
+    client : Client
+        Client to make requests with
+    cap : int
+        Maximum number of clans returned by one search (``limit`` of every search)
+    concurrency : int
+        Maximum number of concurrent searches
+    clan_level_steps : Sequence[int]
+        Minimum clan levels to narrow capped searches with
+    clan_points_steps : Sequence[int]
+        Minimum clan points to narrow capped searches with
+    labels : Sequence[str]
+        Clan labels to narrow capped searches with, no labels by default
+    stats : DiscoveryStats
+        Statistics of the last ``ClanDiscovery.run``
+
+    Examples
+    --------
+    >>> discovery = ClanDiscovery(client, concurrency=20)
+    >>> async for tags in discovery.run(location='ru'):
+    ...     print(len(tags), 'new clans')
+    >>> print(discovery.stats)
+    """
+
+    client: Client
+    cap: aliases.PositiveInt = 1000
+    concurrency: aliases.PositiveInt = 10
+    clan_level_steps: Sequence[int] = (5, 10, 15, 20)
+    clan_points_steps: Sequence[int] = (10_000, 20_000, 30_000, 40_000, 50_000)
+    labels: Sequence[aliases.LabelName] = ()
+    stats: DiscoveryStats = field(init=False, default_factory=DiscoveryStats)
+
+    async def run(
+        self,
+        *,
+        location: Optional[aliases.LocationName | aliases.CountryCode] = None,
+        name: Optional[str] = None,
+        root: Optional[SearchPartition] = None,
+    ) -> AsyncIterator[list[aliases.Tag]]:
+        """
+        Run discovery.
+
+        Parameters
+        ----------
+        location : str
+            Location name or country code
+        name : str
+            Clan name
+        root : SearchPartition
+            Initial filters, the whole search space by default
+
+        Yields
+        ------
+        list[str]
+            Tags of newly discovered clans, every tag is yielded once
+        """
+
+        self.stats = DiscoveryStats()
+        seen = set()  # type: set[aliases.Tag]
+
+        async def search(partition: SearchPartition):
+            return await self.client.clans(
+                name=name, location=location, limit=self.cap, **partition.filters()
+            )
+
+        frontier = [root or SearchPartition()]
+        while frontier:
+            next_frontier = []  # type: list[SearchPartition]
+
+            async for partition, tags in utils.bounded_map(
+                search, frontier, concurrency=self.concurrency
+            ):
+                self.stats.requests += 1
+                if isinstance(tags, Exception):
+                    self.stats.failed.append(partition)
+                    continue
+
+                new_tags = [tag for tag in tags if tag not in seen]
+                seen.update(new_tags)
+                self.stats.clans = len(seen)
+                if new_tags:
+                    yield new_tags
+
+                if len(tags) >= self.cap:
+                    self.stats.capped += 1
+                    parts = list(self.split(partition))
+                    if not parts:
+                        self.stats.unresolved += 1
+                    next_frontier.extend(parts)
+
+            frontier = next_frontier
+
+    def split(self, partition: SearchPartition) -> Iterator[SearchPartition]:
+        """Split capped search into smaller ones"""
+
+        if partition.min_members < partition.max_members:
+            middle = (partition.min_members + partition.max_members) // 2
+            yield replace(partition, max_members=middle)
+            yield replace(partition, min_members=middle + 1)
+        elif partition.war_frequency is None:
+            for war_frequency in WAR_FREQUENCIES:
+                yield replace(partition, war_frequency=war_frequency)
+        elif partition.min_clan_level is None:
+            for level in self.clan_level_steps:
+                yield replace(partition, min_clan_level=level)
+        elif partition.min_clan_points is None:
+            for points in self.clan_points_steps:
+                yield replace(partition, min_clan_points=points)
+        elif partition.label is None:
+            for label in self.labels:
+                yield replace(partition, label=label)
@@ -0,0 +1,10 @@
+from .leaderboard import Leaderboard, LeaderboardEntry
+from .snapshot import RankingDiff, RankingKind, RankingSnapshot
+
+__all__ = (
+    "Leaderboard",
+    "LeaderboardEntry",
+    "RankingSnapshot",
+    "RankingDiff",
+    "RankingKind",
+)
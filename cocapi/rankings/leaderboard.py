@@ -0,0 +1,116 @@
+from typing import Iterator, NamedTuple, Optional
+import heapq
+import itertools
+
+from ..types import aliases
+from .snapshot import RankingKind, RankingSnapshot
+
+
+class LeaderboardEntry(NamedTuple):
+    tag: aliases.Tag
+    name: str
+    score: int
+    level: int
+    clan_tag: Optional[aliases.Tag]
+    location_id: int
+
+
+class Leaderboard:
+    """
+    Global leaderboard built from rankings of many locations.
+
+    Snapshots can be added one by one as they arrive,
+    ``Leaderboard.top`` lazily merges all of them (k-way merge with a heap)
+    by score, so getting top ``n`` entries takes ``O(n log k)`` for ``k`` locations.
+    Entries that appear in several locations are yielded only once, with the best score.
+
+    Parameters
+    ----------
+    kind : str
+        Rankings kind, see ``RankingKind``
+
+    Examples
+    --------
+    >>> leaderboard = Leaderboard('players')
+    >>> async for location_id, snapshot in client.crawl_rankings('players'):
+    ...     if not isinstance(snapshot, Exception):
+    ...         leaderboard.add(snapshot)
+    >>> for entry in leaderboard.top(10):
+    ...     print(entry.tag, entry.score)
+    """
+
+    kind: RankingKind
+    errors: dict[int, Exception]
+    """Errors of locations that failed to load, by location id"""
+    _snapshots: dict[int, RankingSnapshot]
+
+    def __init__(self, kind: RankingKind = "players"):
+        self.kind = kind
+        self.errors = {}
+        self._snapshots = {}
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    @property
+    def snapshots(self):
+        return tuple(self._snapshots.values())
+
+    def add(self, snapshot: RankingSnapshot):
+        """Add or replace rankings of snapshot location"""
+
+        if snapshot.kind != self.kind:
+            raise ValueError(
+                f"Expected '{self.kind}' rankings, got '{snapshot.kind}' rankings"
+            )
+        self._snapshots[snapshot.location_id] = snapshot
+        self.errors.pop(snapshot.location_id, None)
+
+    def top(
+        self, n: Optional[aliases.PositiveInt] = None
+    ) -> Iterator[LeaderboardEntry]:
+        """
+        Iterate over deduplicated entries of all locations in descending score order.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of entries, all entries by default
+        """
+
+        snapshots = list(self._snapshots.values())
+        # ranking entries are already ordered by score,
+        # so only the heads of all snapshots are compared
+        merged = heapq.merge(
+            *(_iter_keys(index, snapshot) for index, snapshot in enumerate(snapshots))
+        )
+
+        entries = self._iter_entries(merged, snapshots)
+        return entries if n is None else itertools.islice(entries, n)
+
+    @staticmethod
+    def _iter_entries(
+        merged: Iterator[tuple[int, int, int]], snapshots: list[RankingSnapshot]
+    ) -> Iterator[LeaderboardEntry]:
+        # snapshot tags are interned, so hashes and comparisons are cheap
+        seen = set()  # type: set[aliases.Tag]
+        for _, index, position in merged:
+            snapshot = snapshots[index]
+            tag = snapshot.tags[position]
+            if tag in seen:
+                continue
+
+            seen.add(tag)
+            yield LeaderboardEntry(
+                tag=tag,
+                name=snapshot.names[position],
+                score=int(snapshot.score[position]),
+                level=int(snapshot.level[position]),
+                clan_tag=snapshot.clan_tags[position],
+                location_id=snapshot.location_id,
+            )
+
+
+def _iter_keys(index: int, snapshot: RankingSnapshot) -> Iterator[tuple[int, int, int]]:
+    for position, score in enumerate(snapshot.score):
+        yield -score, index, position
@@ -0,0 +1,212 @@
+from typing import Any, Iterable, Literal, Optional, Sequence
+from dataclasses import dataclass, field
+import array
+import sys
+
+try:
+    import numpy
+except ImportError:  # numpy is optional
+    numpy = None  # type: ignore
+
+from ..types import aliases
+
+RankingKind = Literal["clans", "players", "clans-versus", "players-versus"]
+Column = Any
+"""``numpy.ndarray`` (``int32``) if numpy is installed, otherwise ``array.array('i')``"""
+
+SCORE_FIELDS: dict[str, str] = {
+    "clans": "clanPoints",
+    "players": "trophies",
+    "clans-versus": "clanVersusPoints",
+    "players-versus": "versusTrophies",
+}
+LEVEL_FIELDS: dict[str, str] = {
+    "clans": "clanLevel",
+    "players": "expLevel",
+    "clans-versus": "clanLevel",
+    "players-versus": "expLevel",
+}
+
+
+def make_column(values: Iterable[int]) -> Column:
+    if numpy is not None:
+        return numpy.fromiter(values, dtype=numpy.int32)
+    return array.array("i", values)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+@dataclass
+class RankingSnapshot:
+    """
+    Compact struct-of-arrays snapshot of location rankings.
+
+    Every column has one value per entry in ranking order.
+    Numeric columns are ``numpy`` arrays if numpy is installed,
+    otherwise ``array.array``. Tags are interned, so the same tags
+    in many snapshots are stored only once.
+
+    Fields
+    ------
+    kind : str
+        Rankings kind, see ``RankingKind``
+    location_id : int
+        Location id
+    tags : list[str]
+        Clan or player tags
+    names : list[str]
+        Clan or player names
+    rank : Column
+        Current rank
+    previous_rank : Column
+        Rank in the previous snapshot of the API, ``0`` if entry was not ranked
+    score : Column
+        Trophies (players) or clan points (clans), versus ones for versus rankings
+    level : Column
+        Experience level (players) or clan level (clans)
+    clan_tags : list[str | None]
+        Player clan tags, ``None`` for clans and players without clan
+    """
+
+    kind: RankingKind
+    location_id: int
+    tags: list[aliases.Tag]
+    names: list[str]
+    rank: Column
+    previous_rank: Column
+    score: Column
+    level: Column
+    clan_tags: list[Optional[aliases.Tag]]
+
+    _index: Optional[dict[aliases.Tag, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_items(
+        cls,
+        kind: RankingKind,
+        location_id: int,
+        items: Sequence[dict[str, Any]],
+    ) -> "RankingSnapshot":
+        """Build snapshot from raw ranking items"""
+
+        score_field = SCORE_FIELDS[kind]
+        level_field = LEVEL_FIELDS[kind]
+        return cls(
+            kind=kind,
+            location_id=location_id,
+            tags=[sys.intern(item["tag"]) for item in items],
+            names=[item["name"] for item in items],
+            rank=make_column(item["rank"] for item in items),
+            previous_rank=make_column(item.get("previousRank", 0) for item in items),
+            score=make_column(item.get(score_field, 0) for item in items),
+            level=make_column(item.get(level_field, 0) for item in items),
+            clan_tags=[_intern(item.get("clan", {}).get("tag")) for item in items],
+        )
+
+    def __len__(self):
+        return len(self.tags)
+
+    @property
+    def index(self) -> dict[aliases.Tag, int]:
+        """Position of every tag, built on first use"""
+        if self._index is None:
+            self._index = {tag: position for position, tag in enumerate(self.tags)}
+        return self._index
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the snapshot, interned tags are not counted"""
+        columns = (self.rank, self.previous_rank, self.score, self.level)
+        return (
+            sum(_column_nbytes(column) for column in columns)
+            + sys.getsizeof(self.tags)
+            + sys.getsizeof(self.clan_tags)
+            + sys.getsizeof(self.names)
+            + sum(sys.getsizeof(name) for name in self.names)
+        )
+
+    def diff(self, old: "RankingSnapshot") -> "RankingDiff":
+        """
+        Compare this snapshot with an older one.
+
+        Parameters
+        ----------
+        old : RankingSnapshot
+            Older snapshot of the same rankings
+
+        Returns
+        -------
+        RankingDiff
+            Changes of every entry of this snapshot
+
+        Examples
+        --------
+        >>> diff = new.diff(old)
+        >>> for tag, delta in zip(diff.tags, diff.rank_delta):
+        ...     print(tag, 'moved', delta)
+        """
+
+        old_index = old.index
+        positions = [old_index.get(tag, -1) for tag in self.tags]
+
+        if numpy is not None:
+            positions_array = numpy.array(positions, dtype=numpy.int64)
+            is_new = positions_array < 0
+            if len(old):
+                found = numpy.where(is_new, 0, positions_array)
+                rank_delta = numpy.where(is_new, 0, old.rank[found] - self.rank)
+                score_delta = numpy.where(is_new, 0, self.score - old.score[found])
+            else:  # every entry is new, there is nothing to index
+                rank_delta = numpy.zeros(len(self), dtype=numpy.int32)
+                score_delta = numpy.zeros(len(self), dtype=numpy.int32)
+        else:
+            is_new = [position < 0 for position in positions]
+            rank_delta = make_column(
+                0 if position < 0 else old.rank[position] - rank
+                for position, rank in zip(positions, self.rank)
+            )
+            score_delta = make_column(
+                0 if position < 0 else score - old.score[position]
+                for position, score in zip(positions, self.score)
+            )
+
+        current = self.index
+        left = [tag for tag in old.tags if tag not in current]
+        return RankingDiff(self.tags, rank_delta, score_delta, is_new, left)
+
+
+@dataclass
+class RankingDiff:
+    """
+    Changes between two ranking snapshots.
+
+    Fields
+    ------
+    tags : list[str]
+        Tags of the newer snapshot
+    rank_delta : Column
+        How many places every entry moved up (negative if moved down), ``0`` for new entries
+    score_delta : Column
+        Score change of every entry, ``0`` for new entries
+    is_new : Column
+        Whether entry is absent in the older snapshot
+        (``numpy`` bool array or list of bools)
+    left : list[str]
+        Tags that are absent in the newer snapshot
+    """
+
+    tags: list[aliases.Tag]
+    rank_delta: Column
+    score_delta: Column
+    is_new: Any
+    left: list[aliases.Tag]
+
+
+def _column_nbytes(column: Column) -> int:
+    if isinstance(column, array.array):
+        return column.itemsize * len(column)
+    return column.nbytes
@@ -0,0 +1,3 @@
+from .matrix import RosterMatrix, TroopIndex, TroopKey, TroopKind
+
+__all__ = ("RosterMatrix", "TroopIndex", "TroopKey", "TroopKind")
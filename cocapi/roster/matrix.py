@@ -0,0 +1,341 @@
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+from dataclasses import dataclass
+import array
+import typing
+
+try:
+    import numpy
+except ImportError:  # numpy is optional
+    numpy = None  # type: ignore
+
+from ..compact import CompactPlayer
+from ..types import aliases, Player
+
+TroopKind = Literal["troops", "heroes", "spells"]
+"""Player field the troop is listed in"""
+TROOP_KINDS: tuple[TroopKind, ...] = typing.get_args(TroopKind)
+Matrix = Any
+"""``numpy.ndarray`` (``int16``, players x columns) if numpy is installed,
+otherwise row-major ``array.array('h')``"""
+Column = Any
+"""``numpy.ndarray`` if numpy is installed, otherwise ``array.array`` or list"""
+AnyPlayer = Player | CompactPlayer | Mapping[str, Any]
+
+
+class TroopKey(NamedTuple):
+    kind: TroopKind
+    name: str
+    village: aliases.Village
+
+
+class TroopIndex:
+    """
+    Stable troop dictionary: every troop (hero, spell) gets its own column
+    the first time it is seen, columns are never reordered or removed,
+    so matrices built with the same index have compatible columns.
+
+    Parameters
+    ----------
+    keys : Iterable[TroopKey]
+        Initial columns, e.g. ``TroopIndex.keys`` of another index
+    """
+
+    keys: list[TroopKey]
+    """Troop of every column"""
+    _columns: dict[tuple[str, str, str], int]
+
+    def __init__(self, keys: Iterable[TroopKey] = ()):
+        self.keys = []
+        self._columns = {}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, key: tuple[TroopKind, str, aliases.Village]) -> int:
+        """Column of troop, new troops are appended"""
+
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = len(self.keys)
+            self.keys.append(TroopKey(*key))
+        return column
+
+    def get(self, key: tuple[TroopKind, str, aliases.Village]) -> Optional[int]:
+        return self._columns.get(key)
+
+    def select(
+        self,
+        kind: Optional[TroopKind] = None,
+        names: Optional[Iterable[str]] = None,
+        village: Optional[aliases.Village] = None,
+    ) -> list[int]:
+        """
+        Columns of troops matching all given filters.
+
+        Parameters
+        ----------
+        kind : str
+            Troop kind, see ``TroopKind``
+        names : Iterable[str]
+            Troop names
+        village : str
+            Village of troops
+        """
+
+        name_set = None if names is None else set(names)
+        return [
+            column
+            for column, key in enumerate(self.keys)
+            if (kind is None or key.kind == kind)
+            and (name_set is None or key.name in name_set)
+            and (village is None or key.village == village)
+        ]
+
+
+def iter_troops(player: AnyPlayer) -> Iterator[tuple[tuple[str, str, str], int, int]]:
+    """Iterate over ``((kind, name, village), level, max_level)`` of all player troops"""
+
+    for kind in TROOP_KINDS:
+        if isinstance(player, CompactPlayer):
+            troops = getattr(player, kind)
+            for info, level in zip(troops.schema, troops.levels):
+                yield (kind, info.name, info.village), level, info.max_level
+        elif isinstance(player, Player):
+            for troop in getattr(player, kind):
+                yield (kind, troop.name, troop.village), troop.level, troop.max_level
+        else:
+            for data in player.get(kind) or ():
+                key = (kind, data["name"], data["village"])
+                yield key, data["level"], data["maxLevel"]
+
+
+@dataclass
+class RosterMatrix:
+    """
+    Troop, hero and spell levels of many players as two matrices
+    (levels and max levels) with one row per player and one column per troop.
+    Troops that player has not unlocked have zero level and zero max level.
+
+    Matrices are ``numpy`` arrays if numpy is installed, so roster queries
+    are vectorized instead of looping over models.
+    Otherwise they are ``array.array`` and queries are computed in pure python:
+    the matrix is still compact, but ``gap`` and ``within_max`` are about as fast
+    as (sometimes slower than) a plain loop over models, see ``benchmarks/bench_roster.py``.
+
+    Fields
+    ------
+    index : TroopIndex
+        Troop of every column, may be shared with other matrices
+    tags : list[str]
+        Player tags in row order
+    levels : Matrix
+        Troop levels
+    max_levels : Matrix
+        Troop max levels
+    width : int
+        Number of columns (index can grow after the matrix is built)
+
+    Examples
+    --------
+    >>> matrix = RosterMatrix.from_players(players)
+    >>> heroes = matrix.columns(kind='heroes', village='home')
+    >>> matrix.select(matrix.within_max(2, heroes))
+    ['#LJJOUY2U8', ...]
+    >>> matrix.rush_score()
+    array([0.12, 0.4 , ...])
+    """
+
+    index: TroopIndex
+    tags: list[aliases.Tag]
+    levels: Matrix
+    max_levels: Matrix
+    width: int
+
+    @classmethod
+    def from_players(
+        cls, players: Iterable[AnyPlayer], index: Optional[TroopIndex] = None
+    ) -> "RosterMatrix":
+        """
+        Build matrix from players.
+
+        Parameters
+        ----------
+        players : Iterable[Player | CompactPlayer | dict]
+            Player models, compact players or raw player data (``decode='raw'``)
+        index : TroopIndex
+            Troop dictionary to use (new troops are added to it),
+            a new one by default
+        """
+
+        index = TroopIndex() if index is None else index
+        add = index.add
+        tags = []
+        # flat cells of all players, ``row_ends[row]`` is the end of row cells
+        columns = []  # type: list[int]
+        level_values = []  # type: list[int]
+        max_values = []  # type: list[int]
+        row_ends = []  # type: list[int]
+        for player in players:
+            tags.append(player["tag"] if isinstance(player, Mapping) else player.tag)
+            for key, level, max_level in iter_troops(player):
+                columns.append(add(key))
+                level_values.append(level)
+                max_values.append(max_level)
+            row_ends.append(len(columns))
+
+        height, width = len(tags), len(index)
+        if numpy is not None:
+            rows = numpy.repeat(
+                numpy.arange(height),
+                numpy.diff(row_ends, prepend=0).astype(numpy.int64),
+            )
+            levels = numpy.zeros((height, width), dtype=numpy.int16)
+            max_levels = numpy.zeros((height, width), dtype=numpy.int16)
+            levels[rows, columns] = level_values
+            max_levels[rows, columns] = max_values
+        else:
+            levels = array.array("h", bytes(2 * height * width))
+            max_levels = array.array("h", bytes(2 * height * width))
+            start = 0
+            for row, end in enumerate(row_ends):
+                base = row * width
+                for position in range(start, end):
+                    levels[base + columns[position]] = level_values[position]
+                    max_levels[base + columns[position]] = max_values[position]
+                start = end
+
+        return cls(index, tags, levels, max_levels, width)
+
+    def __len__(self):
+        return len(self.tags)
+
+    def columns(
+        self,
+        kind: Optional[TroopKind] = None,
+        names: Optional[Iterable[str]] = None,
+        village: Optional[aliases.Village] = None,
+    ) -> list[int]:
+        """Columns of troops matching all given filters, see ``TroopIndex.select``"""
+        return [
+            column
+            for column in self.index.select(kind, names, village)
+            if column < self.width
+        ]
+
+    def gap(self, columns: Optional[Sequence[int]] = None) -> Column:
+        """
+        Upgrade gap: number of levels left to max out unlocked troops.
+
+        Parameters
+        ----------
+        columns : Sequence[int]
+            Troops to take into account, all troops by default
+        """
+
+        if numpy is not None:
+            levels, max_levels = self._select(columns)
+            return (max_levels - levels).sum(axis=1, dtype=numpy.int32)
+
+        return array.array(
+            "l",
+            (
+                sum(max_level - level for level, max_level in zip(levels, max_levels))
+                for levels, max_levels in self._iter_rows(columns)
+            ),
+        )
+
+    def rush_score(self, columns: Optional[Sequence[int]] = None) -> Column:
+        """
+        Rush score: part of max levels of unlocked troops that are not upgraded yet,
+        from ``0`` (everything is maxed) to ``1``.
+
+        Parameters
+        ----------
+        columns : Sequence[int]
+            Troops to take into account, all troops by default
+        """
+
+        if numpy is not None:
+            levels, max_levels = self._select(columns)
+            total = max_levels.sum(axis=1, dtype=numpy.int32)
+            gap = total - levels.sum(axis=1, dtype=numpy.int32)
+            return numpy.divide(
+                gap,
+                total,
+                out=numpy.zeros(len(gap), dtype=numpy.float64),
+                where=total > 0,
+            )
+
+        scores = array.array("d")
+        for levels, max_levels in self._iter_rows(columns):
+            total = sum(max_levels)
+            scores.append((total - sum(levels)) / total if total else 0.0)
+        return scores
+
+    def within_max(
+        self, levels: int, columns: Optional[Sequence[int]] = None
+    ) -> Column:
+        """
+        Which players have every troop unlocked and at most ``levels`` levels below max.
+
+        Parameters
+        ----------
+        levels : int
+            Maximum number of levels below max
+        columns : Sequence[int]
+            Troops to check, all troops by default
+
+        Returns
+        -------
+        Column
+            ``numpy`` bool array or list of bools, one per player
+        """
+
+        if numpy is not None:
+            current, max_levels = self._select(columns)
+            return ((current > 0) & (max_levels - current <= levels)).all(axis=1)
+
+        return [
+            all(
+                level > 0 and max_level - level <= levels
+                for level, max_level in zip(row_levels, row_max_levels)
+            )
+            for row_levels, row_max_levels in self._iter_rows(columns)
+        ]
+
+    def select(self, mask: Iterable[bool]) -> list[aliases.Tag]:
+        """Tags of players where ``mask`` is true"""
+        return [tag for tag, selected in zip(self.tags, mask) if selected]
+
+    def _select(self, columns: Optional[Sequence[int]]) -> tuple[Matrix, Matrix]:
+        if columns is None:
+            return self.levels, self.max_levels
+        columns = list(columns)
+        return self.levels[:, columns], self.max_levels[:, columns]
+
+    def _iter_rows(
+        self, columns: Optional[Sequence[int]]
+    ) -> Iterator[tuple[Sequence[int], Sequence[int]]]:
+        width = self.width
+        # ``range`` step cannot be used, width is zero if there are no troops
+        for row in range(len(self.tags)):
+            start = row * width
+            levels = self.levels[start : start + width]
+            max_levels = self.max_levels[start : start + width]
+            if columns is None:
+                yield levels, max_levels
+            else:
+                yield [levels[column] for column in columns], [
+                    max_levels[column] for column in columns
+                ]
@@ -6,11 +6,17 @@ from .goldpass import GoldPass
 from .player import Player, PlayerAchievment, PlayerLabel, PlayerLeague, PlayerTroop
 from .clan import (
     Clan,
+    ClanMember,
     ClanWar,
     ClanWarInfo,
     ClanWarInfoClan,
     ClanWarAttack,
     ClanWarLeague,
+    ClanWarLeagueGroup,
+    ClanWarLeagueGroupClan,
+    ClanWarLeagueGroupMember,
+    ClanWarLeagueRound,
+    ClanWarLeagueWar,
     ClanWarPlayer,
     ClanWarResult,
     ClanLabel,
@@ -27,11 +33,17 @@ __all__ = (
     "PlayerLeague",
     "PlayerTroop",
     "Clan",
+    "ClanMember",
     "ClanWar",
     "ClanWarInfo",
     "ClanWarInfoClan",
     "ClanWarAttack",
     "ClanWarLeague",
+    "ClanWarLeagueGroup",
+    "ClanWarLeagueGroupClan",
+    "ClanWarLeagueGroupMember",
+    "ClanWarLeagueRound",
+    "ClanWarLeagueWar",
     "ClanWarPlayer",
     "ClanWarResult",
     "ClanLabel",
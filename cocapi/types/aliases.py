@@ -15,6 +15,8 @@ Tag = str
 starts with #, only digits and capital letters, len = 1-9\n
 regex = r'#[1-9A-Z]{1,9}'
 """
+TagId = int
+"""Tag encoded as integer, see ``utils.encode_tag``"""
 ClanType = Literal["open", "closed", "inviteOnly"]
 ClanRole = Literal["leader", "coLeader", "admin", "member"]
 ClanWarFrequency = Literal[
@@ -28,6 +30,9 @@ ClanWarFrequency = Literal[
 ClanWarPreference = Literal["in", "out"]
 ClanWarActualResult = Literal["win", "lose", "tie"]
 ClanWarState = Literal["warEnded", "notInWar", "preparation", "inWar"]
+ClanWarLeagueGroupState = Literal[
+    "groupNotFound", "notInWar", "preparation", "inWar", "ended"
+]
 Village = Literal["home", "builderBase"]
 LocationName = CaseInsensitiveStr
 CountryCode = CaseInsensitiveStr
@@ -35,3 +40,11 @@ LabelID = PositiveInt
 LabelName = CaseInsensitiveStr
 LeagueID = PositiveInt
 LeagueName = CaseInsensitiveStr
+ClanSection = Literal["currentwar", "warlog"]
+"""Optional sections of ``Clan`` that take additional requests"""
+DecodeMode = Literal["validate", "construct", "raw"]
+"""
+- ``validate`` full pydantic validation (default)\n
+- ``construct`` trusted models without validation, values are taken as is\n
+- ``raw`` plain dicts
+"""
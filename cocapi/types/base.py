@@ -1,6 +1,13 @@
+from typing import Any, Callable, Mapping, Type, TypeVar
+from datetime import datetime
+
 from pydantic import BaseModel
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
+
+from ..utils import parse_datetime, toCamel
 
-from ..utils import toCamel
+Model = TypeVar("Model", bound="DefaultBaseModel")
+Converter = Callable[[Any], Any]
 
 
 class DefaultBaseModel(BaseModel):
@@ -14,3 +21,64 @@ class DefaultBaseModel(BaseModel):
     class Config:
         allow_mutation = False
         alias_generator = toCamel
+
+    @classmethod
+    def construct_trusted(cls: Type[Model], data: Mapping[str, Any]) -> Model:
+        """
+        Build model from trusted data without validation.
+        Unlike ``construct`` nested models are built too and API timestamps are parsed,
+        other values are taken as is (e.g. strings are not lowercased).
+
+        Parameters
+        ----------
+        data : Mapping
+            Data with camelCase keys, like in API responses
+        """
+
+        values = {}
+        fields_set = set()
+        for name, alias, default, convert in _get_plan(cls):
+            value = data.get(alias, default)
+            if alias in data:
+                fields_set.add(name)
+                if convert is not None and value is not None:
+                    value = convert(value)
+            values[name] = value
+
+        # the same as ``construct`` does, but without checking values again
+        model = cls.__new__(cls)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__fields_set__", fields_set)
+        if cls.__private_attributes__:
+            model._init_private_attributes()  # pylint: disable=protected-access
+        return model
+
+
+_plans: dict[type, list[tuple[str, str, Any, Converter | None]]] = {}
+
+
+def _get_plan(model: Type[DefaultBaseModel]):
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = [
+            (name, field.alias, field.get_default(), _get_converter(field))
+            for name, field in model.__fields__.items()
+        ]
+    return plan
+
+
+def _get_converter(field: ModelField) -> Converter | None:
+    type_ = field.type_
+
+    if isinstance(type_, type) and issubclass(type_, DefaultBaseModel):
+        item_converter = type_.construct_trusted  # type: Converter
+    elif type_ is datetime:
+        item_converter = parse_datetime
+    else:
+        return None
+
+    if field.shape == SHAPE_SINGLETON:
+        return item_converter
+    if field.shape == SHAPE_LIST:
+        return lambda items: [item_converter(item) for item in items]
+    return None
@@ -3,15 +3,19 @@ from datetime import datetime
 
 from pydantic import Field, validator
 
+from ..utils import parse_datetime
 from .base import DefaultBaseModel
 from .base_shared import BaseLabel, BaseLeague
 from .badges import BadgeURLs
 from .location import Location
+from .player import PlayerLeague
 from .aliases import (
     Tag,
     CaseInsensitiveStr,
+    ClanRole,
     ClanType,
     ClanWarState,
+    ClanWarLeagueGroupState,
     ClanWarActualResult,
     ClanWarFrequency,
 )
@@ -32,6 +36,20 @@ class ClanChatLanguage(DefaultBaseModel, anystr_lower=True):
     language_code: CaseInsensitiveStr
 
 
+class ClanMember(DefaultBaseModel):
+    tag: Tag
+    name: str
+    role: ClanRole
+    exp_level: int
+    league: Optional[PlayerLeague]
+    trophies: int
+    versus_trophies: Optional[int]
+    clan_rank: int
+    previous_clan_rank: int
+    donations: int
+    donations_received: int
+
+
 class ClanWarAttack(DefaultBaseModel):
     stars: int
     order: int
@@ -50,6 +68,8 @@ class ClanWarPlayer(DefaultBaseModel):
 
 
 class ClanWarInfoClan(DefaultBaseModel):
+    tag: Optional[Tag]
+    name: Optional[str]
     stars: int
     clan_level: int
     attacks: Optional[int]
@@ -68,10 +88,7 @@ class ClanWarInfo(DefaultBaseModel):
 
     @validator("start_time", "end_time", "preparation_start_time", pre=True)
     def parse_datetime(cls: Any, value: Any):  # pylint: disable=no-self-argument
-        if isinstance(value, str):
-            fmt = "%Y%m%dT%H%M%S.%fZ"
-            return datetime.strptime(value, fmt)
-        return value
+        return parse_datetime(value)
 
 
 class ClanWarResult(DefaultBaseModel):
@@ -84,10 +101,37 @@ class ClanWarResult(DefaultBaseModel):
 
     @validator("end_time", pre=True)
     def parse_datetime(cls: Any, value: Any):  # pylint: disable=no-self-argument
-        if isinstance(value, str):
-            fmt = "%Y%m%dT%H%M%S.%fZ"
-            return datetime.strptime(value, fmt)
-        return value
+        return parse_datetime(value)
+
+
+class ClanWarLeagueWar(ClanWarInfo):
+    war_tag: Tag
+    state: ClanWarState
+
+
+class ClanWarLeagueGroupMember(DefaultBaseModel):
+    tag: Tag
+    name: str
+    town_hall_level: int
+
+
+class ClanWarLeagueGroupClan(DefaultBaseModel):
+    tag: Tag
+    name: str
+    clan_level: int
+    badge_urls: BadgeURLs
+    members: List[ClanWarLeagueGroupMember]
+
+
+class ClanWarLeagueRound(DefaultBaseModel):
+    war_tags: List[Tag]
+
+
+class ClanWarLeagueGroup(DefaultBaseModel):
+    state: ClanWarLeagueGroupState
+    season: str
+    clans: List[ClanWarLeagueGroupClan]
+    rounds: List[ClanWarLeagueRound]
 
 
 class ClanWar(
@@ -70,6 +70,38 @@ class ServiceUnavailable(ClientRequestError):
     DETAILS = "Service is temprorarily unavailable because of maintenance"
 
 
+class NoAvailableKeysError(Exception):
+    """
+    Raises when every API key in the pool has been disabled,
+    for example because of invalid credentials or IP address
+    """
+
+    MESSAGE = "All {count} API key(s) are disabled! Check your tokens and allowed IP addresses"
+
+    def __init__(self, count: int):
+        self.count = count
+        self.message = self.MESSAGE.format(count=count)
+
+        super().__init__(self.message)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raises when circuit breaker is open, so the request was not sent,
+    for example because of maintenance
+    """
+
+    MESSAGE = "Circuit is open, requests are not sent! Retry in {retry_in} second(s)"
+
+    def __init__(self, retry_in: float | None = None):
+        self.retry_in = retry_in
+        self.message = self.MESSAGE.format(
+            retry_in="?" if retry_in is None else round(retry_in, 1)
+        )
+
+        super().__init__(self.message)
+
+
 class UnknownDataError(Exception):
     """
     Some data may be wrong, here is the list
@@ -79,6 +111,7 @@ class UnknownDataError(Exception):
     - ``clan league``
     - ``player label``
     - ``player league``
+    - ``tag``
     """
 
     message: str | None
@@ -111,3 +144,7 @@ class UnknownPlayerLabelError(UnknownDataError):
 
 class UnknownPlayerLeagueError(UnknownDataError):
     MESSAGE = "Got an unknown player league '{data}'!"
+
+
+class InvalidTagError(UnknownDataError):
+    MESSAGE = "Got an invalid tag '{data}'!"
@@ -3,6 +3,7 @@ from datetime import datetime
 
 from pydantic import validator
 
+from ..utils import parse_datetime
 from .base import DefaultBaseModel
 
 
@@ -14,7 +15,4 @@ class GoldPass(DefaultBaseModel):
         "start_time", "end_time", "preparation_start_time", pre=True, check_fields=False
     )
     def parse_datetime(cls: Any, value: Any):  # pylint: disable=no-self-argument
-        if isinstance(value, str):
-            fmt = "%Y%m%dT%H%M%S.%fZ"
-            return datetime.strptime(value, fmt)
-        return value
+        return parse_datetime(value)
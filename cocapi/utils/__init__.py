@@ -1,3 +1,27 @@
 from .utils import shape_tag, toCamel
+from .aio import aiterate, bounded_map
+from .dates import DATETIME_FORMAT, parse_datetime, parse_datetimes
+from .tags import (
+    TAG_ALPHABET,
+    decode_tag,
+    encode_tag,
+    is_valid_tag,
+    normalize_tag,
+    to_tag,
+)
 
-__all__ = ("shape_tag", "toCamel")
+__all__ = (
+    "shape_tag",
+    "toCamel",
+    "aiterate",
+    "bounded_map",
+    "DATETIME_FORMAT",
+    "parse_datetime",
+    "parse_datetimes",
+    "TAG_ALPHABET",
+    "decode_tag",
+    "encode_tag",
+    "is_valid_tag",
+    "normalize_tag",
+    "to_tag",
+)
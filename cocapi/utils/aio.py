@@ -0,0 +1,96 @@
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    TypeVar,
+)
+import asyncio
+import collections
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def aiterate(items: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """Iterate over both sync and async iterables"""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def bounded_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T] | AsyncIterable[T],
+    *,
+    concurrency: int,
+    ordered: bool = False,
+) -> AsyncIterator[tuple[T, R | Exception]]:
+    """
+    Apply ``func`` to every item with at most ``concurrency`` calls at once.
+
+    Items are pulled lazily, so memory does not depend on the number of items.
+    Errors are returned as values instead of raising.
+
+    Parameters
+    ----------
+    func : Callable
+        Coroutine function to apply
+    items : Iterable | AsyncIterable
+        Items to process
+    concurrency : int
+        Maximum number of concurrent calls
+    ordered : bool
+        Yield results in input order instead of completion order
+
+    Yields
+    ------
+    tuple
+        Pair of item and either result or raised exception
+    """
+
+    if concurrency < 1:
+        raise ValueError("'concurrency' must be at least 1")
+
+    async def call(item: T) -> tuple[T, Any]:
+        try:
+            return item, await func(item)
+        except Exception as error:  # pylint: disable=broad-except
+            return item, error
+
+    iterator = aiterate(items)
+    exhausted = False
+    pending = (
+        collections.deque()
+    )  # type: collections.deque[asyncio.Task[tuple[T, Any]]]
+
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.append(asyncio.ensure_future(call(item)))
+
+            if not pending:
+                return
+
+            if ordered:
+                yield await pending.popleft()
+                continue
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.remove(task)
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await iterator.aclose()
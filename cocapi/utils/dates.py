@@ -0,0 +1,78 @@
+from typing import Any, Iterable
+from datetime import datetime, timezone
+
+DATETIME_FORMAT = "%Y%m%dT%H%M%S.%fZ"
+"""Format of API timestamps, e.g. ``20230412T083015.000Z``"""
+DATETIME_LENGTH = len("20230412T083015.000Z")
+
+
+def _parse_fixed(value: str) -> datetime:
+    # every API timestamp has the same width, so fields are just slices
+    if (
+        len(value) != DATETIME_LENGTH
+        or value[8] != "T"
+        or value[15] != "."
+        or value[-1] != "Z"
+    ):
+        return datetime.strptime(value, DATETIME_FORMAT).replace(tzinfo=timezone.utc)
+    return datetime(
+        int(value[0:4]),
+        int(value[4:6]),
+        int(value[6:8]),
+        int(value[9:11]),
+        int(value[11:13]),
+        int(value[13:15]),
+        int(value[16:19]) * 1000,
+        timezone.utc,
+    )
+
+
+def _parse_iso(value: str) -> datetime:
+    # ``fromisoformat`` accepts other ISO forms too, they are rejected as before
+    if (
+        len(value) != DATETIME_LENGTH
+        or value[8] != "T"
+        or value[15] != "."
+        or value[-1] != "Z"
+    ):
+        return _parse_fixed(value)
+    return datetime.fromisoformat(value)
+
+
+try:
+    # since python 3.11 ``fromisoformat`` (written in C) understands API timestamps
+    _parse = (
+        _parse_iso
+        if datetime.fromisoformat("20230412T083015.000Z").tzinfo is not None
+        else _parse_fixed
+    )
+except ValueError:
+    _parse = _parse_fixed
+
+
+def parse_datetime(value: Any) -> Any:
+    """
+    Parse API timestamp to timezone-aware UTC datetime,
+    values of other types (e.g. already parsed datetimes) are returned as is.
+
+    Raises
+    ------
+    ``ValueError``
+        If timestamp is malformed
+
+    Examples
+    --------
+    >>> parse_datetime('20230412T083015.000Z')
+    datetime.datetime(2023, 4, 12, 8, 30, 15, tzinfo=datetime.timezone.utc)
+    """
+
+    if isinstance(value, str):
+        return _parse(value)
+    return value
+
+
+def parse_datetimes(values: Iterable[Any]) -> list[Any]:
+    """Parse many API timestamps at once (e.g. end times of war log), see ``parse_datetime``"""
+
+    parse = _parse
+    return [parse(value) if isinstance(value, str) else value for value in values]
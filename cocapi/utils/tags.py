@@ -0,0 +1,77 @@
+from ..types import exceptions
+
+TAG_ALPHABET = "0289PYLQGRJCUV"
+"""Every tag is a base-14 number written with these digits"""
+MAX_TAG_LENGTH = 15
+
+_BASE = len(TAG_ALPHABET)
+_DIGITS = {char: value for value, char in enumerate(TAG_ALPHABET)}
+
+
+def normalize_tag(tag: str) -> str:
+    """
+    Validate tag and bring it to canonical form:
+    ``' #2pp'``, ``'2PP'`` and ``'#2PP'`` are the same tag ``'#2PP'``.
+    Letter ``O`` is treated as zero.
+
+    Raises
+    ------
+    ``InvalidTagError``
+        If tag has characters out of ``TAG_ALPHABET``, leading zeros or is too long
+    """
+
+    value = tag.strip().upper().replace("O", "0").removeprefix("#")
+    if (
+        not value
+        or len(value) > MAX_TAG_LENGTH
+        or (value[0] == "0" and len(value) > 1)
+        or not all(char in _DIGITS for char in value)
+    ):
+        raise exceptions.InvalidTagError(tag)
+    return f"#{value}"
+
+
+def encode_tag(tag: str) -> int:
+    """
+    Convert tag to integer, e.g. to use it as compact key of sets and indexes.
+
+    Examples
+    --------
+    >>> encode_tag('#2PP')
+    256
+    >>> decode_tag(256)
+    '#2PP'
+    """
+
+    number = 0
+    for char in normalize_tag(tag)[1:]:
+        number = number * _BASE + _DIGITS[char]
+    return number
+
+
+def decode_tag(number: int) -> str:
+    """Convert integer back to tag, see ``encode_tag``"""
+
+    if number < 0:
+        raise exceptions.InvalidTagError(number)
+
+    chars = []
+    while True:
+        number, digit = divmod(number, _BASE)
+        chars.append(TAG_ALPHABET[digit])
+        if not number:
+            break
+    return "#" + "".join(reversed(chars))
+
+
+def to_tag(tag: str | int) -> str:
+    """Canonical string tag from string or integer tag"""
+    return decode_tag(tag) if isinstance(tag, int) else normalize_tag(tag)
+
+
+def is_valid_tag(tag: str) -> bool:
+    try:
+        normalize_tag(tag)
+    except exceptions.InvalidTagError:
+        return False
+    return True
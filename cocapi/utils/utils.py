@@ -1,3 +1,6 @@
+from .tags import to_tag
+
+
 def toCamel(string: str, *, lower_first: bool = True):  # pylint: disable=invalid-name
     first, *others = string.split("_")
     if lower_first:
@@ -5,6 +8,15 @@ def toCamel(string: str, *, lower_first: bool = True):  # pylint: disable=invali
     return "".join(word.capitalize() for word in [first, *others])
 
 
-def shape_tag(tag: str):
-    true_tag = tag.upper()
+def shape_tag(tag: str | int):
+    """
+    Validate tag (or decode integer tag) and encode it for URL.
+
+    Raises
+    ------
+    ``InvalidTagError``
+        If tag is malformed, so no request is made
+    """
+
+    true_tag = to_tag(tag)
     return true_tag.replace("#", "%23")
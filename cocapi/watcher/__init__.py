@@ -0,0 +1,31 @@
+from . import events, snapshots
+from .events import (
+    WatchEvent,
+    MemberJoined,
+    MemberLeft,
+    TrophiesChanged,
+    WarStateChanged,
+    WarAttackMade,
+    PollFailed,
+)
+from .snapshots import ClanSnapshot, PlayerSnapshot
+from .schedule import Schedule, FixedSchedule, WarSchedule
+from .watcher import Watcher
+
+__all__ = (
+    "Watcher",
+    "Schedule",
+    "FixedSchedule",
+    "WarSchedule",
+    "WatchEvent",
+    "MemberJoined",
+    "MemberLeft",
+    "TrophiesChanged",
+    "WarStateChanged",
+    "WarAttackMade",
+    "PollFailed",
+    "ClanSnapshot",
+    "PlayerSnapshot",
+    "events",
+    "snapshots",
+)
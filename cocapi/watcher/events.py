@@ -0,0 +1,50 @@
+from typing import Optional
+from dataclasses import dataclass
+
+from ..types import aliases, ClanWarAttack
+
+
+@dataclass(frozen=True)
+class WatchEvent:
+    """Base class of all watcher events"""
+
+    tag: aliases.Tag
+    """Tag of the watched clan or player"""
+
+
+@dataclass(frozen=True)
+class MemberJoined(WatchEvent):
+    member_tag: aliases.Tag
+
+
+@dataclass(frozen=True)
+class MemberLeft(WatchEvent):
+    member_tag: aliases.Tag
+
+
+@dataclass(frozen=True)
+class TrophiesChanged(WatchEvent):
+    old: int
+    new: int
+
+    @property
+    def delta(self):
+        return self.new - self.old
+
+
+@dataclass(frozen=True)
+class WarStateChanged(WatchEvent):
+    old: Optional[aliases.ClanWarState]
+    new: Optional[aliases.ClanWarState]
+
+
+@dataclass(frozen=True)
+class WarAttackMade(WatchEvent):
+    attack: ClanWarAttack
+    own: bool
+    """``True`` if attacker is a member of the watched clan"""
+
+
+@dataclass(frozen=True)
+class PollFailed(WatchEvent):
+    error: Exception
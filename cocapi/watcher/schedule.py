@@ -0,0 +1,117 @@
+from typing import Any, Optional, Protocol
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from ..utils import parse_datetime
+from . import snapshots
+
+
+class Schedule(Protocol):
+    """Decides when watched entity is polled next time"""
+
+    def next_poll(self, snapshot: Any, now: Optional[datetime] = None) -> float:
+        """
+        Parameters
+        ----------
+        snapshot : ClanSnapshot | PlayerSnapshot | None
+            Last known snapshot, ``None`` if entity was never polled successfully
+        now : datetime
+            Current UTC time, used for tests
+
+        Returns
+        -------
+        float
+            Delay in seconds before the next poll
+        """
+
+
+@dataclass
+class FixedSchedule:
+    """Poll every entity every ``interval`` seconds"""
+
+    interval: float = 60.0
+
+    def next_poll(self, snapshot: Any, now: Optional[datetime] = None) -> float:
+        return self.interval
+
+
+@dataclass
+class WarSchedule:
+    """
+    Poll clans according to their war state and war end time.
+
+    - not in war (or war log is private): every ``idle_interval`` seconds
+    - preparation: every ``preparation_interval`` seconds, but not later than war start
+    - in war: ``war_ratio`` of time left until war end,
+      limited by ``min_interval`` and ``max_interval``.
+      Last poll is made ``final_delay`` seconds after war end
+    - war ended: the same as not in war
+
+    Players are polled every ``player_interval`` seconds.
+
+    Fields
+    ------
+    idle_interval : float
+        Poll interval for clans that are not in war
+    preparation_interval : float
+        Poll interval for clans in preparation day
+    war_ratio : float
+        Part of time left until war end to wait before the next poll
+    min_interval : float
+        Minimum poll interval in war
+    max_interval : float
+        Maximum poll interval in war
+    final_delay : float
+        Delay after war end for the final poll
+    player_interval : float
+        Poll interval for players
+    """
+
+    idle_interval: float = 900.0
+    preparation_interval: float = 600.0
+    war_ratio: float = 0.05
+    min_interval: float = 30.0
+    max_interval: float = 300.0
+    final_delay: float = 5.0
+    player_interval: float = 300.0
+
+    def next_poll(self, snapshot: Any, now: Optional[datetime] = None) -> float:
+        if isinstance(snapshot, snapshots.PlayerSnapshot):
+            return self.player_interval
+        if not isinstance(snapshot, snapshots.ClanSnapshot):
+            return self.min_interval
+
+        now = now or datetime.now(timezone.utc)
+
+        match snapshot.war_state:
+            case "preparation":
+                until_start = seconds_until(snapshot.start_time, now)
+                if until_start is None:
+                    return self.preparation_interval
+                return max(
+                    min(self.preparation_interval, until_start), self.final_delay
+                )
+            case "inWar":
+                until_end = seconds_until(snapshot.end_time, now)
+                if until_end is None:
+                    return self.min_interval
+
+                interval = min(
+                    max(until_end * self.war_ratio, self.min_interval),
+                    self.max_interval,
+                )
+                if until_end <= interval:
+                    # final poll right after war end
+                    return max(until_end, 0.0) + self.final_delay
+                return interval
+            case _:
+                return self.idle_interval
+
+
+def seconds_until(value: Optional[str], now: datetime) -> Optional[float]:
+    """Seconds from ``now`` until API timestamp ``value``"""
+
+    if value is None:
+        return None
+
+    return (parse_datetime(value) - now).total_seconds()
@@ -0,0 +1,128 @@
+"""
+Compact snapshots of watched entities and diffs between them.
+Snapshots are built from raw (``decode='raw'``) data, so diffing is cheap
+and only the fields needed for diffs are kept in memory.
+"""
+
+from typing import Any, Iterator, NamedTuple, Optional
+
+from ..types import aliases, ClanWarAttack
+from . import events
+
+
+class ClanSnapshot(NamedTuple):
+    members: frozenset[aliases.Tag]
+    war_state: Optional[aliases.ClanWarState]
+    war_id: Optional[str]
+    """Preparation start time of the current war"""
+    attacks: frozenset[int]
+    """Orders of known attacks in the current war"""
+    start_time: Optional[str] = None
+    """Start time of the current war (API timestamp)"""
+    end_time: Optional[str] = None
+    """End time of the current war (API timestamp)"""
+
+
+class PlayerSnapshot(NamedTuple):
+    trophies: int
+
+
+def iter_war_attacks(war_data: dict[str, Any]) -> Iterator[tuple[dict[str, Any], bool]]:
+    """Iterate over raw attacks of both sides with ``own`` flag"""
+
+    for side, own in (("clan", True), ("opponent", False)):
+        for member in war_data[side].get("members") or ():
+            for attack in member.get("attacks") or ():
+                yield attack, own
+
+
+def snapshot_clan(clan_data: dict[str, Any]) -> ClanSnapshot:
+    war = clan_data["war"]
+    war_data = war.get("warCurrentwar")
+
+    if war_data is None:
+        war_data = {}
+        attacks = frozenset()  # type: frozenset[int]
+    else:
+        attacks = frozenset(attack["order"] for attack, _ in iter_war_attacks(war_data))
+
+    return ClanSnapshot(
+        members=frozenset(clan_data["memberList"]),
+        war_state=war.get("warState"),
+        war_id=war_data.get("preparationStartTime"),
+        attacks=attacks,
+        start_time=war_data.get("startTime"),
+        end_time=war_data.get("endTime"),
+    )
+
+
+def snapshot_player(player_data: dict[str, Any]) -> PlayerSnapshot:
+    return PlayerSnapshot(trophies=player_data["trophies"])
+
+
+def diff_clan(
+    tag: aliases.Tag,
+    old: ClanSnapshot,
+    new: ClanSnapshot,
+    clan_data: dict[str, Any],
+) -> list[events.WatchEvent]:
+    """
+    Compare two snapshots of the same clan.
+
+    Parameters
+    ----------
+    tag : str
+        Clan tag
+    old : ClanSnapshot
+        Previous snapshot
+    new : ClanSnapshot
+        Current snapshot
+    clan_data : dict
+        Raw data the current snapshot was built from, new attacks are taken from it
+
+    Returns
+    -------
+    list[WatchEvent]
+        Events in order: left members, joined members, war state, new attacks
+    """
+
+    changes = []  # type: list[events.WatchEvent]
+
+    if old.members != new.members:
+        changes.extend(
+            events.MemberLeft(tag, member_tag)
+            for member_tag in sorted(old.members - new.members)
+        )
+        changes.extend(
+            events.MemberJoined(tag, member_tag)
+            for member_tag in sorted(new.members - old.members)
+        )
+
+    if old.war_state != new.war_state:
+        changes.append(events.WarStateChanged(tag, old.war_state, new.war_state))
+
+    known_attacks = old.attacks if old.war_id == new.war_id else frozenset()
+    if new.attacks - known_attacks:
+        war_data = clan_data["war"]["warCurrentwar"]
+        new_attacks = [
+            (attack, own)
+            for attack, own in iter_war_attacks(war_data)
+            if attack["order"] not in known_attacks
+        ]
+        new_attacks.sort(key=lambda item: item[0]["order"])
+        changes.extend(
+            events.WarAttackMade(tag, ClanWarAttack.construct_trusted(attack), own)
+            for attack, own in new_attacks
+        )
+
+    return changes
+
+
+def diff_player(
+    tag: aliases.Tag, old: PlayerSnapshot, new: PlayerSnapshot
+) -> list[events.WatchEvent]:
+    """Compare two snapshots of the same player"""
+
+    if old.trophies != new.trophies:
+        return [events.TrophiesChanged(tag, old.trophies, new.trophies)]
+    return []
@@ -0,0 +1,278 @@
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    TypeVar,
+)
+import asyncio
+import collections
+import heapq
+import itertools
+import logging
+import time
+
+from .. import utils
+from ..client import Client
+from ..types import aliases
+from . import events, snapshots
+from .schedule import FixedSchedule, Schedule
+
+logger = logging.getLogger(__name__)
+
+WatchKind = Literal["clan", "player"]
+WatchKey = tuple[WatchKind, aliases.Tag]
+Snapshot = snapshots.ClanSnapshot | snapshots.PlayerSnapshot
+
+Event = TypeVar("Event", bound=events.WatchEvent)
+Handler = Callable[[Event], Awaitable[Any]]
+
+
+class Watcher:
+    """
+    Change detection for clans and players.
+
+    Every watched entity is polled according to ``schedule``
+    (every ``interval`` seconds by default),
+    its last snapshot is compared with the new one and
+    typed events (see ``cocapi.watcher.events``) are dispatched to handlers.
+    The first poll of an entity only stores its snapshot.
+
+    Polls of newly watched entities are spread evenly over ``interval``
+    and at most ``concurrency`` polls run at once,
+    so requests and CPU usage stay steady for any number of watched entities.
+
+    Remarks
+    -------
+    Every clan poll takes 1 or 2 requests (``/clans/{tag}`` and ``/clans/{tag}/currentwar``
+    if war log is public), every player poll takes 1 request.
+
+    Parameters
+    ----------
+    client : Client
+        Client to make requests with, its rate limiter, keys and cache are shared
+    interval : float
+        Seconds between polls of the same entity if ``schedule`` is not passed.
+        First polls of newly watched entities are spread over this interval
+    concurrency : int
+        Maximum number of concurrent polls
+    schedule : Schedule
+        Decides when every entity is polled next time, e.g. ``WarSchedule``
+
+    Examples
+    --------
+    >>> watcher = Watcher(client, concurrency=20, schedule=WarSchedule())
+    >>> watcher.watch_clans(['#2P8QU22L2', '#LQGPL8LL'])
+    >>> @watcher.on(events.MemberJoined)
+    ... async def greet(event):
+    ...     print(event.member_tag, 'joined', event.tag)
+    >>> await watcher.run()
+    """
+
+    client: Client
+    interval: float
+    concurrency: int
+    schedule: Schedule
+
+    _snapshots: dict[WatchKey, Snapshot | None]
+    _due: dict[WatchKey, float]
+    _queue: list[tuple[float, int, WatchKey]]
+    _counter: Iterator[int]
+    _handlers: collections.defaultdict[type, list[Handler]]
+    _wakeup: asyncio.Event
+    _running: bool
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        interval: float = 60.0,
+        concurrency: aliases.PositiveInt = 10,
+        schedule: Optional[Schedule] = None,
+    ):
+        if interval <= 0:
+            raise ValueError("'interval' must be positive")
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be at least 1")
+
+        self.client = client
+        self.interval = interval
+        self.concurrency = concurrency
+        self.schedule = schedule or FixedSchedule(interval)
+
+        self._snapshots = {}
+        self._due = {}
+        self._queue = []
+        self._counter = itertools.count()
+        self._handlers = collections.defaultdict(list)
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    def __contains__(self, key: WatchKey):
+        return key in self._snapshots
+
+    def watch_clans(self, tags: Iterable[aliases.Tag]):
+        """Start watching clans, already watched ones are ignored"""
+        self._watch("clan", tags)
+
+    def watch_players(self, tags: Iterable[aliases.Tag]):
+        """Start watching players, already watched ones are ignored"""
+        self._watch("player", tags)
+
+    def unwatch_clans(self, tags: Iterable[aliases.Tag]):
+        self._unwatch("clan", tags)
+
+    def unwatch_players(self, tags: Iterable[aliases.Tag]):
+        self._unwatch("player", tags)
+
+    def snapshot(self, kind: WatchKind, tag: aliases.Tag) -> Optional[Snapshot]:
+        """Last snapshot of watched entity, ``None`` if it was not polled yet"""
+        return self._snapshots.get((kind, tag))
+
+    def on(self, event_type: type[Event], handler: Optional[Handler] = None):
+        """
+        Register async handler for events of ``event_type`` (and its subclasses).
+        Can be used as decorator.
+
+        Examples
+        --------
+        >>> watcher.on(events.WatchEvent, print_event)  # every event
+
+        >>> @watcher.on(events.TrophiesChanged)
+        ... async def on_trophies(event):
+        ...     print(event.tag, event.delta)
+        """
+
+        def register(handler: Handler) -> Handler:
+            self._handlers[event_type].append(handler)
+            return handler
+
+        if handler is None:
+            return register
+        return register(handler)
+
+    async def poll_once(self) -> list[events.WatchEvent]:
+        """
+        Poll every watched entity once right now.
+
+        Returns
+        -------
+        list[WatchEvent]
+            All dispatched events
+        """
+
+        changes = []  # type: list[events.WatchEvent]
+        async for _, result in utils.bounded_map(
+            self._poll, list(self._snapshots), concurrency=self.concurrency
+        ):
+            changes.extend(result)
+        return changes
+
+    async def run(self):
+        """Poll watched entities until ``Watcher.stop`` is called"""
+
+        self._running = True
+        try:
+            async for _ in utils.bounded_map(
+                self._poll, self._iter_due(), concurrency=self.concurrency
+            ):
+                pass
+        finally:
+            self._running = False
+
+    def stop(self):
+        self._running = False
+        self._wakeup.set()
+
+    def _watch(self, kind: WatchKind, tags: Iterable[aliases.Tag]):
+        keys = [(kind, tag) for tag in tags if (kind, tag) not in self._snapshots]
+        now = time.monotonic()
+        step = self.interval / len(keys) if keys else 0.0
+
+        # new entities are spread over interval to keep the load steady
+        for index, key in enumerate(keys):
+            self._snapshots[key] = None
+            self._schedule(key, now + index * step)
+        self._wakeup.set()
+
+    def _unwatch(self, kind: WatchKind, tags: Iterable[aliases.Tag]):
+        for tag in tags:
+            self._snapshots.pop((kind, tag), None)
+            self._due.pop((kind, tag), None)
+
+    def _schedule(self, key: WatchKey, due: float):
+        # queue entries are not removed, outdated ones are skipped by ``_due``
+        self._due[key] = due
+        heapq.heappush(self._queue, (due, next(self._counter), key))
+
+    def _next_due(self, snapshot: Optional[Snapshot]) -> float:
+        return time.monotonic() + self.schedule.next_poll(snapshot)
+
+    async def _iter_due(self):
+        while self._running:
+            while self._queue and self._due.get(self._queue[0][2]) != self._queue[0][0]:
+                heapq.heappop(self._queue)
+
+            now = time.monotonic()
+            if self._queue and self._queue[0][0] <= now:
+                _, _, key = heapq.heappop(self._queue)
+                del self._due[key]
+                yield key
+                continue
+
+            timeout = self._queue[0][0] - now if self._queue else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, key: WatchKey) -> list[events.WatchEvent]:
+        kind, tag = key
+        changes = []  # type: list[events.WatchEvent]
+
+        try:
+            if kind == "clan":
+                clan_data = await self.client.clan(
+                    tag, include=("currentwar",), decode="raw"
+                )
+                new = snapshots.snapshot_clan(clan_data)  # type: Snapshot
+            else:
+                player_data = await self.client.player(tag, decode="raw")
+                new = snapshots.snapshot_player(player_data)
+        except Exception as error:  # pylint: disable=broad-except
+            new = self._snapshots.get(key)
+            changes.append(events.PollFailed(tag, error))
+        else:
+            if key not in self._snapshots:  # unwatched while polling
+                return changes
+
+            old = self._snapshots[key]
+            self._snapshots[key] = new
+            if isinstance(old, snapshots.ClanSnapshot):
+                changes = snapshots.diff_clan(tag, old, new, clan_data)  # type: ignore
+            elif isinstance(old, snapshots.PlayerSnapshot):
+                changes = snapshots.diff_player(tag, old, new)  # type: ignore
+
+        # rescheduled even if watcher was stopped while polling,
+        # otherwise the entity is never polled after the next ``run``
+        if key in self._snapshots and key not in self._due:
+            self._schedule(key, self._next_due(new))
+
+        for event in changes:
+            await self._dispatch(event)
+        return changes
+
+    async def _dispatch(self, event: events.WatchEvent):
+        for event_type in type(event).__mro__:
+            for handler in self._handlers.get(event_type, ()):
+                try:
+                    await handler(event)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Handler %r failed on %r", handler, event)
@@ -0,0 +1,108 @@
+# type: ignore
+# pylint: disable-all
+
+from types import SimpleNamespace
+import asyncio
+
+import pytest
+
+from cocapi import CircuitBreaker
+from cocapi.types import exceptions
+
+MAINTENANCE = exceptions.ServiceUnavailable(
+    SimpleNamespace(status=503, url="https://api.clashofclans.com/v1", headers={})
+)
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.release(False, MAINTENANCE)
+    assert breaker.state == "open"
+
+
+async def test_opens_at_threshold():
+    breaker = CircuitBreaker(3, 10.0)
+    for _ in range(2):
+        assert await breaker.acquire() is False
+        breaker.release(False, asyncio.TimeoutError())
+    assert breaker.state == "closed"
+
+    # any response but maintenance means the service is up
+    breaker.release(False, exceptions.ResourceNotFound(MAINTENANCE.response))
+    for _ in range(2):
+        breaker.release(False, MAINTENANCE)
+    assert breaker.state == "closed"
+
+    breaker.release(False, MAINTENANCE)
+    assert breaker.state == "open"
+
+
+async def test_fail_fast():
+    breaker = CircuitBreaker(1, 10.0)
+    open_breaker(breaker)
+    with pytest.raises(exceptions.CircuitOpenError) as info:
+        await breaker.acquire()
+    assert 9 < info.value.retry_in <= 10
+
+
+async def test_wait():
+    breaker = CircuitBreaker(1, 0.05, wait=True)
+    open_breaker(breaker)
+    assert await asyncio.wait_for(breaker.acquire(), 1) is True
+    assert breaker.state == "half_open"
+
+
+async def test_single_probe():
+    breaker = CircuitBreaker(1, 0.0, wait=True)
+    open_breaker(breaker)
+    assert await breaker.acquire() is True
+
+    waiters = [asyncio.create_task(breaker.acquire()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    assert not any(waiter.done() for waiter in waiters)
+
+    breaker.release(True)
+    assert breaker.state == "closed"
+    assert await asyncio.gather(*waiters) == [False, False, False]
+
+
+async def test_failed_probe():
+    breaker = CircuitBreaker(1, 0.0)
+    open_breaker(breaker)
+    assert await breaker.acquire() is True
+    with pytest.raises(exceptions.CircuitOpenError):
+        await breaker.acquire()
+
+    breaker.release(True, MAINTENANCE)
+    assert breaker.state == "open"
+
+
+async def test_stale_outcome():
+    breaker = CircuitBreaker(1, 0.0)
+    open_breaker(breaker)
+    assert await breaker.acquire() is True
+
+    # requests sent before the circuit opened do not decide for the probe
+    breaker.release(False)
+    assert breaker.state == "half_open"
+    breaker.release(False, MAINTENANCE)
+    assert breaker.state == "half_open"
+
+    breaker.release(True)
+    assert breaker.state == "closed"
+
+
+async def test_probe_cancelled():
+    breaker = CircuitBreaker(1, 10.0, wait=True)
+    open_breaker(breaker)
+    breaker._opened_at -= 10.0
+    assert await breaker.acquire() is True
+
+    waiter = asyncio.create_task(breaker.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    # another caller sends the probe right away
+    breaker.release(True, asyncio.CancelledError())
+    assert await asyncio.wait_for(waiter, 1) is True
+    assert breaker.state == "half_open"
@@ -0,0 +1,112 @@
+# type: ignore
+# pylint: disable-all
+
+import pytest
+
+from cocapi import Client, ResponseCache
+from cocapi.client import api, cache
+from cocapi.client.cache import get_max_age, make_key
+
+
+async def test_cache(token):
+    client = Client(token, cache=ResponseCache(max_entries=10))
+    clan1 = await client.clan("#LQGPL8LL")
+    clan2 = await client.clan("#LQGPL8LL")
+    await client.close_session()
+
+    assert clan1.tag == clan2.tag
+    assert client.cache.stats.hits > 0
+    assert len(client.cache) > 0
+
+
+def make_response(
+    url="https://api.clashofclans.com/v1/clans/%232PP", size=100, cache_control=None
+):
+    headers = {} if cache_control is None else {"Cache-Control": cache_control}
+    return api.Response(200, url, headers, {}, size)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_ttl(clock):
+    responses = ResponseCache()
+    response = make_response()
+    responses.set("key", response, 60)
+    responses.set("expired", response, 0)
+
+    clock[0] += 59.9
+    assert responses.get("key") is response
+    assert responses.get("expired") is None
+    clock[0] += 0.1
+    assert responses.get("key") is None
+    assert len(responses) == 0 and responses.size == 0
+    assert (responses.stats.hits, responses.stats.misses) == (1, 2)
+
+
+def test_lru_eviction(clock):
+    responses = ResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        responses.set(key, make_response(), 60)
+    responses.get("a")  # "b" is the least recently used now
+    responses.set("c", make_response(), 60)
+
+    assert responses.get("b") is None
+    assert responses.get("a") is not None and responses.get("c") is not None
+    assert responses.stats.evictions == 1
+
+
+def test_max_bytes(clock):
+    responses = ResponseCache(max_bytes=250)
+    for key in ("a", "b"):
+        responses.set(key, make_response(size=100), 60)
+    responses.set("c", make_response(size=100), 60)
+    assert responses.get("a") is None and responses.size == 200
+
+    # bigger than the whole cache, it is not stored at all
+    responses.set("huge", make_response(size=300), 60)
+    assert responses.get("huge") is None and len(responses) == 2
+
+    # replacing an entry does not count its old size
+    responses.set("b", make_response(size=150), 60)
+    assert responses.size == 250 and len(responses) == 2
+
+
+def test_get_max_age():
+    assert get_max_age(make_response(cache_control="public, max-age=120")) == 120
+    assert get_max_age(make_response(cache_control="Max-Age=5")) == 5
+    assert get_max_age(make_response(cache_control="no-store, max-age=120")) == 0
+    assert get_max_age(make_response(cache_control="no-cache, max-age=120")) == 0
+    assert get_max_age(make_response(cache_control="public")) == 0
+    assert get_max_age(make_response()) == 0
+
+
+def test_make_key():
+    request = api.Methods.CLANS()
+    assert make_key(request, {"name": "clan", "limit": None}) == make_key(
+        request, {"name": "clan"}
+    )
+    assert make_key(request, {"limit": 10}) != make_key(request, {"limit": 20})
+
+
+async def test_client_cache(monkeypatch):
+    calls = []
+
+    async def make_request(session, api_method, **kwargs):
+        calls.append(api_method.url)
+        return make_response(api_method.url, cache_control="max-age=60")
+
+    monkeypatch.setattr(api, "make_request", make_request)
+    client = Client("token", cache=ResponseCache())
+    request = api.Methods.CLAN(clantag="%232PP")
+    first = await client.request(request)
+    second = await client.request(request)
+    await client.request(api.Methods.CLAN(clantag="%232PY"))
+    await client.close_session()
+
+    assert first is second
+    assert len(calls) == 2
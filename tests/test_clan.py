@@ -16,3 +16,13 @@ async def test_clan_tag_variety(default_client):
         default_client.clan("#lqGPL8ll"),
     )
     assert clan1.tag == clan2.tag
+
+
+async def test_clan_sections(default_client):
+    clan = await default_client.clan("#LQGPL8LL", include=())
+    assert clan.member_list
+    assert clan.war.log is None
+    assert clan.war.currentwar is None
+
+    clan = await default_client.clan("#LQGPL8LL", exclude=["currentwar"])
+    assert clan.war.state is None
@@ -0,0 +1,11 @@
+# type: ignore
+# pylint: disable-all
+
+
+async def test_clan_members(default_client):
+    members = await default_client.clan_members("#LQGPL8LL")
+    assert len(members) > 0
+    assert all(member.tag.startswith("#") for member in members)
+    assert [member.clan_rank for member in members] == sorted(
+        member.clan_rank for member in members
+    )
@@ -0,0 +1,11 @@
+# type: ignore
+# pylint: disable-all
+
+
+async def test_clan_with_players(default_client):
+    clan, players = await default_client.clan_with_players(
+        "#LQGPL8LL", include=(), ordered=True
+    )
+    results = [result async for result in players]
+    assert [tag for tag, _ in results] == clan.member_list
+    assert all(player.clan == clan.tag for _, player in results)
@@ -0,0 +1,14 @@
+# type: ignore
+# pylint: disable-all
+
+
+async def test_clans_by_tags(default_client):
+    tags = ["#LQGPL8LL", "#lqGPL8ll"]
+    results = [
+        result
+        async for result in default_client.clans_by_tags(
+            tags, concurrency=1, ordered=True
+        )
+    ]
+    assert [tag for tag, _ in results] == tags
+    assert all(clan.tag == "#LQGPL8LL" for _, clan in results)
@@ -0,0 +1,95 @@
+# type: ignore
+# pylint: disable-all
+
+import asyncio
+
+import pytest
+
+from cocapi import Client
+from cocapi.client import api
+from cocapi.client.coalesce import SingleFlight
+
+
+def make_call(release, calls):
+    async def call():
+        calls.append(1)
+        await release.wait()
+        return object()
+
+    return call
+
+
+async def test_single_flight():
+    flight, release, calls = SingleFlight(), asyncio.Event(), []
+    callers = [
+        asyncio.create_task(flight.do("key", make_call(release, calls)))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    assert len(flight) == 1
+
+    release.set()
+    results = await asyncio.gather(*callers)
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert len(flight) == 0
+
+
+async def test_single_flight_cancel():
+    flight, release, calls = SingleFlight(), asyncio.Event(), []
+    callers = [
+        asyncio.create_task(flight.do("key", make_call(release, calls)))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    callers[0].cancel()
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers[1:])
+    assert callers[0].cancelled()
+    assert len(calls) == 1 and results[0] is results[1]
+
+
+async def test_single_flight_error():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError
+
+    results = await asyncio.gather(
+        *(flight.do("key", fail) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    # failed call is not remembered
+    assert len(flight) == 0
+
+
+async def test_catalog_loader(monkeypatch):
+    client = Client("token")
+    release, requests = asyncio.Event(), []
+
+    async def request(api_method, **kwargs):
+        requests.append(api_method)
+        await release.wait()
+        item = {
+            "id": 32000193,
+            "name": "Russia",
+            "isCountry": True,
+            "countryCode": "RU",
+        }
+        return api.Response(200, api_method.url, {}, {"items": [item]}, 0)
+
+    monkeypatch.setattr(client, "request", request)
+    callers = [asyncio.create_task(client.get_location("ru")) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    callers[0].cancel()
+    await asyncio.sleep(0)
+    release.set()
+    locations = await asyncio.gather(*callers[1:])
+    assert len(requests) == 1
+    assert all(location.id == 32000193 for location in locations)
+    assert (await client.get_location("russia")).id == 32000193
+    assert len(requests) == 1
@@ -0,0 +1,87 @@
+# type: ignore
+# pylint: disable-all
+
+from cocapi.compact import Catalog, pack, unpack
+from cocapi.types import ClanWarAttack, Player
+
+
+def player_data(tag, level):
+    return {
+        "tag": tag,
+        "name": "player",
+        "townHallLevel": 14,
+        "builderHallLevel": 9,
+        "expLevel": 200,
+        "trophies": 5000,
+        "bestTrophies": 6000,
+        "warStars": 1500,
+        "attackWins": 100,
+        "defenseWins": 10,
+        "versusTrophies": 4000,
+        "bestVersusTrophies": 5000,
+        "versusBattleWins": 1000,
+        "donations": 1000,
+        "donationsReceived": 1000,
+        "league": {"id": 29000022, "name": "Legend League"},
+        "troops": [
+            {"name": "Barbarian", "level": level, "maxLevel": 11, "village": "home"},
+            {
+                "name": "Super Barbarian",
+                "level": 1,
+                "maxLevel": 1,
+                "village": "home",
+                "superTroopIsActive": True,
+            },
+        ],
+        "heroes": [
+            {"name": "Archer Queen", "level": 300, "maxLevel": 300, "village": "home"}
+        ],
+        "spells": [],
+        "achievements": [
+            {
+                "name": "Bigger Coffers",
+                "stars": 3,
+                "value": 12,
+                "target": 10,
+                "info": "Upgrade a Gold Storage to level 10",
+                "village": "home",
+            }
+        ],
+    }
+
+
+def test_compact_player():
+    catalog = Catalog()
+    first = catalog.player(player_data("#2PP", 10))
+    second = catalog.player(Player(**player_data("#2PY", 11)))
+
+    assert first.troops.schema is second.troops.schema
+    # validated league name is lowercased, so it is not shared with raw one
+    assert first.league is not second.league
+    assert catalog.player(player_data("#2PL", 10)).league is first.league
+    assert first.troops.levels == bytes([10, 1])
+    assert first.heroes.levels == (300,)
+    assert first.to_model() == Player.construct_trusted(player_data("#2PP", 10))
+    assert second.to_model() == Player(**player_data("#2PY", 11))
+    assert second.to_model().troops[1].super_troop_is_active
+
+
+def test_pack():
+    attack = ClanWarAttack(
+        stars=3,
+        order=1,
+        duration=150,
+        attackerTag="#2PP",
+        defenderTag="#2PY",
+        destructionPercentage=100,
+    )
+    assert pack(attack) == (3, 1, 150, "#2PP", "#2PY", 100.0)
+    assert unpack(ClanWarAttack, pack(attack)) == attack
+
+
+async def test_compact_live(default_client):
+    catalog = Catalog()
+    player = await default_client.player("#LJJOUY2U8")
+    clan = await default_client.clan("#LQGPL8LL")
+    assert catalog.player(player).to_model() == player
+    assert catalog.clan(clan).to_model() == clan
@@ -0,0 +1,85 @@
+# type: ignore
+# pylint: disable-all
+
+from aiohttp import web
+
+from cocapi import Client, ConnectionConfig
+from cocapi.client import api
+
+
+async def test_make_connector():
+    config = ConnectionConfig(
+        limit=7, limit_per_host=3, keepalive_timeout=5.0, use_dns_cache=False, timeout=2
+    )
+    connector = config.make_connector()
+    try:
+        assert (connector.limit, connector.limit_per_host) == (7, 3)
+        assert connector.use_dns_cache is False
+        assert connector._keepalive_timeout == 5.0
+    finally:
+        await connector.close()
+
+    assert config.make_timeout().total == 2
+    assert ConnectionConfig().make_timeout() is None
+
+
+async def test_shared_connector():
+    connector = ConnectionConfig().make_connector()
+    first, second = Client("token", connector=connector), Client(
+        "token", connector=connector
+    )
+    first_session, second_session = (
+        await first.get_session(),
+        await second.get_session(),
+    )
+    assert first_session.connector is second_session.connector is connector
+
+    await first.close_session()
+    assert first_session.closed and not connector.closed
+    assert not second_session.closed
+
+    await second.close_session()
+    assert not connector.closed
+    await connector.close()
+
+    # own connector is closed with the session
+    own = Client("token")
+    session = await own.get_session()
+    await own.close_session()
+    assert session.connector is None or session.connector.closed
+
+
+async def test_warmup(monkeypatch):
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers.get("authorization"))
+        return web.Response(text="{}")
+
+    app = web.Application()
+    app.router.add_get("/v1", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    (port,) = {sock.getsockname()[1] for sock in site._server.sockets}
+
+    try:
+        monkeypatch.setattr(
+            api.Methods.Method, "base_url", f"http://127.0.0.1:{port}/v1"
+        )
+        client = Client("token")
+        await client.warmup(3)
+        await client.close_session()
+    finally:
+        await runner.cleanup()
+
+    # warmup requests are not authorized
+    assert requests == [None, None, None]
+
+
+async def test_warmup_unreachable(monkeypatch):
+    monkeypatch.setattr(api.Methods.Method, "base_url", "http://127.0.0.1:9/v1")
+    client = Client("token")
+    await client.warmup(2)  # connection errors are ignored
+    await client.close_session()
@@ -0,0 +1,48 @@
+# type: ignore
+# pylint: disable-all
+
+from datetime import datetime, timezone
+
+import pytest
+
+from cocapi import utils
+from cocapi.types import ClanWarResult
+from cocapi.utils import dates
+
+
+def test_parse_datetime():
+    expected = datetime(2023, 4, 12, 8, 30, 15, 123000, tzinfo=timezone.utc)
+    assert utils.parse_datetime("20230412T083015.123Z") == expected
+    assert dates._parse_fixed("20230412T083015.123Z") == expected
+    assert utils.parse_datetime(expected) is expected
+    assert utils.parse_datetimes(["20230412T083015.123Z", None]) == [expected, None]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "2023",
+        "20230412T083015.123",
+        "20231312T083015.000Z",
+        "2023-04-12T08:30:15Z",  # other ISO forms have the same length
+        "20230412 083015.000Z",
+    ],
+)
+def test_invalid_datetime(value):
+    with pytest.raises(ValueError):
+        utils.parse_datetime(value)
+
+
+def test_war_result_datetime():
+    data = {
+        "endTime": "20230412T083015.000Z",
+        "teamSize": 5,
+        "attacksPerMember": 2,
+        "clan": {"stars": 1, "clanLevel": 5, "destructionPercentage": 10.0},
+        "opponent": {"stars": 2, "clanLevel": 6, "destructionPercentage": 20.0},
+    }
+    validated = ClanWarResult(**data)
+    constructed = ClanWarResult.construct_trusted(data)
+    assert validated.end_time == constructed.end_time
+    assert validated.end_time.tzinfo is timezone.utc
@@ -0,0 +1,48 @@
+# type: ignore
+# pylint: disable-all
+
+from types import SimpleNamespace
+
+from cocapi.discovery import ClanDiscovery, SearchPartition
+from cocapi.types import exceptions
+
+
+async def test_discovery(default_client):
+    discovery = ClanDiscovery(default_client, cap=10, concurrency=5)
+    root = SearchPartition(min_members=40, war_frequency="always")
+    tags = [
+        tag async for page in discovery.run(location="ru", root=root) for tag in page
+    ]
+
+    assert len(tags) == len(set(tags)) == discovery.stats.clans
+    assert discovery.stats.requests >= 1 and not discovery.stats.failed
+
+
+def test_split():
+    discovery = ClanDiscovery(None)
+    low, high = discovery.split(SearchPartition())
+    assert (low.min_members, low.max_members) == (1, 25)
+    assert (high.min_members, high.max_members) == (26, 50)
+
+    single = SearchPartition(min_members=10, max_members=10)
+    assert len(list(discovery.split(single))) == 6  # war frequencies
+
+
+class FakeClient:
+    async def clans(self, *, name, location, limit, min_members, max_members, **_):
+        if min_members is None and max_members is None:
+            return ["#2PP", "#2PY"]  # capped
+        if max_members is not None:
+            raise exceptions.ServiceUnavailable(
+                SimpleNamespace(status=503, url="", headers={})
+            )
+        return ["#2PL"]
+
+
+async def test_discovery_failed_search():
+    discovery = ClanDiscovery(FakeClient(), cap=2)
+    pages = [page async for page in discovery.run()]
+
+    assert pages == [["#2PP", "#2PY"], ["#2PL"]]
+    assert discovery.stats.requests == 3 and discovery.stats.clans == 3
+    assert discovery.stats.failed == [SearchPartition(max_members=25)]
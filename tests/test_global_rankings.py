@@ -0,0 +1,53 @@
+# type: ignore
+# pylint: disable-all
+
+import pytest
+
+from cocapi.rankings import Leaderboard, RankingSnapshot
+
+
+async def test_global_rankings(default_client):
+    leaderboard = await default_client.global_rankings(
+        locations=["ru", "us", "de"], limit=20
+    )
+    assert len(leaderboard) == 3 and not leaderboard.errors
+
+    top = list(leaderboard.top(30))
+    assert len(top) == 30
+    assert len({entry.tag for entry in top}) == 30
+    assert [entry.score for entry in top] == sorted(
+        (entry.score for entry in top), reverse=True
+    )
+
+
+def make_snapshot(location_id, tags_scores, kind="players"):
+    items = [
+        {"tag": tag, "name": tag, "rank": rank, "trophies": score, "expLevel": 100}
+        for rank, (tag, score) in enumerate(tags_scores, 1)
+    ]
+    return RankingSnapshot.from_items(kind, location_id, items)
+
+
+def test_leaderboard_top():
+    leaderboard = Leaderboard("players")
+    leaderboard.add(make_snapshot(1, [("#2PP", 5000), ("#2PY", 4800), ("#2PL", 4000)]))
+    leaderboard.add(make_snapshot(2, [("#2PY", 4900), ("#2PQ", 4500)]))
+    leaderboard.add(make_snapshot(3, [("#2PP", 5000), ("#2PR", 3000)]))
+
+    top = list(leaderboard.top())
+    assert [(entry.tag, entry.score) for entry in top] == [
+        ("#2PP", 5000),
+        ("#2PY", 4900),  # the best score of both locations
+        ("#2PQ", 4500),
+        ("#2PL", 4000),
+        ("#2PR", 3000),
+    ]
+    assert [entry.location_id for entry in top] == [1, 2, 2, 1, 3]
+    assert [entry.tag for entry in leaderboard.top(2)] == ["#2PP", "#2PY"]
+
+    # snapshot of the same location replaces the old one
+    leaderboard.add(make_snapshot(2, [("#2PQ", 4600)]))
+    assert [entry.score for entry in leaderboard.top(3)] == [5000, 4800, 4600]
+
+    with pytest.raises(ValueError):
+        leaderboard.add(make_snapshot(4, [], kind="clans"))
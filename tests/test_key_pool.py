@@ -0,0 +1,114 @@
+# type: ignore
+# pylint: disable-all
+
+from types import SimpleNamespace
+import asyncio
+import collections
+import time
+
+import pytest
+
+from cocapi import Client, KeyPool
+from cocapi.client import api
+from cocapi.client.keys import is_credentials_error
+from cocapi.types import exceptions
+
+URL = "https://api.clashofclans.com/v1/players/%232PP"
+INVALID_IP = {
+    "reason": "accessDenied.invalidIp",
+    "message": "Invalid authorization: API key does not allow access from IP 1.2.3.4",
+}
+PRIVATE_WAR_LOG = {"reason": "accessDenied", "message": "Access denied"}
+
+
+def make_error(error_type, status, headers=None, data=None):
+    response = SimpleNamespace(status=status, url=URL, headers=headers or {})
+    return error_type(response, data=data)
+
+
+async def test_key_pool(token):
+    client = Client(KeyPool([token], limit=5), coalesce=False)
+    players = await asyncio.gather(*(client.player("#LJJOUY2U8") for _ in range(10)))
+    await client.close_session()
+
+    assert all(player.name == "bone_appettit" for player in players)
+    assert not any(key.disabled for key in client.keys.keys)
+
+
+def test_duplicate_tokens():
+    assert len(KeyPool(["a", "b", "a"])) == 2
+    with pytest.raises(ValueError):
+        KeyPool([])
+
+
+async def test_balance():
+    pool = KeyPool(["a", "b", "c"], limit=4)
+    used = collections.Counter([(await pool.acquire()).token for _ in range(12)])
+    assert used == {"a": 4, "b": 4, "c": 4}
+
+    # every key has spent its budget, the next one waits for a new window
+    start = time.monotonic()
+    await pool.acquire()
+    assert 0.5 < time.monotonic() - start < 1.5
+
+
+async def test_bench_throttled():
+    pool = KeyPool(["a", "b"], throttle_bench_time=0.2)
+    a, b = pool.keys
+    pool.report(a, make_error(exceptions.TooManyRequests, 429))
+    assert [(await pool.acquire()).token for _ in range(3)] == ["b", "b", "b"]
+
+    pool.report(b, make_error(exceptions.TooManyRequests, 429, {"Retry-After": "0.1"}))
+    start = time.monotonic()
+    assert (await pool.acquire()).token == "b"
+    assert 0.05 < time.monotonic() - start < 0.15
+    assert not a.is_available()
+
+
+async def test_disable_invalid_credentials():
+    pool = KeyPool(["a", "b"])
+    a, b = pool.keys
+
+    pool.report(a, make_error(exceptions.AccessDenied, 403, data=PRIVATE_WAR_LOG))
+    assert not a.disabled
+    pool.report(a, make_error(exceptions.AccessDenied, 403, data=INVALID_IP))
+    assert a.disabled
+    assert {(await pool.acquire()).token for _ in range(3)} == {"b"}
+
+    pool.report(b, make_error(exceptions.AccessDenied, 403, data=INVALID_IP))
+    with pytest.raises(exceptions.NoAvailableKeysError) as info:
+        await pool.acquire()
+    assert info.value.count == 2
+
+
+def test_is_credentials_error():
+    def is_broken(data):
+        return is_credentials_error(make_error(exceptions.AccessDenied, 403, data=data))
+
+    assert is_broken(INVALID_IP)
+    assert is_broken({"reason": "accessDenied", "message": "Invalid authorization"})
+    assert not is_broken(PRIVATE_WAR_LOG)
+    assert not is_broken(None)
+    assert not is_broken("<html>Forbidden</html>")
+
+
+async def test_client_disables_key(monkeypatch):
+    async def make_request(session, api_method, *, decoder, headers, **kwargs):
+        if headers["authorization"] == "Bearer bad":
+            raise make_error(exceptions.AccessDenied, 403, data=INVALID_IP)
+        return api.Response(200, URL, {}, {"tag": "#2PP"}, 0)
+
+    monkeypatch.setattr(api, "make_request", make_request)
+    client = Client(["bad", "good"], coalesce=False)
+    request = api.Methods.PLAYER(playertag="%232PP")
+
+    responses = []
+    for _ in range(3):
+        try:
+            responses.append(await client.request(request))
+        except exceptions.AccessDenied:
+            pass
+    await client.close_session()
+
+    assert len(responses) >= 2
+    assert [key.disabled for key in client.keys.keys] == [True, False]
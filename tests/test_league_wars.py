@@ -0,0 +1,42 @@
+# type: ignore
+# pylint: disable-all
+
+from cocapi import Client, exceptions
+from cocapi.client import api
+from cocapi.types import ClanWarLeagueGroup
+
+
+async def test_league_wars(default_client):
+    groups, wars = await default_client.league_wars(["#LQGPL8LL"], ordered=True)
+    group = groups["#LQGPL8LL"]
+    if isinstance(group, exceptions.ResourceNotFound):  # clan is not in league now
+        return
+
+    assert isinstance(group, ClanWarLeagueGroup)
+    war_tags = [
+        war_tag
+        for league_round in group.rounds
+        for war_tag in league_round.war_tags
+        if war_tag != "#0"
+    ]
+    results = [result async for result in wars]
+    assert [war_tag for war_tag, _ in results] == war_tags
+    assert all(war.war_tag == war_tag for war_tag, war in results)
+
+
+async def test_league_wars_dedup(monkeypatch):
+    requests = []
+
+    async def request(api_method, **kwargs):
+        requests.append(api_method.url)
+        group = {"clans": [{"tag": "#2PP"}, {"tag": "#2P0"}], "rounds": []}
+        return api.Response(200, api_method.url, {}, group, 0)
+
+    client = Client("token")
+    monkeypatch.setattr(client, "request", request)
+    groups, _ = await client.league_wars(
+        ["2pp", "#2pO", "#2P0"], concurrency=1, decode="raw"
+    )
+
+    assert len(requests) == 1
+    assert groups["2pp"] is groups["#2pO"] is groups["#2P0"]
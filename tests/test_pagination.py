@@ -0,0 +1,29 @@
+# type: ignore
+# pylint: disable-all
+
+
+async def test_iter_clans(default_client):
+    pages = [
+        page
+        async for page in default_client.iter_clans(
+            location="ru", min_members=30, page_size=10
+        )
+    ]
+    assert len(pages) > 1
+    assert all(0 < len(page) <= 10 for page in pages)
+
+
+async def test_iter_player_rankings(default_client):
+    tags = [
+        tag
+        async for page in default_client.iter_player_rankings("ru", page_size=50)
+        for tag in page
+    ]
+    assert tags == await default_client.player_rankings("ru")
+
+
+async def test_iter_clan_rankings(default_client):
+    pages = [
+        page async for page in default_client.iter_clan_rankings("ru", page_size=20)
+    ]
+    assert len(pages) > 1
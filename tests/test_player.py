@@ -15,3 +15,13 @@ async def test_player_tag_variety(default_client):
         default_client.player("#ljjOUY2u8"),
     )
     assert player1.name == player2.name
+
+
+async def test_player_decode_modes(default_client):
+    validated, constructed, raw = await asyncio.gather(
+        default_client.player("#LJJOUY2U8"),
+        default_client.player("#LJJOUY2U8", decode="construct"),
+        default_client.player("#LJJOUY2U8", decode="raw"),
+    )
+    assert validated.name == constructed.name == raw["name"]
+    assert validated.troops[0].name == constructed.troops[0].name
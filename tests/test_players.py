@@ -0,0 +1,20 @@
+# type: ignore
+# pylint: disable-all
+
+from cocapi import exceptions
+
+
+async def test_players(default_client):
+    tags = ["#LJJOUY2U8", "#ljjOUY2u8"]
+    results = [result async for result in default_client.players(tags, ordered=True)]
+    assert [tag for tag, _ in results] == tags
+    assert all(player.name == "bone_appettit" for _, player in results)
+
+
+async def test_players_partial_failure(default_client):
+    results = {
+        tag: player
+        async for tag, player in default_client.players(["#LJJOUY2U8", "#0"])
+    }
+    assert results["#LJJOUY2U8"].name == "bone_appettit"
+    assert isinstance(results["#0"], exceptions.ClientRequestError)
@@ -0,0 +1,62 @@
+# type: ignore
+# pylint: disable-all
+
+import pytest
+
+from cocapi.rankings import RankingSnapshot
+from cocapi.rankings import snapshot as snapshot_module
+
+
+async def test_rankings_snapshot(default_client):
+    snapshot = await default_client.rankings_snapshot("ru", limit=20)
+    assert len(snapshot) == 20
+    assert list(snapshot.rank) == list(range(1, 21))
+    assert list(snapshot.score) == sorted(snapshot.score, reverse=True)
+
+    diff = snapshot.diff(snapshot)
+    assert not any(diff.rank_delta) and not diff.left
+
+
+async def test_clan_rankings_snapshot(default_client):
+    snapshot = await default_client.rankings_snapshot("ru", "clans", limit=5)
+    assert snapshot.kind == "clans"
+    assert all(clan_tag is None for clan_tag in snapshot.clan_tags)
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(snapshot_module, "numpy", None)
+    return request.param
+
+
+def make_snapshot(tags_scores):
+    items = [
+        {"tag": tag, "name": tag, "rank": rank, "trophies": score, "expLevel": 100}
+        for rank, (tag, score) in enumerate(tags_scores, 1)
+    ]
+    return RankingSnapshot.from_items("players", 32000193, items)
+
+
+def test_diff(backend):
+    old = make_snapshot([("#2PP", 5000), ("#2PY", 4900), ("#2PL", 4800)])
+    new = make_snapshot([("#2PY", 5100), ("#2PP", 5000), ("#2PQ", 4700)])
+    diff = new.diff(old)
+    assert list(diff.rank_delta) == [1, -1, 0]
+    assert list(diff.score_delta) == [200, 0, 0]
+    assert list(diff.is_new) == [False, False, True]
+    assert diff.left == ["#2PL"]
+
+
+def test_diff_empty(backend):
+    empty = make_snapshot([])
+    new = make_snapshot([("#2PP", 5000)])
+
+    diff = new.diff(empty)
+    assert list(diff.rank_delta) == [0] and list(diff.score_delta) == [0]
+    assert list(diff.is_new) == [True]
+
+    diff = empty.diff(new)
+    assert len(diff.rank_delta) == 0 and diff.left == ["#2PP"]
@@ -0,0 +1,18 @@
+# type: ignore
+# pylint: disable-all
+
+import asyncio
+
+from cocapi import Client, RateLimiter
+
+
+async def test_rate_limiter(token):
+    # identical concurrent requests are coalesced by default
+    client = Client(token, rate_limiter=RateLimiter(5, burst=2), coalesce=False)
+    players = await asyncio.gather(*(client.player("#LJJOUY2U8") for _ in range(6)))
+    await client.close_session()
+
+    assert len(players) == 6
+    assert client.rate_limiter.stats.requests == 6
+    assert client.rate_limiter.stats.delayed >= 4
+    assert client.rate_limiter.stats.max_wait > 0
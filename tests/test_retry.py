@@ -0,0 +1,83 @@
+# type: ignore
+# pylint: disable-all
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+import time
+
+import pytest
+
+from cocapi import Client, RetryPolicy
+from cocapi.client import api
+from cocapi.client.retry import parse_retry_after
+from cocapi.types import exceptions
+
+GET = api.Methods.PLAYER(playertag="%232PP")
+POST = api.ServiceMethods.LOGIN()
+
+
+def make_error(error_type=exceptions.TooManyRequests, status=429, retry_after=None):
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return error_type(SimpleNamespace(status=status, url=GET.url, headers=headers))
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after("soon") is None
+
+    moment = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(moment, usegmt=True)) <= 30
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_get_delay():
+    policy = RetryPolicy(max_attempts=3, backoff_base=0.5, backoff_cap=10)
+    error = make_error()
+
+    for attempt in range(2):
+        assert 0 <= policy.get_delay(GET, error, attempt) <= 0.5 * 2**attempt
+    # attempts are exhausted
+    assert policy.get_delay(GET, error, 2) is None
+    # not idempotent request
+    assert policy.get_delay(POST, error, 0) is None
+    # not retryable status
+    assert (
+        policy.get_delay(GET, make_error(exceptions.ResourceNotFound, 404), 0) is None
+    )
+
+
+def test_get_delay_retry_after():
+    policy = RetryPolicy(backoff_cap=10)
+    assert policy.get_delay(GET, make_error(retry_after="2"), 0) == 2.0
+    # too long to wait
+    assert policy.get_delay(GET, make_error(retry_after="60"), 0) is None
+
+    moment = datetime.now(timezone.utc) + timedelta(seconds=5)
+    delay = policy.get_delay(
+        GET, make_error(retry_after=format_datetime(moment, usegmt=True)), 0
+    )
+    assert 0 < delay <= 5
+
+
+async def test_retry_after_benches_key(monkeypatch):
+    client = Client("token", retry_policy=RetryPolicy(max_attempts=3))
+    calls = []
+
+    async def make_request(session, api_method, **kwargs):
+        calls.append(time.monotonic())
+        raise make_error(retry_after="0.05")
+
+    monkeypatch.setattr(api, "make_request", make_request)
+    started_at = time.monotonic()
+    with pytest.raises(exceptions.TooManyRequests):
+        await client.player("#2PP")
+    await client.close_session()
+
+    assert len(calls) == 3
+    # key is benched for Retry-After, not for ``throttle_bench_time``
+    assert time.monotonic() - started_at < 1
@@ -0,0 +1,85 @@
+# type: ignore
+# pylint: disable-all
+
+import pytest
+
+from cocapi.roster import RosterMatrix, TroopIndex
+from cocapi.roster import matrix as matrix_module
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(matrix_module, "numpy", None)
+    return request.param
+
+
+def troop(name, level, max_level, village="home"):
+    return {"name": name, "level": level, "maxLevel": max_level, "village": village}
+
+
+PLAYERS = [
+    {
+        "tag": "#2PP",
+        "troops": [troop("Barbarian", 10, 10), troop("Archer", 5, 10)],
+        "heroes": [troop("Barbarian King", 79, 80), troop("Archer Queen", 80, 80)],
+        "spells": [],
+    },
+    {
+        "tag": "#2PY",
+        "troops": [troop("Barbarian", 1, 10)],
+        "heroes": [troop("Barbarian King", 50, 80)],
+        "spells": [troop("Rage Spell", 1, 6)],
+    },
+]
+
+
+def test_roster_matrix(backend):
+    matrix = RosterMatrix.from_players(PLAYERS)
+    heroes = matrix.columns(kind="heroes")
+    assert [matrix.index.keys[column].name for column in heroes] == [
+        "Barbarian King",
+        "Archer Queen",
+    ]
+    assert list(matrix.gap()) == [6, 44]
+    assert list(matrix.gap(heroes)) == [1, 30]
+    assert list(matrix.rush_score()) == pytest.approx([6 / 180, 44 / 96])
+    # the second player has no Archer Queen
+    assert matrix.select(matrix.within_max(2, heroes)) == ["#2PP"]
+    assert matrix.select(
+        matrix.within_max(30, matrix.columns(names=["Barbarian King"]))
+    ) == [
+        "#2PP",
+        "#2PY",
+    ]
+
+    # no troops at all
+    for matrix in (
+        RosterMatrix.from_players([]),
+        RosterMatrix.from_players([{"tag": "#2PP"}, {"tag": "#2PY"}]),
+    ):
+        assert matrix.width == 0
+        assert list(matrix.gap()) == [0] * len(matrix)
+        assert list(matrix.rush_score()) == [0.0] * len(matrix)
+        assert matrix.select(matrix.within_max(0)) == matrix.tags
+
+
+def test_troop_index_is_stable(backend):
+    index = TroopIndex()
+    first = RosterMatrix.from_players(PLAYERS[1:], index)
+    second = RosterMatrix.from_players(PLAYERS, index)
+    assert first.width == 3 and second.width == 5
+    assert index.get(("heroes", "Barbarian King", "home")) == 1
+    assert first.columns(kind="heroes") == [1]
+    assert list(second.gap(second.columns(names=["Barbarian"]))) == [0, 9]
+
+
+async def test_roster_matrix_live(default_client):
+    player = await default_client.player("#LJJOUY2U8")
+    matrix = RosterMatrix.from_players([player])
+    assert matrix.tags == [player.tag]
+    assert len(matrix.index) == len(player.troops) + len(player.heroes) + len(
+        player.spells
+    )
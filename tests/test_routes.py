@@ -0,0 +1,44 @@
+# type: ignore
+# pylint: disable-all
+
+import dataclasses
+
+import pytest
+
+from cocapi.client import api
+
+BASE_URL = "https://api.clashofclans.com/v1"
+
+
+def test_route_is_not_changed():
+    first = api.Methods.CLAN(clantag="%232PP")
+    second = api.Methods.CLAN(clantag="%232PY")
+
+    assert first.url == BASE_URL + "/clans/%232PP"
+    assert second.url == BASE_URL + "/clans/%232PY"
+    assert first.method == second.method == "GET"
+    assert first.path == second.path == "/clans/{clantag}"
+    assert api.Methods.CLAN.url == BASE_URL + "/clans/{clantag}"
+    assert api.Methods.CLAN.fields == ("clantag",)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        api.Methods.CLAN.url = first.url
+
+
+def test_static_route():
+    assert api.Methods.GOLDPASS() is api.Methods.GOLDPASS()
+    assert api.Methods.GOLDPASS().url == api.Methods.GOLDPASS.url
+
+
+def test_missing_field():
+    with pytest.raises(KeyError, match="clantag"):
+        api.Methods.CLAN(playertag="%232PP")
+
+
+def test_route_fields():
+    request = api.Methods.LEAGUE_SEASONS_RANKINGS(
+        league_id=29000022, season_id="2022-04"
+    )
+    assert request.url == BASE_URL + "/leagues/29000022/seasons/2022-04"
+    assert isinstance(request, api.Request)
+    assert api.Methods.LEAGUE_SEASONS_RANKINGS.fields == ("league_id", "season_id")
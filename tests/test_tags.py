@@ -0,0 +1,33 @@
+# type: ignore
+# pylint: disable-all
+
+import pytest
+
+from cocapi import utils
+from cocapi.types import exceptions
+
+
+def test_tag_codec():
+    assert utils.normalize_tag(" #2pp") == "#2PP"
+    assert utils.normalize_tag("LJJOUY2U8") == "#LJJ0UY2U8"
+    assert utils.encode_tag("#2PP") == 256
+    assert utils.decode_tag(256) == "#2PP"
+    for tag in ("#0", "#2", "#LJJ0UY2U8", "#VVVVVVVVVVVVVVV"):
+        assert utils.decode_tag(utils.encode_tag(tag)) == tag
+
+
+@pytest.mark.parametrize("tag", ["", "#", "#ABC", "#02PP", "#2PP!", "#" + "2" * 16])
+def test_invalid_tag(tag):
+    assert not utils.is_valid_tag(tag)
+    with pytest.raises(exceptions.InvalidTagError):
+        utils.encode_tag(tag)
+
+
+async def test_invalid_tag_request(default_client):
+    with pytest.raises(exceptions.InvalidTagError):
+        await default_client.player("#ABC")
+
+
+async def test_player_by_tag_id(default_client):
+    player = await default_client.player(utils.encode_tag("#LJJOUY2U8"))
+    assert player.name == "bone_appettit"
@@ -0,0 +1,83 @@
+# type: ignore
+# pylint: disable-all
+
+from datetime import datetime, timezone
+import asyncio
+import collections
+
+from cocapi import Watcher, watcher
+
+
+async def test_watcher(default_client):
+    w = Watcher(default_client)
+    w.watch_clans(["#LQGPL8LL"])
+    w.watch_players(["#LJJOUY2U8"])
+
+    received = []
+
+    @w.on(watcher.WatchEvent)
+    async def collect(event):
+        received.append(event)
+
+    assert await w.poll_once() == []  # first poll only stores snapshots
+    assert isinstance(w.snapshot("clan", "#LQGPL8LL"), watcher.ClanSnapshot)
+    assert isinstance(w.snapshot("player", "#LJJOUY2U8"), watcher.PlayerSnapshot)
+
+    changes = await w.poll_once()
+    assert changes == received
+    assert not any(isinstance(event, watcher.PollFailed) for event in changes)
+
+
+def test_diff_clan():
+    old = watcher.ClanSnapshot(frozenset({"#A", "#B"}), "preparation", "1", frozenset())
+    new = watcher.ClanSnapshot(frozenset({"#B", "#C"}), "inWar", "1", frozenset())
+    changes = watcher.snapshots.diff_clan("#CLAN", old, new, {})
+    assert changes == [
+        watcher.MemberLeft("#CLAN", "#A"),
+        watcher.MemberJoined("#CLAN", "#C"),
+        watcher.WarStateChanged("#CLAN", "preparation", "inWar"),
+    ]
+
+
+def test_war_schedule():
+    now = datetime(2022, 4, 16, 8, 0, tzinfo=timezone.utc)
+    schedule = watcher.WarSchedule()
+    snapshot = watcher.ClanSnapshot(frozenset(), "notInWar", None, frozenset())
+    assert schedule.next_poll(snapshot, now) == schedule.idle_interval
+
+    in_war = snapshot._replace(war_state="inWar", end_time="20220417T080000.000Z")
+    assert schedule.next_poll(in_war, now) == schedule.max_interval
+
+    ending = in_war._replace(end_time="20220416T080010.000Z")
+    assert schedule.next_poll(ending, now) == 10 + schedule.final_delay
+
+
+class FakeClient:
+    def __init__(self):
+        self.polls = collections.Counter()
+        self.started = asyncio.Event()
+
+    async def player(self, tag, decode=None):
+        self.polls[tag] += 1
+        self.started.set()
+        await asyncio.sleep(0.02)
+        return {"trophies": 5000}
+
+
+async def test_watcher_restart():
+    client = FakeClient()
+    w = Watcher(client, interval=0.05)
+    w.watch_players(["#2PP", "#2PY"])
+
+    # stop while the first player is being polled
+    run = asyncio.create_task(w.run())
+    await client.started.wait()
+    w.stop()
+    await run
+
+    client.polls.clear()
+    run = asyncio.create_task(w.run())
+    await asyncio.sleep(0.3)
+    w.stop()
+    await run
+    assert client.polls["#2PP"] >= 2 and client.polls["#2PY"] >= 2